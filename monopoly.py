@@ -1,13 +1,345 @@
-import mysql.connector
+# Imports limités au cœur du moteur : le pilote MySQL, json, tracemalloc et
+# concurrent.futures sont importés à la demande (démarrage rapide des processus)
+import math
+import os
 import random
-from typing import List, Optional, Dict
+import struct
+import sys
+import time
+import weakref
+from array import array
+from typing import List, Optional, Dict, NamedTuple, Tuple
+
+# =============================================================================
+# JOURNAL D'ÉVÉNEMENTS
+# =============================================================================
+
+class Journal:
+    """Récepteur des événements émis par le moteur (ne fait rien par défaut)"""
+    # Les appelants testent `actif` avant de calculer des arguments coûteux
+    actif = False
+
+    def emettre(self, evenement: str, *args):
+        """Reçoit un événement (code + arguments bruts, jamais formatés)"""
+        pass
+
+
+class JournalSilencieux(Journal):
+    """Ignore tous les événements : aucun formatage, aucune écriture"""
+    pass
+
+
+class JournalMemoire(Journal):
+    """Conserve les événements sous forme de tuples (code, args)"""
+    actif = True
+
+    def __init__(self):
+        self.evenements = []
+
+    def emettre(self, evenement: str, *args):
+        self.evenements.append((evenement, args))
+
+
+class JournalConsole(Journal):
+    """Affiche les événements sur la sortie standard (comportement historique)"""
+    actif = True
+
+    FORMATS = {
+        # Déplacements et tours
+        "debut_partie": "=== DÉBUT PARTIE ===",
+        "debut_tour": "\n--- Tour {} : {} ({}€) ---",
+        "des": "Lancer : {} + {} = {}",
+        "trois_doubles": "3 Doubles -> Prison !",
+        "passage_depart": "Passage par Départ : +200€",
+        # Prison
+        "prison_tour": "--- Prison : {} (Tour {}/3) ---",
+        "prison_carte": "Utilise une carte Sortie de Prison.",
+        "prison_paie": "Paie 50€ pour sortir.",
+        "prison_des": "Dés prison: {}, {}",
+        "prison_double": "Double ! Sortie.",
+        "prison_forcee": "3 tours : Sortie forcée (-50€).",
+        # Propriétés
+        "arrivee_propriete": "-> {} (Prix: {}€, Loyer actuel: {}€)",
+        "achat": "{} achète {} pour {}€",
+        "achat_refuse": "{} décide de ne pas acheter",
+        "achat_impossible": "{} ne peut pas acheter (pas assez d'argent)",
+        "chez_soi": "Vous êtes chez vous.",
+        "loyer_double": "(Loyer doublé : quartier complet !)",
+        "loyer": "Loyer de {}€ payé à {}",
+        "maison": "Maison construite sur {}. Total: {}",
+        "hotel": "Hôtel construit sur {} !",
+        "construction_impossible": "{}",
+        "regles": "Règles : {}",
+        "hypotheque": "{} hypothèque {} (+{}€)",
+        "levee_hypotheque": "{} lève l'hypothèque de {} (-{}€)",
+        "faillite": "XXX {} est en FAILLITE ! XXX",
+        # Cases spéciales
+        "depart": "Case Départ.",
+        "allez_prison": "Allez en prison !",
+        "taxe": "Taxe : Payez 100€",
+        "parc": "Parc gratuit : repos.",
+        "chance": "Carte Chance !",
+        "caisse": "Caisse de Communauté !",
+        # Cartes
+        "carte": "CARTE: {}",
+        "anniversaire_don": "  {} donne 10€ à {}",
+        "carte_liberte": "  {} garde cette carte (total: {})",
+        "paiement_joueur": "  {} paie {}€ à {}",
+        # Résumés
+        "resume_tour": "\n--- RÉSUMÉ TOUR {} ---",
+        "resume_joueur": "  {}: {}€, {} props",
+        "resume_joueur_faillite": "  {}: FAILLITE",
+        "resultat_final": "\n" + "=" * 50 + "\nRÉSULTAT FINAL\n" + "=" * 50,
+        "gagnant": "\nGAGNANT: {} avec {}€",
+        "gagnant_proprietes": "Propriétés: {}",
+        "gagnant_propriete": "  - {}",
+        "limite_tours": "\nLimite de {} tours atteinte",
+        "issue_acquise": "\nIssue acquise : {} détient {:.0%} du patrimoine depuis {} tours",
+        "classement": "\nClassement:",
+        "classement_ligne": "  {}. {}: {}€ de patrimoine {}",
+        # Base de données
+        "bdd_connexion": "Connexion à la BDD...",
+        "bdd_chargee": "{} propriétés chargées depuis la BDD.",
+        "bdd_erreur": "Erreur BDD: {}. Utilisation du mode sans BDD.",
+        "bdd_indisponible": "BDD indisponible (échec récent), pas de nouvelle tentative.",
+        "fichier_charge": "{} propriétés chargées depuis {}.",
+        "fichier_erreur": "Fichier plateau {} illisible: {}. Utilisation du plateau par défaut.",
+    }
+
+    def emettre(self, evenement: str, *args):
+        print(self.FORMATS[evenement].format(*args))
+
+
+class JournalBinaire(Journal):
+    """Enregistre une partie sous forme compacte (~2 octets par tour joué)
+
+    Seuls les événements qui font avancer la partie sont gardés : tours, dés, cartes
+    piochées, achats et refus, constructions, loyers et faillites. L'en-tête décrit
+    la partie (règles, moteur, joueurs, stratégie) ; RejeuPartie la reconstruit à
+    partir du journal. `actif` reste faux : aucun texte n'est formaté pour ce journal.
+    """
+    VERSION = b"MNJ2"
+    # Un octet par lancer (indice dans FluxAleatoire.PAIRES) et par début de tour
+    # (0x40 + joueur) ; les autres enregistrements sont un type suivi de leur contenu
+    DES, TOUR = 0x00, 0x40
+    CARTE, ACHAT, REFUS, CONSTRUCTION, LOYER, FAILLITE = range(0x80, 0x86)
+    _LOYER = struct.Struct("<BBH")
+
+    def __init__(self, noms_joueurs: List[str], strategie=None):
+        """strategie : nom de la stratégie d'une partie MonopolyIA (ou liste d'un nom par
+        joueur), None pour Monopoly"""
+        self.noms = list(noms_joueurs)
+        self.strategie = strategie
+        self.indices = {nom: i for i, nom in enumerate(self.noms)}
+        strategies = [] if strategie is None else [strategie] if isinstance(strategie, str) else list(strategie)
+        entete = bytearray(self.VERSION)
+        # Règles de la partie : historiques, remplacées par l'événement "regles" du moteur
+        entete += Regles().binaire()
+        entete += bytes((len(strategies), len(self.noms)))
+        for texte in self.noms + strategies:
+            octets = texte.encode()
+            entete += bytes((len(octets),)) + octets
+        self.taille_entete = len(entete)
+        self.donnees = entete
+
+    def emettre(self, evenement: str, *args):
+        encodeur = self._ENCODEURS.get(evenement)
+        if encodeur is not None:
+            encodeur(self, *args)
+
+    def _tour(self, tour, nom, argent):
+        self.donnees.append(self.TOUR | self.indices[nom])
+
+    def _des(self, d1, d2, *total):
+        self.donnees.append((d1 - 1) * 6 + d2 - 1)
+
+    def _carte(self, description, code):
+        self.donnees += bytes((self.CARTE, code))
+
+    def _achat(self, nom, nom_case, prix, position):
+        self.donnees += bytes((self.ACHAT, position))
+
+    def _refus(self, nom, position):
+        self.donnees += bytes((self.REFUS, position))
+
+    def _maison(self, nom_case, nb_maisons, position):
+        self.donnees += bytes((self.CONSTRUCTION, position))
+
+    def _hotel(self, nom_case, position):
+        self.donnees += bytes((self.CONSTRUCTION, position))
+
+    def _loyer(self, loyer, nom):
+        self.donnees += self._LOYER.pack(self.LOYER, self.indices[nom], loyer)
+
+    def _faillite(self, nom):
+        self.donnees += bytes((self.FAILLITE, self.indices[nom]))
+
+    def _regles(self, regles):
+        debut = len(self.VERSION)
+        self.donnees[debut:debut + Regles._BINAIRE.size] = regles.binaire()
+
+    _ENCODEURS = {
+        "debut_tour": _tour, "des": _des, "prison_des": _des, "carte": _carte,
+        "achat": _achat, "achat_refuse": _refus, "achat_impossible": _refus,
+        "maison": _maison, "hotel": _hotel, "loyer": _loyer, "faillite": _faillite, "regles": _regles,
+    }
+
+    @classmethod
+    def lire_entete(cls, donnees: bytes) -> Tuple[List[str], object, int]:
+        """(joueurs, stratégie : None, nom ou liste de noms, position du premier enregistrement)"""
+        if bytes(donnees[:4]) != cls.VERSION:
+            raise ValueError("Journal binaire inconnu")
+        i = len(cls.VERSION) + Regles._BINAIRE.size
+        nb_strategies, nb_joueurs = donnees[i], donnees[i + 1]
+        textes, i = [], i + 2
+        for _ in range(nb_joueurs + nb_strategies):
+            n = donnees[i]
+            textes.append(bytes(donnees[i + 1:i + 1 + n]).decode())
+            i += 1 + n
+        noms, strategies = textes[:nb_joueurs], textes[nb_joueurs:]
+        strategie = None if not strategies else strategies[0] if nb_strategies == 1 else strategies
+        return noms, strategie, i
+
+    @classmethod
+    def lire_regles(cls, donnees: bytes) -> 'Regles':
+        """Règles de la partie enregistrée"""
+        if bytes(donnees[:4]) != cls.VERSION:
+            raise ValueError("Journal binaire inconnu")
+        return Regles.depuis_binaire(donnees, len(cls.VERSION))
+
+    @classmethod
+    def enregistrements(cls, donnees: bytes, debut: int):
+        """Parcourt les enregistrements : (type, valeur[, montant])"""
+        i, fin = debut, len(donnees)
+        while i < fin:
+            octet = donnees[i]
+            if octet < cls.TOUR:
+                yield cls.DES, octet
+                i += 1
+            elif octet < cls.CARTE:
+                yield cls.TOUR, octet - cls.TOUR
+                i += 1
+            elif octet == cls.LOYER:
+                yield cls._LOYER.unpack_from(donnees, i)
+                i += cls._LOYER.size
+            elif octet <= cls.FAILLITE:
+                yield octet, donnees[i + 1]
+                i += 2
+            else:
+                raise ValueError(f"Enregistrement inconnu à l'octet {i}")
+
+
+# Journal utilisé par les objets créés hors d'une partie (tests unitaires...)
+JOURNAL_CONSOLE = JournalConsole()
+
+# =============================================================================
+# FLUX ALÉATOIRES (UN PAR PARTIE)
+# =============================================================================
+
+def graine_partie(graine: int, indice: int) -> int:
+    """Graine d'une partie, dérivée de la graine maître et de son indice
+    
+    Ne dépend ni du nombre de processus ni du découpage en lots, ce qui rend
+    un tournoi reproductible quelle que soit la machine.
+    """
+    import hashlib
+    empreinte = hashlib.blake2b(f"{graine}:{indice}".encode(), digest_size=8).digest()
+    return int.from_bytes(empreinte, "little")
+
+
+class FluxAleatoire(random.Random):
+    """Générateur propre à une partie : dés, mélanges des cartes, choix de stratégie
+    
+    Sans graine, le flux est initialisé depuis os.urandom. Les lancers sont tirés
+    par blocs parmi les 36 paires possibles (un seul tirage par lancer, un appel
+    à choices par bloc) au lieu de deux randint par lancer ; le bloc garde un
+    octet par lancer (indice dans PAIRES).
+    """
+    TAILLE_BLOC = 128
+    PAIRES = tuple((d1, d2) for d1 in range(1, 7) for d2 in range(1, 7))
+    CODES = range(36)
+    # État binaire : graine, curseur, taille du bloc, gauss_next (présent, valeur), puis
+    # le bloc et les 625 mots du Mersenne Twister
+    _ENTETE_BINAIRE = struct.Struct("<QHH?d")
+    _ETAT_MT = struct.Struct("<625I")
+
+    def __init__(self, graine: Optional[int] = None):
+        # Graine sur 64 bits (format binaire des instantanés)
+        self.graine = graine % 2 ** 64 if graine is not None else int.from_bytes(os.urandom(8), "little")
+        self._des = b""
+        self._curseur = 0
+        super().__init__(self.graine)
+
+    def engendrer(self, indice: int) -> 'FluxAleatoire':
+        """Flux indépendant numéro `indice` (une partie, un processus...)"""
+        return FluxAleatoire(graine_partie(self.graine, indice))
+
+    def tirer_des(self, n: int) -> List[Tuple[int, int]]:
+        """n lancers de deux dés"""
+        paires = self.PAIRES
+        return [paires[code] for code in self._tirer_codes(n)]
+
+    def _tirer_codes(self, n: int) -> bytes:
+        return bytes(self.choices(self.CODES, k=n))
+
+    def lancer_des(self) -> Tuple[int, int]:
+        """Un lancer, lu dans le bloc pré-tiré"""
+        i = self._curseur
+        if i >= len(self._des):
+            self._des = self._tirer_codes(self.TAILLE_BLOC)
+            i = 0
+        self._curseur = i + 1
+        return self.PAIRES[self._des[i]]
+
+    def imposer_des(self, codes: bytes):
+        """Impose les prochains lancers (indices dans PAIRES), par exemple ceux d'un journal"""
+        self._des = bytes(codes)
+        self._curseur = 0
+
+    def getstate(self):
+        # Le bloc de dés pré-tirés fait partie de l'état (copie exacte du flux)
+        return super().getstate(), self.graine, self._des, self._curseur
+
+    def setstate(self, etat):
+        etat_random, self.graine, self._des, self._curseur = etat
+        super().setstate(etat_random)
+
+    def __reduce__(self):
+        return self.__class__, (self.graine,), self.getstate()
+
+    def etat_binaire(self) -> bytes:
+        """État complet en ~2,6 ko (voir _ENTETE_BINAIRE)"""
+        _, interne, gauss = random.Random.getstate(self)
+        return (self._ENTETE_BINAIRE.pack(self.graine, self._curseur, len(self._des), gauss is not None, gauss or 0.0)
+                + self._des + self._ETAT_MT.pack(*interne))
+
+    def restaurer_binaire(self, donnees: bytes, debut: int = 0) -> int:
+        """Relit un état produit par etat_binaire ; retourne la position de fin"""
+        graine, curseur, taille, a_gauss, gauss = self._ENTETE_BINAIRE.unpack_from(donnees, debut)
+        i = debut + self._ENTETE_BINAIRE.size
+        self._des = bytes(donnees[i:i + taille])
+        i += taille
+        random.Random.setstate(self, (3, self._ETAT_MT.unpack_from(donnees, i), gauss if a_gauss else None))
+        self.graine, self._curseur = graine, curseur
+        return i + self._ETAT_MT.size
+
 
 # =============================================================================
 # CLASSES DE BASE (SÉANCE 1 & 2)
 # =============================================================================
 
+# Codes entiers des types de case : table des actions du plateau et moteurs à base de tableaux
+TYPES_CASES = ("propriete", "gare", "compagnie", "depart", "prison", "taxe", "parc", "chance", "caisse", "allez_prison")
+CODE_TYPE = {type_case: code for code, type_case in enumerate(TYPES_CASES)}
+(TYPE_PROPRIETE, TYPE_GARE, TYPE_COMPAGNIE, TYPE_DEPART, TYPE_PRISON, TYPE_TAXE, TYPE_PARC, TYPE_CHANCE,
+ TYPE_CAISSE, TYPE_ALLEZ_PRISON) = range(len(TYPES_CASES))
+
+
 class Case:
     """Classe de base pour toutes les cases du plateau"""
+    # __slots__ : pas de __dict__ par case (mémoire et accès aux attributs)
+    __slots__ = ("nom", "position")
+
     def __init__(self, nom: str, position: int):
         self.nom = nom
         self.position = position
@@ -18,35 +350,123 @@ class Case:
 
 class Propriete(Case):
     """Case représentant une propriété achetable"""
-    def __init__(self, nom: str, position: int, prix: int, loyer: int, couleur: str, prix_maison: int = 50):
+    __slots__ = ("prix", "loyer_base", "couleur", "prix_maison", "_etat")
+
+    def __init__(self, nom: str, position: int, prix: int, loyer: int, couleur: str, prix_maison: int = 50,
+                 etat: Optional['EtatPlateau'] = None):
         super().__init__(nom, position)
         self.prix = prix
         self.loyer_base = loyer
         self.couleur = couleur
         self.prix_maison = prix_maison 
-        self.proprietaire: Optional['Joueur'] = None
-        self.nb_maisons = 0
-        self.a_hotel = False
+        # Propriétaire et constructions sont stockés dans l'état de la partie
+        self._etat = etat if etat is not None else EtatPlateau()
+
+    @property
+    def proprietaire(self) -> Optional['Joueur']:
+        indice = self._etat.proprietaires[self.position]
+        return None if indice < 0 else self._etat.joueurs[indice]
+
+    @proprietaire.setter
+    def proprietaire(self, joueur: Optional['Joueur']):
+        # Point de passage unique des changements de propriétaire :
+        # les compteurs par quartier des joueurs sont tenus à jour ici
+        # ainsi que la valeur des biens (la propriété part avec ses constructions)
+        etat = self._etat
+        indice = -1 if joueur is None else etat.indice_joueur(joueur)
+        ancien = etat.proprietaires[self.position]
+        valeur = self.valeur()
+        if ancien >= 0:
+            ancien = etat.joueurs[ancien]
+            ancien.quartiers[self.couleur] -= 1
+            ancien.valeur_biens -= valeur
+        etat.proprietaires[self.position] = indice
+        if joueur is not None:
+            joueur.quartiers[self.couleur] = joueur.quartiers.get(self.couleur, 0) + 1
+            joueur.valeur_biens += valeur
+
+    @property
+    def nb_maisons(self) -> int:
+        return self._etat.maisons[self.position]
+
+    @nb_maisons.setter
+    def nb_maisons(self, nombre: int):
+        etat = self._etat
+        ecart = nombre - etat.maisons[self.position]
+        etat.maisons[self.position] = nombre
+        etat.maisons_posees += ecart
+        self._construire_niveau(ecart, ecart * self.prix_maison)
+
+    @property
+    def a_hotel(self) -> bool:
+        return self._etat.hotels[self.position] == 1
+
+    @a_hotel.setter
+    def a_hotel(self, valeur: bool):
+        etat = self._etat
+        ecart = (1 if valeur else 0) - etat.hotels[self.position]
+        etat.hotels[self.position] = 1 if valeur else 0
+        etat.hotels_poses += ecart
+        self._construire_niveau(5 * ecart, 5 * ecart * self.prix_maison)
+
+    @property
+    def hypothequee(self) -> bool:
+        return (self._etat.hypotheques >> self.position) & 1 == 1
+
+    @hypothequee.setter
+    def hypothequee(self, valeur: bool):
+        if valeur != self.hypothequee:
+            self._etat.hypotheques ^= 1 << self.position
+            self._reevaluer(-(self.prix // 2) if valeur else self.prix // 2)
+
+    def valeur(self) -> int:
+        """Valeur d'achat du terrain et de ses constructions (un hôtel vaut 5 maisons),
+        moins le prêt de la banque si le terrain est hypothéqué"""
+        etat = self._etat
+        valeur = self.prix + (5 if etat.hotels[self.position] else etat.maisons[self.position]) * self.prix_maison
+        return valeur - self.prix // 2 if self.hypothequee else valeur
+
+    def _construire_niveau(self, ecart: int, valeur: int):
+        """Reporte une construction ou une démolition sur le quartier et le propriétaire"""
+        if ecart:
+            niveaux = self._etat.niveaux
+            niveaux[self.couleur] = niveaux.get(self.couleur, 0) + ecart
+            self._reevaluer(valeur)
+
+    def _reevaluer(self, ecart: int):
+        """Reporte une variation de valeur des constructions sur le propriétaire"""
+        indice = self._etat.proprietaires[self.position]
+        if indice >= 0 and ecart:
+            self._etat.joueurs[indice].valeur_biens += ecart
+
+    def hypothequer(self, joueur: 'Joueur') -> bool:
+        """Hypothèque le terrain (quartier sans constructions) : la banque prête la moitié du prix"""
+        etat = self._etat
+        if (not etat.regles.hypotheques or self.hypothequee or self.proprietaire is not joueur
+                or etat.niveaux.get(self.couleur, 0)):
+            return False
+        self.hypothequee = True
+        joueur.recevoir(self.prix // 2)
+        joueur.journal.emettre("hypotheque", joueur.nom, self.nom, self.prix // 2, self.position)
+        return True
+
+    def lever_hypotheque(self, joueur: 'Joueur') -> bool:
+        """Rembourse le prêt de la banque plus 10 % d'intérêts"""
+        cout = self.prix // 2 * 11 // 10
+        if not self.hypothequee or self.proprietaire is not joueur or joueur.argent < cout:
+            return False
+        joueur.argent -= cout
+        self.hypothequee = False
+        joueur.journal.emettre("levee_hypotheque", joueur.nom, self.nom, cout, self.position)
+        return True
     
     def possede_quartier_complet(self, joueur: 'Joueur', jeu: 'Monopoly') -> bool:
         """Vérifie si le joueur possède toutes les propriétés d'une couleur (Exercice 2.2)"""
-        # Compter combien de terrains de cette couleur existent sur le plateau
-        total_quartier = 0
-        for case in jeu.plateau.cases:
-            if isinstance(case, Propriete) and case.couleur == self.couleur:
-                total_quartier += 1
-        
-        # Compter combien le joueur en possède
-        possedes = 0
-        for prop in joueur.proprietes:
-            if prop.couleur == self.couleur:
-                possedes += 1
-                
-        return possedes == total_quartier and total_quartier > 0
+        return joueur.possede_quartier_complet(self.couleur)
 
     def calculer_loyer(self) -> int:
         """Calcule le loyer en fonction des maisons/hôtels (Exercice 2.2)"""
-        if self.proprietaire is None:
+        if self.proprietaire is None or self._etat.hypotheques >> self.position & 1:
             return 0
 
         # Si hôtel : loyer x 5 (simplifié)
@@ -64,25 +484,25 @@ class Propriete(Case):
     def construire_maison(self, joueur: 'Joueur'):
         """Construit une maison ou un hôtel (Exercice 2.2)"""
         if self.a_hotel:
-            print("Déjà un hôtel !")
+            joueur.journal.emettre("construction_impossible", "Déjà un hôtel !")
             return False
         
         if not self.peut_construire(joueur):
-            print("Construction impossible.")
+            joueur.journal.emettre("construction_impossible", "Construction impossible.")
             return False
 
         if joueur.argent >= self.prix_maison:
             joueur.argent -= self.prix_maison
             if self.nb_maisons < 4:
                 self.nb_maisons += 1
-                print(f"Maison construite sur {self.nom}. Total: {self.nb_maisons}")
+                joueur.journal.emettre("maison", self.nom, self.nb_maisons, self.position)
             else:
                 self.nb_maisons = 0
                 self.a_hotel = True
-                print(f"Hôtel construit sur {self.nom} !")
+                joueur.journal.emettre("hotel", self.nom, self.position)
             return True
         else:
-            print("Pas assez d'argent.")
+            joueur.journal.emettre("construction_impossible", "Pas assez d'argent.")
             return False
     
     def peut_construire(self, joueur: 'Joueur') -> bool:
@@ -96,24 +516,48 @@ class Propriete(Case):
         # Il faut posséder le quartier complet
         if not joueur.possede_quartier_complet(self.couleur):
             return False
+        return self.construction_autorisee()
+
+    def construction_autorisee(self) -> bool:
+        """Règles facultatives de la partie : stock de la banque, hypothèques, construction uniforme"""
+        etat = self._etat
+        regles = etat.regles
+        if regles is REGLES_HISTORIQUES:
+            return True
+        if self.nb_maisons < 4:
+            if regles.limite_maisons is not None and etat.maisons_posees >= regles.limite_maisons:
+                return False
+        elif regles.limite_hotels is not None and etat.hotels_poses >= regles.limite_hotels:
+            return False
+        if regles.hypotheques and etat.hypotheques & etat.masques.get(self.couleur, 0):
+            return False
+        # Le niveau le plus bas du quartier est sa moyenne arrondie par défaut (écart d'au plus 1)
+        if regles.construction_uniforme:
+            if self.nb_maisons != etat.niveaux.get(self.couleur, 0) // etat.tailles.get(self.couleur, 1):
+                return False
         return True
 
     def action(self, joueur: 'Joueur', jeu: 'Monopoly'):
         """Gère l'arrivée d'un joueur sur la propriété"""
-        print(f"-> {self.nom} (Prix: {self.prix}€, Loyer actuel: {self.calculer_loyer()}€)")
+        journal = jeu.journal
+        if journal.actif:
+            journal.emettre("arrivee_propriete", self.nom, self.prix, self.calculer_loyer())
         
         if self.proprietaire is None:
             # Achat automatique si possible (pour simplifier)
             if joueur.argent >= self.prix:
                 joueur.acheter_propriete(self)
-                print(f"{joueur.nom} achète {self.nom} pour {self.prix}€")
+                journal.emettre("achat", joueur.nom, self.nom, self.prix, self.position)
         
         elif self.proprietaire == joueur:
-            # Le joueur est chez lui, il essaie de construire si possible
+            # Le joueur est chez lui : il rembourse l'hypothèque s'il en a les moyens,
+            # puis essaie de construire si possible
+            if self.hypothequee and joueur.argent >= 500 + self.prix:
+                self.lever_hypotheque(joueur)
             if self.possede_quartier_complet(joueur, jeu) and joueur.argent > 500:
                  self.construire_maison(joueur)
             else:
-                print("Vous êtes chez vous.")
+                journal.emettre("chez_soi")
 
         else:
             # Payer le loyer
@@ -123,28 +567,32 @@ class Propriete(Case):
             if self.nb_maisons == 0 and not self.a_hotel:
                 if self.proprietaire.possede_quartier(self.couleur, jeu.plateau.cases):
                     loyer = loyer * 2
-                    print("(Loyer doublé : quartier complet !)")
+                    journal.emettre("loyer_double")
 
             joueur.payer(loyer, self.proprietaire)
-            print(f"Loyer de {loyer}€ payé à {self.proprietaire.nom}")
+            journal.emettre("loyer", loyer, self.proprietaire.nom)
 
 class Gare(Propriete):
     """Case représentant une gare (Exercice 2.3)"""
-    def __init__(self, nom: str, position: int):
-        super().__init__(nom, position, prix=200, loyer=25, couleur="gare", prix_maison=0)
+    __slots__ = ()
+
+    def __init__(self, nom: str, position: int, etat: Optional['EtatPlateau'] = None):
+        super().__init__(nom, position, prix=200, loyer=25, couleur="gare", prix_maison=0, etat=etat)
     
     def calculer_loyer(self) -> int:
-        if not self.proprietaire:
+        if not self.proprietaire or self._etat.hypotheques >> self.position & 1:
             return 0
-        # Compter les gares du proprio
-        nb_gares = sum(1 for p in self.proprietaire.proprietes if isinstance(p, Gare))
+        # Nombre de gares du proprio (compteur par quartier)
+        nb_gares = self.proprietaire.quartiers["gare"]
         # 25, 50, 100, 200
         return 25 * (2 ** (nb_gares - 1)) if nb_gares > 0 else 0
     
 class Compagnie(Propriete):
     """Case représentant une compagnie (Exercice 2.3)"""
-    def __init__(self, nom: str, position: int):
-        super().__init__(nom, position, prix=150, loyer=0, couleur="Compagnie", prix_maison=0)
+    __slots__ = ("dernier_lancer",)
+
+    def __init__(self, nom: str, position: int, etat: Optional['EtatPlateau'] = None):
+        super().__init__(nom, position, prix=150, loyer=0, couleur="Compagnie", prix_maison=0, etat=etat)
         self.dernier_lancer = 0
     
     def action(self, joueur: 'Joueur', jeu: 'Monopoly'):
@@ -152,40 +600,61 @@ class Compagnie(Propriete):
         super().action(joueur, jeu)
 
     def calculer_loyer(self) -> int:
-        if not self.proprietaire:
+        if not self.proprietaire or self._etat.hypotheques >> self.position & 1:
             return 0
-        nb_comp = sum(1 for p in self.proprietaire.proprietes if isinstance(p, Compagnie))
+        nb_comp = self.proprietaire.quartiers["Compagnie"]
         facteur = 10 if nb_comp == 2 else 4
         return self.dernier_lancer * facteur
 
 class CaseSpeciale(Case):
     """Cases comme Départ, Prison, Taxe, etc. (Exercice 2.1)"""
+    __slots__ = ("type_case", "code")
+
     def __init__(self, nom: str, position: int, type_case: str):
         super().__init__(nom, position)
         self.type_case = type_case
+        self.code = CODE_TYPE[type_case]
     
     def action(self, joueur: 'Joueur', jeu: 'Monopoly'):
-        if self.type_case == "depart":
-            print("Case Départ.")
-        elif self.type_case == "allez_prison":
-            print("Allez en prison !")
-            joueur.aller_en_prison()
-        elif self.type_case == "taxe":
-            print("Taxe : Payez 100€")
-            joueur.payer(100)
-        elif self.type_case == "parc":
-            print("Parc gratuit : repos.")
-        elif self.type_case == "chance":
-            print("Carte Chance !")
-            jeu.cartes_chance.piocher_et_executer(joueur, jeu)
-        elif self.type_case == "caisse":
-            print("Caisse de Communauté !")
-            jeu.cartes_communaute.piocher_et_executer(joueur, jeu)
+        self._ACTIONS[self.code](self, joueur, jeu)
+
+    def _depart(self, joueur, jeu):
+        jeu.journal.emettre("depart")
+
+    def _allez_prison(self, joueur, jeu):
+        jeu.journal.emettre("allez_prison")
+        joueur.aller_en_prison()
+
+    def _taxe(self, joueur, jeu):
+        jeu.journal.emettre("taxe")
+        joueur.payer(100)
+
+    def _parc(self, joueur, jeu):
+        jeu.journal.emettre("parc")
+
+    def _chance(self, joueur, jeu):
+        jeu.journal.emettre("chance")
+        jeu.cartes_chance.piocher_et_executer(joueur, jeu)
+
+    def _caisse(self, joueur, jeu):
+        jeu.journal.emettre("caisse")
+        jeu.cartes_communaute.piocher_et_executer(joueur, jeu)
+
+    def _visite(self, joueur, jeu):
+        pass
+
+    # Action de chaque type de case, indexée par son code (les propriétés ont leur classe)
+    _ACTIONS = (None, None, None, _depart, _visite, _taxe, _parc, _chance, _caisse, _allez_prison)
 
 class Joueur:
     """Représente un joueur"""
-    def __init__(self, nom: str, argent_initial: int = 1500):
+    __slots__ = ("nom", "journal", "argent", "position", "proprietes", "en_prison", "tours_en_prison",
+                 "est_en_faillite", "doubles_consecutifs", "cartes_liberte", "quartiers", "tailles_quartiers",
+                 "strategie", "valeur_biens")
+
+    def __init__(self, nom: str, argent_initial: int = 1500, journal: Optional[Journal] = None):
         self.nom = nom
+        self.journal = journal if journal else JOURNAL_CONSOLE
         self.argent = argent_initial
         self.position = 0
         self.proprietes: List[Propriete] = []
@@ -194,15 +663,25 @@ class Joueur:
         self.est_en_faillite = False
         self.doubles_consecutifs = 0
         self.cartes_liberte = 0 
+        # Nombre de propriétés possédées par couleur (tenu à jour par Propriete.proprietaire)
+        self.quartiers: Dict[str, int] = {}
+        # Taille de chaque quartier sur le plateau de la partie
+        self.tailles_quartiers: Dict[str, int] = TAILLES_QUARTIERS_DEFAUT
+        # Stratégie du joueur dans une partie MonopolyIA (None : règles de base)
+        self.strategie: Optional['StrategieIA'] = None
+        # Valeur des propriétés et constructions possédées (tenue à jour par Propriete)
+        self.valeur_biens = 0
     
     def deplacer(self, nombre_cases: int, plateau_taille: int = 40):
         anc_pos = self.position
         self.position = (self.position + nombre_cases) % plateau_taille
         if self.position < anc_pos and nombre_cases > 0:
-            print("Passage par Départ : +200€")
+            self.journal.emettre("passage_depart")
             self.recevoir(200)
     
     def payer(self, montant: int, beneficiaire: Optional['Joueur'] = None):
+        if self.argent < montant:
+            self.reunir_fonds(montant)
         if self.argent >= montant:
             self.argent -= montant
             if beneficiaire:
@@ -211,7 +690,7 @@ class Joueur:
             self.declarer_faillite(beneficiaire)
     
     def declarer_faillite(self, beneficiaire: Optional['Joueur'] = None):
-        print(f"XXX {self.nom} est en FAILLITE ! XXX")
+        self.journal.emettre("faillite", self.nom)
         self.est_en_faillite = True
         self.argent = 0
         if beneficiaire:
@@ -223,8 +702,16 @@ class Joueur:
                 p.proprietaire = None
                 p.nb_maisons = 0
                 p.a_hotel = False
+                p.hypothequee = False
         self.proprietes.clear()
 
+    def reunir_fonds(self, montant: int):
+        """Hypothèque des terrains jusqu'à pouvoir payer `montant` (si les règles le permettent)"""
+        for p in self.proprietes:
+            if self.argent >= montant:
+                break
+            p.hypothequer(self)
+
     def recevoir(self, montant: int):
         self.argent += montant
     
@@ -245,372 +732,976 @@ class Joueur:
     def sortir_de_prison(self):
         self.en_prison = False
         self.tours_en_prison = 0
+
+    def patrimoine(self) -> int:
+        """Argent plus valeur d'achat des propriétés et des constructions (0 en faillite)"""
+        return 0 if self.est_en_faillite else self.argent + self.valeur_biens
         
     def possede_quartier(self, couleur: str, toutes_cases: List[Case]) -> bool:
-        """Helper pour vérifier les quartiers"""
-        mes_props = [p for p in self.proprietes if p.couleur == couleur]
-        total_props = [c for c in toutes_cases if isinstance(c, Propriete) and c.couleur == couleur]
-        return len(mes_props) == len(total_props) and len(total_props) > 0
+        """Helper pour vérifier les quartiers (toutes_cases conservé pour compatibilité)"""
+        return self.possede_quartier_complet(couleur)
     
     def possede_quartier_complet(self, couleur: str) -> bool:
         """Vérifie si le joueur possède toutes les propriétés d'une couleur (Exercice 2.2)"""
-        # Nombre requis par couleur (simplifié)
-        nb_par_couleur = {
-            "marron": 2, "bleu_clair": 3, "rose": 3, "orange": 3,
-            "rouge": 3, "jaune": 3, "vert": 3, "bleu_fonce": 2,
-            "gare": 4, "Compagnie": 2, "gris": 2
-        }
-        
-        # Compter les propriétés de cette couleur
-        nb_possedees = sum(1 for p in self.proprietes if p.couleur == couleur)
-        nb_requis = nb_par_couleur.get(couleur, 2)
-        
-        return nb_possedees >= nb_requis
+        # O(1) : compteur du joueur comparé à la taille du quartier sur le plateau
+        nb_requis = self.tailles_quartiers.get(couleur, 0)
+        return nb_requis > 0 and self.quartiers.get(couleur, 0) == nb_requis
 
 # =============================================================================
 # ACCES DONNÉES ET CARTES (SÉANCE 3)
 # =============================================================================
 
+def _dossier_cache() -> str:
+    """Dossier de cache de l'utilisateur (XDG_CACHE_HOME, LOCALAPPDATA ou ~/.cache)"""
+    base = (os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+            or os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(base, "monopoly")
+
+
 class DB:
-    # Liste des proprietes (cache)
-    __Proprietes = []
+    # Liste des définitions de propriétés (cache, données immuables ; repli compris
+    # tant que le coupe-circuit est ouvert)
+    __Proprietes: List['DefinitionCase'] = []
+    # Délai de connexion (secondes) : une base arrêtée ne bloque pas le démarrage
+    delai_connexion = 3
+    # Après un échec, la base n'est plus contactée pendant delai_reessai secondes
+    delai_reessai = 300
+    __echec_jusqu_a = 0.0
+    # Copie locale du dernier résultat de v_proprietes (None : désactivée) et sa durée de
+    # validité ; dans le cache de l'utilisateur, pas dans le dossier d'installation
+    fichier_instantane: Optional[str] = os.path.join(_dossier_cache(), "v_proprietes.json")
+    validite_instantane = 24 * 3600
 
     @classmethod
     def connexionBase(cls):
+        # Pilote importé à la première connexion (absent : bascule sur le plateau par défaut)
+        import mysql.connector
         # Configuration spécifique demandée
         mydb = mysql.connector.connect(
             host="localhost",
             port=1433,
             user="SA",
             password="Azerty*!*",
-            database="Toto"
+            database="Toto",
+            connection_timeout=cls.delai_connexion
         )
         return mydb
 
     @classmethod
-    def get_proprietes(cls):
-        # Si déjà chargé, on retourne la liste
-        if cls.__Proprietes:
+    def vider_cache(cls):
+        """Force le rechargement des propriétés au prochain appel (coupe-circuit réarmé)"""
+        cls.__Proprietes = []
+        cls.__echec_jusqu_a = 0.0
+
+    @classmethod
+    def _instantane(cls, toutes: bool = False) -> Optional[str]:
+        """Chemin de la copie locale si elle existe (et est récente, sauf si toutes=True)"""
+        chemin = cls.fichier_instantane
+        if not chemin or not os.path.exists(chemin):
+            return None
+        if not toutes and time.time() - os.path.getmtime(chemin) > cls.validite_instantane:
+            return None
+        return chemin
+
+    @classmethod
+    def get_proprietes(cls, journal: Journal = JOURNAL_CONSOLE):
+        # Si déjà chargé (ou repli pendant que le coupe-circuit est ouvert), on retourne la liste
+        if cls.__Proprietes and (not cls.__echec_jusqu_a or time.monotonic() < cls.__echec_jusqu_a):
             return cls.__Proprietes
 
+        # Copie locale récente : la base n'est pas contactée
+        chemin = cls._instantane()
+        if chemin:
+            cls.__Proprietes = SourceFichier(chemin).charger(journal)
+            if cls.__Proprietes:
+                return cls.__Proprietes
+
+        # Base en échec récemment : pas de nouvelle tentative avant delai_reessai
+        if time.monotonic() < cls.__echec_jusqu_a:
+            journal.emettre("bdd_indisponible")
+            return cls._repli(journal)
+
         try:
-            print("Connexion à la BDD...")
+            journal.emettre("bdd_connexion")
             maConnexion = cls.connexionBase()
             monCurseur = maConnexion.cursor(dictionary=True)
 
             # Requete sur la vue v_proprietes
-            monCurseur.execute("""
-                SELECT position, nom, type_propriete_code, prix_achat, 
-                       loyer_base, couleur, prix_maison
-                FROM v_proprietes;
-            """)
+            monCurseur.execute(REQUETE_PROPRIETES)
             mesResultats = monCurseur.fetchall()
 
-            for r in mesResultats:
-                p = None
-                # Instanciation selon le code type
-                if r["type_propriete_code"] == "propriete":
-                    p = Propriete(r["nom"], r["position"], r["prix_achat"], 
-                                  r["loyer_base"], r["couleur"], r["prix_maison"])
-                elif r["type_propriete_code"] == "gare":
-                    p = Gare(r["nom"], r["position"])
-                elif r["type_propriete_code"] == "compagnie":
-                    p = Compagnie(r["nom"], r["position"])
-
-                if p:
-                    cls.__Proprietes.append(p)
+            # Seuls les codes connus sont retenus (propriete, gare, compagnie)
+            cls.__Proprietes = definitions_depuis_lignes(mesResultats)
+            cls.__echec_jusqu_a = 0.0
 
             monCurseur.close()
             maConnexion.close()
-            print(f"{len(cls.__Proprietes)} propriétés chargées depuis la BDD.")
+            journal.emettre("bdd_chargee", len(cls.__Proprietes))
             
         except Exception as e:
-            print(f"Erreur BDD: {e}. Utilisation du mode sans BDD.")
-            return [] # Retourne vide pour déclencher la création manuelle
+            journal.emettre("bdd_erreur", e)
+            cls.__Proprietes = []
+            cls.__echec_jusqu_a = time.monotonic() + cls.delai_reessai
+            return cls._repli(journal)
+
+        if cls.fichier_instantane and cls.__Proprietes:
+            try:
+                os.makedirs(os.path.dirname(cls.fichier_instantane), exist_ok=True)
+                SourceFichier(cls.fichier_instantane).enregistrer(cls.__Proprietes)
+            except OSError as e:
+                journal.emettre("fichier_erreur", cls.fichier_instantane, e)
+        return cls.__Proprietes
 
+    @classmethod
+    def _repli(cls, journal: Journal) -> List['DefinitionCase']:
+        """Base indisponible : copie locale même ancienne, sinon vide (plateau par défaut)
+        
+        Le repli est gardé en cache jusqu'à la prochaine tentative de connexion.
+        """
+        chemin = cls._instantane(toutes=True)
+        cls.__Proprietes = SourceFichier(chemin).charger(journal) if chemin else []
         return cls.__Proprietes
 
-class CarteCommunaute:
-    def __init__(self, description: str, action):
-        self.description = description
-        self.action = action 
-    def executer(self, joueur, jeu):
-        print(f"CARTE: {self.description}")
-        self.action(joueur, jeu)
+# Requête commune aux bases MySQL et SQLite
+REQUETE_PROPRIETES = """
+    SELECT position, nom, type_propriete_code, prix_achat, 
+           loyer_base, couleur, prix_maison
+    FROM v_proprietes;
+"""
+
+# Codes de type retenus depuis la vue v_proprietes
+TYPES_PROPRIETES = ("propriete", "gare", "compagnie")
+
+# Script de création de la base (tables, 28 propriétés, vue v_proprietes)
+SCRIPT_PLATEAU = os.path.join(os.path.dirname(os.path.abspath(__file__)), "monopoly", "plato.sql")
+
+
+def definitions_depuis_lignes(lignes) -> List['DefinitionCase']:
+    """Convertit des lignes au format de la vue v_proprietes en définitions de cases"""
+    return [DefinitionCase(r["position"], r["nom"], r["type_propriete_code"], r["prix_achat"],
+                           r["loyer_base"], r["couleur"], r["prix_maison"])
+            for r in lignes if r["type_propriete_code"] in TYPES_PROPRIETES]
+
+
+class SourcePlateau:
+    """Fournit les propriétés d'un plateau ; une liste vide donne le plateau par défaut"""
+    def charger(self, journal: Journal = JOURNAL_CONSOLE) -> List['DefinitionCase']:
+        return []
+
+
+class SourceDefaut(SourcePlateau):
+    """Plateau par défaut (PROPRIETES_DEFAUT), sans base de données"""
+
+
+class SourceSQL(SourcePlateau):
+    """Vue v_proprietes de la base MySQL (pilote importé au premier chargement)"""
+    def charger(self, journal: Journal = JOURNAL_CONSOLE) -> List['DefinitionCase']:
+        return DB.get_proprietes(journal)
+
+
+class SourceFichier(SourcePlateau):
+    """Fichier JSON : liste de lignes au format de la vue v_proprietes"""
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+
+    def charger(self, journal: Journal = JOURNAL_CONSOLE) -> List['DefinitionCase']:
+        import json
+        try:
+            with open(self.chemin, encoding="utf-8") as f:
+                definitions = definitions_depuis_lignes(json.load(f))
+        except (OSError, ValueError, KeyError) as e:
+            journal.emettre("fichier_erreur", self.chemin, e)
+            return []
+        journal.emettre("fichier_charge", len(definitions), self.chemin)
+        return definitions
+
+    def enregistrer(self, definitions: List['DefinitionCase']):
+        """Écrit les propriétés (ex. celles de la BDD) pour un chargement hors ligne
+        
+        Écriture dans un fichier temporaire puis renommage : un processus qui lit le
+        fichier en même temps voit l'ancienne ou la nouvelle version, jamais un fichier tronqué.
+        """
+        import json
+        lignes = [{"position": d.position, "nom": d.nom, "type_propriete_code": d.type_case,
+                   "prix_achat": d.prix, "loyer_base": d.loyer, "couleur": d.couleur,
+                   "prix_maison": d.prix_maison}
+                  for d in definitions if d.type_case in TYPES_PROPRIETES]
+        temporaire = f"{self.chemin}.{os.getpid()}.tmp"
+        try:
+            with open(temporaire, "w", encoding="utf-8") as f:
+                json.dump(lignes, f, ensure_ascii=False, indent=1)
+            os.replace(temporaire, self.chemin)
+        except BaseException:
+            if os.path.exists(temporaire):
+                os.remove(temporaire)
+            raise
+
+
+class SourceSQLite(SourcePlateau):
+    """Base SQLite construite depuis plato.sql, sans serveur
+    
+    Sans `base`, le script est exécuté en mémoire à chaque chargement (~1 ms).
+    Avec `base`, il est compilé une fois dans ce fichier (reconstruit si le script
+    est plus récent) puis lu en lecture seule (~0,3 ms).
+    """
+    def __init__(self, script: str = SCRIPT_PLATEAU, base: Optional[str] = None):
+        self.script = script
+        self.base = base
+
+    def charger(self, journal: Journal = JOURNAL_CONSOLE) -> List['DefinitionCase']:
+        import sqlite3
+        try:
+            if self.base is None:
+                connexion = sqlite3.connect(":memory:")
+                connexion.executescript(self._lire_script())
+            else:
+                if not os.path.exists(self.base) or os.path.getmtime(self.base) < os.path.getmtime(self.script):
+                    self._compiler()
+                connexion = sqlite3.connect(f"file:{self.base}?mode=ro", uri=True)
+            connexion.row_factory = sqlite3.Row
+            try:
+                definitions = definitions_depuis_lignes(connexion.execute(REQUETE_PROPRIETES).fetchall())
+            finally:
+                connexion.close()
+        except (OSError, sqlite3.Error) as e:
+            journal.emettre("fichier_erreur", self.base or self.script, e)
+            return []
+        journal.emettre("fichier_charge", len(definitions), self.base or self.script)
+        return definitions
+
+    def _lire_script(self) -> str:
+        with open(self.script, encoding="utf-8") as f:
+            return f.read()
+
+    def _compiler(self):
+        """Exécute le script dans un fichier temporaire puis le renomme (processus concurrents)"""
+        import sqlite3
+        temporaire = f"{self.base}.{os.getpid()}.tmp"
+        connexion = sqlite3.connect(temporaire)
+        try:
+            connexion.executescript(self._lire_script())
+            connexion.commit()
+        finally:
+            connexion.close()
+        os.replace(temporaire, self.base)
+
+
+# Cartes Chance et Caisse de Communauté : (description, effet, valeur)
+# Table partagée par le moteur objet et le simulateur vectorisé
+CARTES_CHANCE = (
+    ("Avancez jusqu'à la case Départ", "aller_a", 0),
+    ("Allez en Prison", "prison", 0),
+    ("Amende pour excès de vitesse: 15€", "payer", 15),
+    ("Reculez de 3 cases", "reculer", 3),
+    ("Vous êtes libéré de prison", "liberte", 0),
+    ("Recevez un dividende de 50€", "recevoir", 50),
+    ("Payez chaque joueur 50€", "payer_chacun", 50),
+    ("Rendez-vous Gare Montparnasse", "aller_a", 5),
+    ("Rendez-vous Avenue Henri-Martin", "aller_a", 24),
+    ("Rendez-vous Rue de la Paix", "aller_a", 39),
+)
+
+CARTES_COMMUNAUTE = (
+    ("Avancez jusqu'à la case Départ", "aller_a", 0),
+    ("Erreur de la banque: +200€", "recevoir", 200),
+    ("Payez une amende de 10€", "payer", 10),
+    ("Allez en Prison", "prison", 0),
+    ("Vous êtes libéré de prison", "liberte", 0),
+    ("Recevez 100€", "recevoir", 100),
+    ("Recevez votre revenu annuel: 100€", "recevoir", 100),
+    ("C'est votre anniversaire: +10€ de chaque joueur", "recevoir_chacun", 10),
+    ("Amende pour ivresse: 20€", "payer", 20),
+    ("Prix de beauté: +10€", "recevoir", 10),
+)
+
+# Codes entiers des effets (utilisés par les moteurs à base de tableaux)
+EFFETS_CARTES = ("aller_a", "prison", "payer", "reculer", "liberte", "recevoir", "payer_chacun", "recevoir_chacun")
+CODE_EFFET = {effet: code for code, effet in enumerate(EFFETS_CARTES)}
+(EFFET_ALLER_A, EFFET_PRISON, EFFET_PAYER, EFFET_RECULER, EFFET_LIBERTE, EFFET_RECEVOIR,
+ EFFET_PAYER_CHACUN, EFFET_RECEVOIR_CHACUN) = range(len(EFFETS_CARTES))
+# Paquets, dans l'ordre de leur code (journal binaire)
+PAQUETS_CARTES = ("chance", "communaute")
+
+
+class Carte(NamedTuple):
+    """Carte d'un paquet : effet codé (EFFET_*) et sa valeur (case, montant, nombre de cases)"""
+    description: str
+    effet: int
+    valeur: int
+    # Paquet (4 bits de poids fort) et rang dans sa table : identifiant d'un octet
+    code: int
+
+
+# Tables de cartes typées, construites une fois et partagées par toutes les parties
+TABLES_CARTES: Dict[str, Tuple[Carte, ...]] = {
+    paquet: tuple(Carte(description, CODE_EFFET[effet], valeur, (k << 4) | rang)
+                  for rang, (description, effet, valeur) in enumerate(table))
+    for k, (paquet, table) in enumerate(zip(PAQUETS_CARTES, (CARTES_CHANCE, CARTES_COMMUNAUTE)))
+}
+
 
 class PaquetCartes:
-    def __init__(self, type_paquet: str):
+    """Pioche d'un paquet : permutation des rangs de sa table (un octet par carte) et curseur
+    
+    Piocher ne crée aucun objet ; le paquet est remélangé quand la pioche est épuisée.
+    """
+    __slots__ = ("type_paquet", "table", "ordre", "curseur", "rng")
+
+    def __init__(self, type_paquet: str, rng: Optional[FluxAleatoire] = None):
         self.type_paquet = type_paquet
-        self.cartes = []
-        self._creer_cartes()
-        self.pioche = []
+        self.rng = rng if rng else FluxAleatoire()
+        # Cartes Chance et Caisse de Communauté (Séance 3), décrites par TABLES_CARTES
+        self.table = TABLES_CARTES[type_paquet]
+        self.ordre = bytearray(range(len(self.table)))
+        self.curseur = 0
         self.melanger()
     
-    def _creer_cartes(self):
-        # Cartes Chance et Caisse de Communauté (Séance 3)
-        if self.type_paquet == "chance":
-            self.cartes = [
-                CarteCommunaute("Avancez jusqu'à la case Départ", lambda j, g: self._avancer_case(j, g, 0)),
-                CarteCommunaute("Allez en Prison", lambda j, g: j.aller_en_prison()),
-                CarteCommunaute("Amende pour excès de vitesse: 15€", lambda j, g: j.payer(15)),
-                CarteCommunaute("Reculez de 3 cases", lambda j, g: self._reculer(j, g, 3)),
-                CarteCommunaute("Vous êtes libéré de prison", lambda j, g: self._donner_carte_liberte(j)),
-                CarteCommunaute("Recevez un dividende de 50€", lambda j, g: j.recevoir(50)),
-                CarteCommunaute("Payez chaque joueur 50€", lambda j, g: self._payer_tous_joueurs(j, g, 50)),
-                CarteCommunaute("Rendez-vous Gare Montparnasse", lambda j, g: self._avancer_case(j, g, 5)),
-                CarteCommunaute("Rendez-vous Avenue Henri-Martin", lambda j, g: self._avancer_case(j, g, 24)),
-                CarteCommunaute("Rendez-vous Rue de la Paix", lambda j, g: self._avancer_case(j, g, 39))
-            ]
-        else:
-            self.cartes = [
-                CarteCommunaute("Avancez jusqu'à la case Départ", lambda j, g: self._avancer_case(j, g, 0)),
-                CarteCommunaute("Erreur de la banque: +200€", lambda j, g: j.recevoir(200)),
-                CarteCommunaute("Payez une amende de 10€", lambda j, g: j.payer(10)),
-                CarteCommunaute("Allez en Prison", lambda j, g: j.aller_en_prison()),
-                CarteCommunaute("Vous êtes libéré de prison", lambda j, g: self._donner_carte_liberte(j)),
-                CarteCommunaute("Recevez 100€", lambda j, g: j.recevoir(100)),
-                CarteCommunaute("Recevez votre revenu annuel: 100€", lambda j, g: j.recevoir(100)),
-                CarteCommunaute("C'est votre anniversaire: +10€ de chaque joueur", lambda j, g: self._anniversaire(j, g)),
-                CarteCommunaute("Amende pour ivresse: 20€", lambda j, g: j.payer(20)),
-                CarteCommunaute("Prix de beauté: +10€", lambda j, g: j.recevoir(10))
-            ]
-    
     def _avancer_case(self, joueur, jeu, position):
         """Fait avancer le joueur jusqu'à une position (Séance 3)"""
         if position < joueur.position:
             # Passage par départ
             joueur.recevoir(200)
-            print("Passage par Départ : +200€")
+            jeu.journal.emettre("passage_depart")
         joueur.position = position
-        case = jeu.plateau.get_case(position)
-        case.action(joueur, jeu)
+        jeu.plateau.actions[position](joueur, jeu)
     
     def _reculer(self, joueur, jeu, nb_cases):
         """Fait reculer le joueur (Séance 3)"""
         joueur.position = (joueur.position - nb_cases) % 40
-        case = jeu.plateau.get_case(joueur.position)
-        case.action(joueur, jeu)
+        jeu.plateau.actions[joueur.position](joueur, jeu)
     
-    def _anniversaire(self, joueur, jeu):
+    def _anniversaire(self, joueur, jeu, montant=10):
         """Chaque joueur donne 10€ (Séance 3)"""
         for autre in jeu.joueurs:
             if autre != joueur and not autre.est_en_faillite:
-                autre.payer(10, joueur)
-                print(f"  {autre.nom} donne 10€ à {joueur.nom}")
+                autre.payer(montant, joueur)
+                jeu.journal.emettre("anniversaire_don", autre.nom, joueur.nom)
     
-    def _donner_carte_liberte(self, joueur):
+    def _donner_carte_liberte(self, joueur, jeu=None, valeur=0):
         """Donne une carte sortie de prison (Séance 3)"""
         joueur.cartes_liberte += 1
-        print(f"  {joueur.nom} garde cette carte (total: {joueur.cartes_liberte})")
+        joueur.journal.emettre("carte_liberte", joueur.nom, joueur.cartes_liberte)
     
     def _payer_tous_joueurs(self, joueur, jeu, montant):
         """Payer tous les autres joueurs (Séance 3)"""
         for autre in jeu.joueurs:
             if autre != joueur and not autre.est_en_faillite:
                 joueur.payer(montant, autre)
-                print(f"  {joueur.nom} paie 50€ à {autre.nom}")
+                jeu.journal.emettre("paiement_joueur", joueur.nom, montant, autre.nom)
+
+    def _prison(self, joueur, jeu, valeur):
+        joueur.aller_en_prison()
+
+    def _payer(self, joueur, jeu, montant):
+        joueur.payer(montant)
+
+    def _recevoir(self, joueur, jeu, montant):
+        joueur.recevoir(montant)
+
+    # Action de chaque effet, dans l'ordre des codes EFFET_*
+    _ACTIONS = (_avancer_case, _prison, _payer, _reculer, _donner_carte_liberte, _recevoir,
+                _payer_tous_joueurs, _anniversaire)
     
     def melanger(self):
-        self.pioche = self.cartes.copy()
-        random.shuffle(self.pioche)
+        if len(self.ordre) != len(self.table):
+            self.ordre = bytearray(range(len(self.table)))
+        self.rng.shuffle(self.ordre)
+        self.curseur = 0
 
-    def piocher_et_executer(self, joueur, jeu):
-        if not self.pioche:
+    def melanger_restantes(self):
+        """Remélange les cartes pas encore piochées (simulations qui ignorent l'ordre réel)"""
+        reste = self.ordre[self.curseur:]
+        self.rng.shuffle(reste)
+        self.ordre[self.curseur:] = reste
+
+    def imposer(self, rangs):
+        """Impose les prochaines cartes (rangs dans la table), par exemple celles d'un journal"""
+        self.ordre = bytearray(rangs)
+        self.curseur = 0
+
+    def instantane(self) -> bytes:
+        """Ordre de la pioche : taille, curseur puis rangs des cartes"""
+        return bytes((len(self.ordre), self.curseur)) + self.ordre
+
+    def restaurer(self, donnees: bytes, debut: int = 0) -> int:
+        n, self.curseur = donnees[debut], donnees[debut + 1]
+        self.ordre = bytearray(donnees[debut + 2:debut + 2 + n])
+        return debut + 2 + n
+
+    def piocher(self) -> Carte:
+        if self.curseur >= len(self.ordre):
             self.melanger()
-        carte = self.pioche.pop()
-        carte.executer(joueur, jeu)
+        carte = self.table[self.ordre[self.curseur]]
+        self.curseur += 1
+        return carte
+
+    def piocher_et_executer(self, joueur, jeu):
+        carte = self.piocher()
+        jeu.journal.emettre("carte", carte.description, carte.code)
+        self._ACTIONS[carte.effet](self, joueur, jeu, carte.valeur)
 
 # =============================================================================
 # MOTEUR DE JEU (PLATEAU & MONOPOLY)
 # =============================================================================
 
+# Propriétés du Monopoly français (simplifié), utilisées si la BDD est vide
+# position: (nom, prix, loyer, couleur, prix_maison)
+PROPRIETES_DEFAUT = {
+    # Marron (2 propriétés)
+    1: ("Boulevard de Belleville", 60, 2, "marron", 50),
+    3: ("Rue Lecourbe", 60, 4, "marron", 50),
+    # Bleu clair (3 propriétés)
+    6: ("Rue de Vaugirard", 100, 6, "bleu_clair", 50),
+    8: ("Rue de Courcelles", 100, 6, "bleu_clair", 50),
+    9: ("Avenue de la République", 120, 8, "bleu_clair", 50),
+    # Rose (3 propriétés)
+    11: ("Boulevard de la Villette", 140, 10, "rose", 100),
+    13: ("Avenue de Neuilly", 140, 10, "rose", 100),
+    14: ("Rue du Paradis", 160, 12, "rose", 100),
+    # Orange (3 propriétés)
+    16: ("Avenue Mozart", 180, 14, "orange", 100),
+    18: ("Boulevard Saint-Michel", 180, 14, "orange", 100),
+    19: ("Place Pigalle", 200, 16, "orange", 100),
+    # Rouge (3 propriétés)
+    21: ("Avenue Matignon", 220, 18, "rouge", 150),
+    23: ("Boulevard Malesherbes", 220, 18, "rouge", 150),
+    24: ("Avenue Henri-Martin", 240, 20, "rouge", 150),
+    # Jaune (3 propriétés)
+    26: ("Faubourg Saint-Honoré", 260, 22, "jaune", 150),
+    27: ("Place de la Bourse", 260, 22, "jaune", 150),
+    29: ("Rue La Fayette", 280, 24, "jaune", 150),
+    # Vert (3 propriétés)
+    31: ("Avenue de Breteuil", 300, 26, "vert", 200),
+    32: ("Avenue Foch", 300, 26, "vert", 200),
+    34: ("Boulevard des Capucines", 320, 28, "vert", 200),
+    # Bleu foncé (2 propriétés)
+    37: ("Avenue des Champs-Élysées", 350, 35, "bleu_fonce", 200),
+    39: ("Rue de la Paix", 400, 50, "bleu_fonce", 200),
+}
+
+GARES_DEFAUT = {5: "Gare Montparnasse", 15: "Gare de Lyon", 25: "Gare du Nord", 35: "Gare Saint-Lazare"}
+COMPAGNIES_DEFAUT = {12: "Compagnie d'Électricité", 28: "Compagnie des Eaux"}
+
+# Cases spéciales fixes : position -> (nom, type_case)
+CASES_SPECIALES = {
+    0: ("Départ", "depart"),
+    2: ("Caisse Com.", "caisse"),
+    4: ("Impôts", "taxe"),
+    7: ("Chance", "chance"),
+    10: ("Prison", "prison"),
+    17: ("Caisse Com.", "caisse"),
+    20: ("Parc", "parc"),
+    22: ("Chance", "chance"),
+    30: ("Allez Prison", "allez_prison"),
+    33: ("Caisse Com.", "caisse"),
+    36: ("Chance", "chance"),
+    38: ("Taxe Luxe", "taxe"),
+}
+
+
+def couleur_quartier(d: 'DefinitionCase') -> Optional[str]:
+    """Couleur de quartier de la case, telle que portée par l'objet Propriete"""
+    if d.type_case == "propriete":
+        return d.couleur
+    if d.type_case == "gare":
+        return "gare"
+    if d.type_case == "compagnie":
+        return "Compagnie"
+    return None
+
+
+class DefinitionCase(NamedTuple):
+    """Données immuables d'une case (forme d'une ligne de v_proprietes)"""
+    position: int
+    nom: str
+    type_case: str
+    prix: int = 0
+    loyer: int = 0
+    couleur: str = ""
+    prix_maison: int = 0
+
+
+class Regles:
+    """Règles officielles facultatives, choisies pour chaque partie ou simulation
+
+    Par défaut aucune n'est appliquée (règles historiques du moteur) :
+    - limite_maisons, limite_hotels : stock de la banque (None : illimité) ;
+    - construction_uniforme : on ne bâtit que sur les terrains les moins bâtis du quartier ;
+    - hypotheques : un joueur à court d'argent hypothèque ses terrains avant la faillite,
+      pas de loyer sur un terrain hypothéqué ni de construction dans son quartier.
+    """
+    __slots__ = ("limite_maisons", "limite_hotels", "construction_uniforme", "hypotheques")
+    # Format binaire (journaux, instantanés) : limites (0xFFFF = illimité) puis drapeaux
+    _BINAIRE = struct.Struct("<HHB")
+    _ILLIMITE = 0xFFFF
+
+    def __init__(self, limite_maisons: Optional[int] = None, limite_hotels: Optional[int] = None,
+                 construction_uniforme: bool = False, hypotheques: bool = False):
+        self.limite_maisons = limite_maisons
+        self.limite_hotels = limite_hotels
+        self.construction_uniforme = construction_uniforme
+        self.hypotheques = hypotheques
+
+    @classmethod
+    def officielles(cls) -> 'Regles':
+        """32 maisons et 12 hôtels à la banque, construction uniforme et hypothèques"""
+        return cls(32, 12, True, True)
+
+    def __repr__(self):
+        return (f"Regles(limite_maisons={self.limite_maisons}, limite_hotels={self.limite_hotels}, "
+                f"construction_uniforme={self.construction_uniforme}, hypotheques={self.hypotheques})")
+
+    def binaire(self) -> bytes:
+        illimite = self._ILLIMITE
+        return self._BINAIRE.pack(illimite if self.limite_maisons is None else self.limite_maisons,
+                                  illimite if self.limite_hotels is None else self.limite_hotels,
+                                  self.construction_uniforme | self.hypotheques << 1)
+
+    @classmethod
+    def depuis_binaire(cls, donnees: bytes, debut: int = 0) -> 'Regles':
+        """Règles lues par binaire() (REGLES_HISTORIQUES si aucune n'est active)"""
+        maisons, hotels, drapeaux = cls._BINAIRE.unpack_from(donnees, debut)
+        regles = cls(None if maisons == cls._ILLIMITE else maisons, None if hotels == cls._ILLIMITE else hotels,
+                     bool(drapeaux & 1), bool(drapeaux & 2))
+        return REGLES_HISTORIQUES if regles.binaire() == REGLES_HISTORIQUES.binaire() else regles
+
+
+REGLES_HISTORIQUES = Regles()
+
+
+class EtatPlateau:
+    """État mutable d'une partie : propriétaire, maisons et hôtel de chaque case
+
+    Les compteurs (constructions posées, niveau de chaque quartier) et le masque des
+    hypothèques sont tenus à jour par Propriete : les règles se vérifient en O(1).
+    """
+    __slots__ = ("proprietaires", "maisons", "hotels", "joueurs", "joueurs_fixes", "hypotheques", "maisons_posees",
+                 "hotels_poses", "niveaux", "masques", "tailles", "regles")
+    # Modèle copié à chaque partie (-1 = case à la banque)
+    _PROPRIETAIRES_VIDES = array('b', [-1] * 40)
+
+    def __init__(self, joueurs: Optional[List['Joueur']] = None):
+        self.proprietaires = array('b', self._PROPRIETAIRES_VIDES)
+        self.maisons = bytearray(40)
+        self.hotels = bytearray(40)
+        # Les indices de propriétaires se réfèrent à cette liste (fixée pour une partie,
+        # complétée au besoin pour des propriétés créées hors partie)
+        self.joueurs: List['Joueur'] = joueurs if joueurs is not None else []
+        self.joueurs_fixes = joueurs is not None
+        # Un bit par position hypothéquée
+        self.hypotheques = 0
+        # Constructions sorties de la banque et niveau de chaque quartier (somme des
+        # maisons, un hôtel comptant pour 5)
+        self.maisons_posees = 0
+        self.hotels_poses = 0
+        self.niveaux: Dict[str, int] = {}
+        # Masque des positions et taille de chaque quartier (partagés, voir DefinitionPlateau)
+        self.masques: Dict[str, int] = {}
+        self.tailles: Dict[str, int] = {}
+        self.regles = REGLES_HISTORIQUES
+
+    def recompter(self, couleurs: Tuple[Optional[str], ...]):
+        """Recalcule les compteurs depuis les tableaux (après une restauration)"""
+        self.maisons_posees = sum(self.maisons)
+        self.hotels_poses = sum(self.hotels)
+        self.niveaux = {}
+        for position, couleur in enumerate(couleurs):
+            niveau = 5 if self.hotels[position] else self.maisons[position]
+            if niveau:
+                self.niveaux[couleur] = self.niveaux.get(couleur, 0) + niveau
+
+    def attacher(self, joueurs: List['Joueur']):
+        """Lie l'état aux joueurs d'une partie (aucun autre joueur accepté ensuite)"""
+        self.joueurs = joueurs
+        self.joueurs_fixes = True
+
+    def indice_joueur(self, joueur: 'Joueur') -> int:
+        """Indice du joueur dans la partie (ajouté s'il est inconnu, hors partie)"""
+        for i, j in enumerate(self.joueurs):
+            if j is joueur:
+                return i
+        if self.joueurs_fixes:
+            raise ValueError(f"{joueur.nom} ne joue pas dans cette partie")
+        self.joueurs.append(joueur)
+        return len(self.joueurs) - 1
+
+
+class DefinitionPlateau:
+    """Description immuable du plateau, construite une fois et partagée par les parties"""
+    # Plateau standard (BDD ou plateau par défaut), construit au premier besoin
+    _standard: Optional['DefinitionPlateau'] = None
+    # Source du plateau standard (voir utiliser_source)
+    source: SourcePlateau = SourceSQL()
+
+    def __init__(self, proprietes: List[DefinitionCase]):
+        cases: List[Optional[DefinitionCase]] = [None] * 40
+        
+        # 1. Propriétés chargées (BDD)
+        for d in proprietes:
+            if 0 <= d.position < 40:
+                cases[d.position] = d
+        
+        # 2. Remplir les trous : cases spéciales fixes, sinon propriétés par défaut
+        for i in range(40):
+            if cases[i] is None:
+                if i in CASES_SPECIALES:
+                    nom, type_case = CASES_SPECIALES[i]
+                    cases[i] = DefinitionCase(i, nom, type_case)
+                else:
+                    cases[i] = self._definition_defaut(i)
+        
+        self.cases: Tuple[DefinitionCase, ...] = tuple(cases)
+        # Index des quartiers : couleur -> positions (gares et compagnies comprises)
+        self.quartiers: Dict[str, Tuple[int, ...]] = {}
+        for d in self.cases:
+            couleur = couleur_quartier(d)
+            if couleur is not None:
+                self.quartiers[couleur] = self.quartiers.get(couleur, ()) + (d.position,)
+        self.tailles_quartiers: Dict[str, int] = {c: len(p) for c, p in self.quartiers.items()}
+        self.masques_quartiers: Dict[str, int] = {c: sum(1 << p for p in positions)
+                                                  for c, positions in self.quartiers.items()}
+        # Quartier de chaque position (None pour les cases spéciales)
+        self.couleurs: Tuple[Optional[str], ...] = tuple(couleur_quartier(d) for d in self.cases)
+        # Code du type de chaque position (TYPE_*)
+        self.types: Tuple[int, ...] = tuple(CODE_TYPE[d.type_case] for d in self.cases)
+        # Positions des propriétés, gares et compagnies (cases rattachées à l'état d'une partie)
+        self.positions_proprietes: Tuple[int, ...] = tuple(
+            position for position, code in enumerate(self.types) if code <= TYPE_COMPAGNIE)
+        # Les cases spéciales n'ont pas d'état : instances partagées par toutes les parties
+        self.cases_speciales: Tuple[Optional['CaseSpeciale'], ...] = tuple(
+            CaseSpeciale(d.nom, d.position, d.type_case)
+            if d.type_case not in ("propriete", "gare", "compagnie") else None
+            for d in self.cases)
+        # Revenus attendus, calculés au premier besoin (TableRevenus.pour_plateau)
+        self.table_revenus: Optional['TableRevenus'] = None
+        # Cases rendues par des parties terminées (Plateau.liberer), reprises par les suivantes
+        self.cases_libres: List[List['Case']] = []
+
+    @classmethod
+    def standard(cls, journal: Journal = JOURNAL_CONSOLE) -> 'DefinitionPlateau':
+        """Plateau standard, construit une seule fois par processus depuis `source`"""
+        if cls._standard is None:
+            cls._standard = cls(cls.source.charger(journal))
+        return cls._standard
+
+    @classmethod
+    def utiliser_source(cls, source: SourcePlateau):
+        """Change la source du plateau standard (reconstruit au prochain appel)"""
+        cls.source = source
+        cls._standard = None
+
+    @staticmethod
+    def _definition_defaut(position: int) -> DefinitionCase:
+        """Définition par défaut avec des prix réalistes selon la position"""
+        if position in PROPRIETES_DEFAUT:
+            nom, prix, loyer, couleur, prix_maison = PROPRIETES_DEFAUT[position]
+            return DefinitionCase(position, nom, "propriete", prix, loyer, couleur, prix_maison)
+        if position in GARES_DEFAUT:
+            return DefinitionCase(position, GARES_DEFAUT[position], "gare", 200, 25, "gare")
+        if position in COMPAGNIES_DEFAUT:
+            return DefinitionCase(position, COMPAGNIES_DEFAUT[position], "compagnie", 150, 0, "Compagnie")
+        # Fallback
+        return DefinitionCase(position, f"Rue {position}", "propriete", 100, 10, "gris", 50)
+
+
+# Tailles des quartiers du plateau par défaut (joueurs créés hors d'une partie)
+TAILLES_QUARTIERS_DEFAUT: Dict[str, int] = DefinitionPlateau([]).tailles_quartiers
+
+
 class Plateau:
-    def __init__(self):
+    def __init__(self, journal: Journal = JOURNAL_CONSOLE, definition: Optional[DefinitionPlateau] = None):
+        self.journal = journal
+        self.definition = definition if definition else DefinitionPlateau.standard(journal)
+        # État propre à cette partie : rien n'est partagé avec les autres plateaux
+        self.etat = EtatPlateau()
+        self.etat.masques = self.definition.masques_quartiers
+        self.etat.tailles = self.definition.tailles_quartiers
         self.cases: List[Case] = []
+        # Action de chaque position, appelée par le moteur avec (joueur, jeu) : l'arrivée
+        # sur une case est un seul appel indexé (MonopolyIA y installe ses propres actions)
+        self.actions: List = []
         self._creer_plateau()
     
     def _creer_plateau(self):
+        """Associe la définition partagée à l'état de cette partie
+
+        Les cases spéciales sont partagées. Les propriétés, gares et compagnies lisent
+        l'état de la partie : celles d'une partie rendue (liberer) sont rattachées au
+        nouvel état, et démarrer la partie revient à copier les tableaux d'état ; sinon
+        elles sont créées.
+        """
+        etat = self.etat
+        definition = self.definition
+        if definition.cases_libres:
+            self.cases = definition.cases_libres.pop()
+            for position in definition.positions_proprietes:
+                self.cases[position]._etat = etat
+            for position in definition.quartiers.get("Compagnie", ()):
+                self.cases[position].dernier_lancer = 0
+            self.actions = [case.action for case in self.cases]
+            return
         self.cases = [None] * 40
-        
-        # 1. Charger depuis la BDD
-        props = DB.get_proprietes()
-        for p in props:
-            if 0 <= p.position < 40:
-                self.cases[p.position] = p
-        
-        # 2. Remplir les cases spéciales (fixes)
-        if not self.cases[0]: self.cases[0] = CaseSpeciale("Départ", 0, "depart")
-        if not self.cases[4]: self.cases[4] = CaseSpeciale("Impôts", 4, "taxe")
-        if not self.cases[10]: self.cases[10] = CaseSpeciale("Prison", 10, "prison")
-        if not self.cases[20]: self.cases[20] = CaseSpeciale("Parc", 20, "parc")
-        if not self.cases[30]: self.cases[30] = CaseSpeciale("Allez Prison", 30, "allez_prison")
-        if not self.cases[38]: self.cases[38] = CaseSpeciale("Taxe Luxe", 38, "taxe")
-
-        # 3. Remplir les trous restants (Chance, Caisse, ou secours si pas de BDD)
-        for i in range(40):
-            if self.cases[i] is None:
-                if i in [2, 17, 33]:
-                    self.cases[i] = CaseSpeciale("Caisse Com.", i, "caisse")
-                elif i in [7, 22, 36]:
-                    self.cases[i] = CaseSpeciale("Chance", i, "chance")
-                else:
-                    # Propriétés par défaut avec prix réalistes (si BDD vide)
-                    self._creer_propriete_defaut(i)
+        for d in definition.cases:
+            speciale = definition.cases_speciales[d.position]
+            if speciale is not None:
+                self.cases[d.position] = speciale
+            elif d.type_case == "gare":
+                self.cases[d.position] = Gare(d.nom, d.position, etat)
+            elif d.type_case == "compagnie":
+                self.cases[d.position] = Compagnie(d.nom, d.position, etat)
+            else:
+                self.cases[d.position] = Propriete(d.nom, d.position, d.prix, d.loyer,
+                                                   d.couleur, d.prix_maison, etat)
+        self.actions = [case.action for case in self.cases]
+
+    def liberer(self):
+        """Rend les cases à la définition pour la prochaine partie (boucles de simulation)
+
+        À n'appeler qu'une fois les résultats de la partie relevés : ses propriétés
+        lisent ensuite l'état de la partie qui les reprend.
+        """
+        if self.cases:
+            self.definition.cases_libres.append(self.cases)
+            self.cases, self.actions = [], []
 
     def get_case(self, position: int) -> Case:
         return self.cases[position % 40]
-    
-    def _creer_propriete_defaut(self, position: int):
-        """Crée une propriété par défaut avec des prix réalistes selon la position"""
-        # Propriétés du Monopoly français (simplifié)
-        proprietes_defaut = {
-            # Marron (2 propriétés)
-            1: ("Boulevard de Belleville", 60, 2, "marron", 50),
-            3: ("Rue Lecourbe", 60, 4, "marron", 50),
-            # Gares
-            5: None,  # Gare - déjà gérée
-            15: None,
-            25: None,
-            35: None,
-            # Bleu clair (3 propriétés)
-            6: ("Rue de Vaugirard", 100, 6, "bleu_clair", 50),
-            8: ("Rue de Courcelles", 100, 6, "bleu_clair", 50),
-            9: ("Avenue de la République", 120, 8, "bleu_clair", 50),
-            # Rose (3 propriétés)
-            11: ("Boulevard de la Villette", 140, 10, "rose", 100),
-            13: ("Avenue de Neuilly", 140, 10, "rose", 100),
-            14: ("Rue du Paradis", 160, 12, "rose", 100),
-            # Compagnies
-            12: None,  # Compagnie - déjà gérée
-            28: None,
-            # Orange (3 propriétés)
-            16: ("Avenue Mozart", 180, 14, "orange", 100),
-            18: ("Boulevard Saint-Michel", 180, 14, "orange", 100),
-            19: ("Place Pigalle", 200, 16, "orange", 100),
-            # Rouge (3 propriétés)
-            21: ("Avenue Matignon", 220, 18, "rouge", 150),
-            23: ("Boulevard Malesherbes", 220, 18, "rouge", 150),
-            24: ("Avenue Henri-Martin", 240, 20, "rouge", 150),
-            # Jaune (3 propriétés)
-            26: ("Faubourg Saint-Honoré", 260, 22, "jaune", 150),
-            27: ("Place de la Bourse", 260, 22, "jaune", 150),
-            29: ("Rue La Fayette", 280, 24, "jaune", 150),
-            # Vert (3 propriétés)
-            31: ("Avenue de Breteuil", 300, 26, "vert", 200),
-            32: ("Avenue Foch", 300, 26, "vert", 200),
-            34: ("Boulevard des Capucines", 320, 28, "vert", 200),
-            # Bleu foncé (2 propriétés)
-            37: ("Avenue des Champs-Élysées", 350, 35, "bleu_fonce", 200),
-            39: ("Rue de la Paix", 400, 50, "bleu_fonce", 200),
-        }
-        
-        if position in proprietes_defaut and proprietes_defaut[position]:
-            nom, prix, loyer, couleur, prix_maison = proprietes_defaut[position]
-            self.cases[position] = Propriete(nom, position, prix, loyer, couleur, prix_maison)
-        elif position == 5:
-            self.cases[position] = Gare("Gare Montparnasse", 5)
-        elif position == 15:
-            self.cases[position] = Gare("Gare de Lyon", 15)
-        elif position == 25:
-            self.cases[position] = Gare("Gare du Nord", 25)
-        elif position == 35:
-            self.cases[position] = Gare("Gare Saint-Lazare", 35)
-        elif position == 12:
-            self.cases[position] = Compagnie("Compagnie d'Électricité", 12)
-        elif position == 28:
-            self.cases[position] = Compagnie("Compagnie des Eaux", 28)
-        else:
-            # Fallback
-            self.cases[position] = Propriete(f"Rue {position}", position, 100, 10, "gris", 50)
+
+class ArretAnticipe:
+    """Fin de partie anticipée : l'issue est acquise quand un même joueur détient au
+    moins `seuil` du patrimoine total pendant `nb_tours` tours consécutifs
+
+    Le patrimoine est contrôlé tous les `pas` tours (à chaque tour par défaut : le
+    patrimoine des joueurs est tenu à jour à chaque transaction).
+    """
+    __slots__ = ("seuil", "nb_tours", "pas")
+
+    def __init__(self, seuil: float = 0.75, nb_tours: int = 10, pas: int = 1):
+        self.seuil = seuil
+        self.nb_tours = nb_tours
+        self.pas = pas
+
+    def meneur(self, jeu: 'Monopoly') -> Tuple[Optional['Joueur'], float]:
+        """Joueur au-dessus du seuil (ou None) et sa part du patrimoine"""
+        patrimoines = [j.patrimoine() for j in jeu.joueurs]
+        total = sum(patrimoines)
+        meilleur = max(range(len(patrimoines)), key=patrimoines.__getitem__)
+        part = patrimoines[meilleur] / total if total else 0.0
+        return (jeu.joueurs[meilleur] if part >= self.seuil else None), part
+
 
 class Monopoly:
-    def __init__(self, noms_joueurs: List[str]):
-        self.plateau = Plateau()
-        self.joueurs = [Joueur(nom) for nom in noms_joueurs]
+    def __init__(self, noms_joueurs: List[str], journal: Optional[Journal] = None,
+                 rng: Optional[FluxAleatoire] = None, regles: Optional[Regles] = None):
+        # Journal des événements (console par défaut, JournalSilencieux pour les simulations)
+        self.journal = journal if journal else JournalConsole()
+        # Flux aléatoire de la partie (dés et cartes) : une graine reproduit toute la partie
+        self.rng = rng if rng else FluxAleatoire()
+        # Règles facultatives (stock de la banque, hypothèques, construction uniforme)
+        self.regles = regles if regles else REGLES_HISTORIQUES
+        self.plateau = Plateau(self.journal)
+        if Profileur._parties is not None:
+            # Créée pendant un profilage : sa table d'actions sera réinstallée à la sortie
+            Profileur._parties.add(self)
+        self.joueurs = [Joueur(nom, journal=self.journal) for nom in noms_joueurs]
+        self.plateau.etat.attacher(self.joueurs)
+        self.plateau.etat.regles = self.regles
+        if self.regles is not REGLES_HISTORIQUES:
+            self.journal.emettre("regles", self.regles)
+        for j in self.joueurs:
+            j.tailles_quartiers = self.plateau.definition.tailles_quartiers
         self.joueur_actuel_index = 0
-        self.cartes_chance = PaquetCartes("chance")
-        self.cartes_communaute = PaquetCartes("communaute")
+        self.cartes_chance = PaquetCartes("chance", self.rng)
+        self.cartes_communaute = PaquetCartes("communaute", self.rng)
         self.tour_numero = 0
         self.derniers_des = (0, 0)
+        # Arrêt anticipé (ArretAnticipe) : meneur courant et nombre de tours consécutifs en tête
+        self.meneur: Optional[Joueur] = None
+        self.tours_en_tete = 0
+        self.issue_acquise = False
+    
+    def _installer_actions(self):
+        """(Re)construit la table d'actions du plateau à partir des méthodes courantes"""
+        self.plateau.actions = [case.action for case in self.plateau.cases]
+    
+    def liberer(self):
+        """Partie terminée et relevée : ses cases servent à la prochaine partie créée
+        (la partie n'est plus jouable ensuite)"""
+        self.plateau.liberer()
+    
+    # Instantané binaire : en-tête de partie, puis par joueur son état et ses propriétés
+    _ENTETE_INSTANTANE = struct.Struct("<4sBHBBB")
+    _JOUEUR_INSTANTANE = struct.Struct("<iB?B?BBB")
+    _VERSION_INSTANTANE = b"MNP4"
+
+    def instantane(self) -> bytes:
+        """État complet de la partie (joueurs, plateau, pioches, flux aléatoire) en ~3 ko
+        
+        À restaurer dans une partie créée avec les mêmes joueurs (même processus ou non).
+        """
+        morceaux = [self._ENTETE_INSTANTANE.pack(self._VERSION_INSTANTANE, len(self.joueurs), self.tour_numero,
+                                                 self.joueur_actuel_index, *self.derniers_des),
+                     self.regles.binaire()]
+        for j in self.joueurs:
+            morceaux.append(self._JOUEUR_INSTANTANE.pack(
+                j.argent, j.position, j.en_prison, j.tours_en_prison, j.est_en_faillite,
+                j.doubles_consecutifs, j.cartes_liberte, len(j.proprietes)))
+            morceaux.append(bytes(p.position for p in j.proprietes))
+        etat = self.plateau.etat
+        morceaux += [etat.proprietaires.tobytes(), bytes(etat.maisons), bytes(etat.hotels),
+                     struct.pack("<Q", etat.hypotheques)]
+        morceaux.append(bytes(self.plateau.cases[p].dernier_lancer
+                              for p in self.plateau.definition.quartiers.get("Compagnie", ())))
+        morceaux += [self.cartes_chance.instantane(), self.cartes_communaute.instantane(),
+                     self.rng.etat_binaire()]
+        return b"".join(morceaux)
+
+    def restaurer(self, donnees: bytes) -> int:
+        """Remet la partie dans l'état d'un instantané ; retourne la position de fin"""
+        version, nb_joueurs, tour, actuel, d1, d2 = self._ENTETE_INSTANTANE.unpack_from(donnees, 0)
+        if version != self._VERSION_INSTANTANE or nb_joueurs != len(self.joueurs):
+            raise ValueError("Instantané incompatible avec cette partie")
+        i = self._ENTETE_INSTANTANE.size
+        self.regles = self.plateau.etat.regles = Regles.depuis_binaire(donnees, i)
+        i += Regles._BINAIRE.size
+        cases = self.plateau.cases
+        for j in self.joueurs:
+            (j.argent, j.position, j.en_prison, j.tours_en_prison, j.est_en_faillite,
+             j.doubles_consecutifs, j.cartes_liberte, n) = self._JOUEUR_INSTANTANE.unpack_from(donnees, i)
+            i += self._JOUEUR_INSTANTANE.size
+            j.proprietes = [cases[p] for p in donnees[i:i + n]]
+            j.quartiers = {}
+            j.valeur_biens = 0
+            i += n
+        
+        etat = self.plateau.etat
+        etat.proprietaires[:] = array('b', donnees[i:i + 40])
+        etat.maisons[:] = donnees[i + 40:i + 80]
+        etat.hotels[:] = donnees[i + 80:i + 120]
+        (etat.hypotheques,) = struct.unpack_from("<Q", donnees, i + 120)
+        etat.recompter(self.plateau.definition.couleurs)
+        i += 128
+        for p in self.plateau.definition.quartiers.get("Compagnie", ()):
+            cases[p].dernier_lancer = donnees[i]
+            i += 1
+        i = self.cartes_chance.restaurer(donnees, i)
+        i = self.cartes_communaute.restaurer(donnees, i)
+        i = self.rng.restaurer_binaire(donnees, i)
+        
+        # Compteurs de quartiers et valeur des biens reconstruits depuis les propriétaires
+        couleurs = self.plateau.definition.couleurs
+        for position, k in enumerate(etat.proprietaires):
+            if k >= 0:
+                joueur = self.joueurs[k]
+                joueur.quartiers[couleurs[position]] = joueur.quartiers.get(couleurs[position], 0) + 1
+                joueur.valeur_biens += cases[position].valeur()
+        self.tour_numero, self.joueur_actuel_index, self.derniers_des = tour, actuel, (d1, d2)
+        return i
     
     def lancer_des(self) -> tuple:
-        d1 = random.randint(1, 6)
-        d2 = random.randint(1, 6)
+        d1, d2 = self.rng.lancer_des()
         self.derniers_des = (d1, d2)
         return d1, d2
     
     def _gerer_prison(self, joueur: Joueur):
         """Logique de sortie de prison (3 options)"""
-        print(f"--- Prison : {joueur.nom} (Tour {joueur.tours_en_prison+1}/3) ---")
+        journal = self.journal
+        journal.emettre("prison_tour", joueur.nom, joueur.tours_en_prison + 1)
         
         # 1. Carte
         if joueur.cartes_liberte > 0:
-            print("Utilise une carte Sortie de Prison.")
+            journal.emettre("prison_carte")
             joueur.cartes_liberte -= 1
             joueur.sortir_de_prison()
             return
 
         # 2. Payer 50€ (si riche)
         if joueur.argent > 1000:
-            print("Paie 50€ pour sortir.")
+            journal.emettre("prison_paie")
             joueur.payer(50)
             joueur.sortir_de_prison()
             return
             
         # 3. Essai dés
         d1, d2 = self.lancer_des()
-        print(f"Dés prison: {d1}, {d2}")
+        journal.emettre("prison_des", d1, d2)
         if d1 == d2:
-            print("Double ! Sortie.")
+            journal.emettre("prison_double")
             joueur.sortir_de_prison()
             joueur.deplacer(d1+d2)
-            self.plateau.get_case(joueur.position).action(joueur, self)
+            self.plateau.actions[joueur.position](joueur, self)
             return
         
         joueur.tours_en_prison += 1
         if joueur.tours_en_prison >= 3:
-            print("3 tours : Sortie forcée (-50€).")
+            journal.emettre("prison_forcee")
             joueur.payer(50)
             joueur.sortir_de_prison()
             joueur.deplacer(d1+d2)
-            self.plateau.get_case(joueur.position).action(joueur, self)
+            self.plateau.actions[joueur.position](joueur, self)
 
     def jouer_tour(self, joueur: Joueur):
-        print(f"\n--- Tour {self.tour_numero} : {joueur.nom} ({joueur.argent}€) ---")
+        journal = self.journal
+        journal.emettre("debut_tour", self.tour_numero, joueur.nom, joueur.argent)
         
         if joueur.en_prison:
             self._gerer_prison(joueur)
             if joueur.en_prison: return # Encore en prison
 
         d1, d2 = self.lancer_des()
-        print(f"Lancer : {d1} + {d2} = {d1+d2}")
+        journal.emettre("des", d1, d2, d1 + d2)
         
         # Règle des 3 doubles
         if d1 == d2:
             joueur.doubles_consecutifs += 1
             if joueur.doubles_consecutifs == 3:
-                print("3 Doubles -> Prison !")
+                journal.emettre("trois_doubles")
                 joueur.aller_en_prison()
                 return
         else:
             joueur.doubles_consecutifs = 0
             
         joueur.deplacer(d1 + d2)
-        case = self.plateau.get_case(joueur.position)
-        case.action(joueur, self)
+        self.plateau.actions[joueur.position](joueur, self)
     
     def partie_terminee(self) -> bool:
         actifs = sum(1 for j in self.joueurs if not j.est_en_faillite)
         return actifs <= 1
     
+    def _verifier_issue(self, arret: 'ArretAnticipe') -> bool:
+        """Fin de tour : vrai quand la partie est jouée d'avance (voir ArretAnticipe)"""
+        if self.tour_numero % arret.pas:
+            return False
+        meneur, part = arret.meneur(self)
+        if meneur is not None and meneur is self.meneur:
+            self.tours_en_tete += arret.pas
+        else:
+            self.tours_en_tete = arret.pas if meneur is not None else 0
+        self.meneur = meneur
+        if self.tours_en_tete >= arret.nb_tours:
+            self.issue_acquise = True
+            self.journal.emettre("issue_acquise", meneur.nom, part, self.tours_en_tete)
+        return self.issue_acquise
+
     def obtenir_gagnant(self) -> Optional[Joueur]:
-        for j in self.joueurs:
-            if not j.est_en_faillite: return j
-        return None
+        """Dernier joueur en lice ; à la limite de tours, le plus gros patrimoine"""
+        if self.issue_acquise:
+            return self.meneur
+        actifs = [j for j in self.joueurs if not j.est_en_faillite]
+        return max(actifs, key=Joueur.patrimoine) if actifs else None
+
+    def classement(self) -> List[Joueur]:
+        """Joueurs du premier au dernier : en lice par patrimoine, puis faillis"""
+        return sorted(self.joueurs, key=lambda j: (not j.est_en_faillite, j.patrimoine()), reverse=True)
     
-    def jouer_partie(self, max_tours: int = 200):
-        """Joue une partie complète de Monopoly (Séance 3)"""
-        print("=== DÉBUT PARTIE ===")
+    def jouer_partie(self, max_tours: int = 200, arret: Optional[ArretAnticipe] = None):
+        """Joue une partie complète de Monopoly (Séance 3)
+        
+        Avec `arret`, la partie s'arrête dès que son issue est acquise ; le meneur
+        est alors déclaré gagnant.
+        """
+        self.journal.emettre("debut_partie")
+        self.meneur, self.tours_en_tete, self.issue_acquise = None, 0, False
         while not self.partie_terminee() and self.tour_numero < max_tours:
             self.tour_numero += 1
             for j in self.joueurs:
@@ -621,6 +1712,8 @@ class Monopoly:
             # Afficher un résumé tous les 25 tours (Séance 3)
             if self.tour_numero % 25 == 0:
                 self._afficher_resume_tour()
+            if arret and self._verifier_issue(arret):
+                break
         
         # Afficher le résultat final
         self._afficher_resultat_final()
@@ -628,31 +1721,36 @@ class Monopoly:
     
     def _afficher_resume_tour(self):
         """Affiche un résumé de la situation (Séance 3)"""
-        print(f"\n--- RÉSUMÉ TOUR {self.tour_numero} ---")
+        journal = self.journal
+        if not journal.actif:
+            return
+        journal.emettre("resume_tour", self.tour_numero)
         for j in self.joueurs:
-            statut = "FAILLITE" if j.est_en_faillite else f"{j.argent}€, {len(j.proprietes)} props"
-            print(f"  {j.nom}: {statut}")
+            if j.est_en_faillite:
+                journal.emettre("resume_joueur_faillite", j.nom)
+            else:
+                journal.emettre("resume_joueur", j.nom, j.argent, len(j.proprietes))
     
-    def _afficher_resultat_final(self):
+    def _afficher_resultat_final(self, detail_proprietes: bool = True):
         """Affiche le résultat final de la partie (Séance 3)"""
-        print("\n" + "=" * 50)
-        print("RÉSULTAT FINAL")
-        print("=" * 50)
+        journal = self.journal
+        if not journal.actif:
+            return
+        journal.emettre("resultat_final")
         
         gagnant = self.obtenir_gagnant()
         if gagnant:
-            print(f"\nGAGNANT: {gagnant.nom} avec {gagnant.argent}€")
-            print(f"Propriétés: {len(gagnant.proprietes)}")
-            for p in gagnant.proprietes:
-                print(f"  - {p.nom}")
+            journal.emettre("gagnant", gagnant.nom, gagnant.argent)
+            journal.emettre("gagnant_proprietes", len(gagnant.proprietes))
+            if detail_proprietes:
+                for p in gagnant.proprietes:
+                    journal.emettre("gagnant_propriete", p.nom)
         else:
-            print(f"\nLimite de {self.tour_numero} tours atteinte")
-            # Classement par argent
-            joueurs_tries = sorted(self.joueurs, key=lambda x: x.argent, reverse=True)
-            print("\nClassement:")
-            for i, j in enumerate(joueurs_tries, 1):
+            journal.emettre("limite_tours", self.tour_numero)
+            journal.emettre("classement")
+            for i, j in enumerate(self.classement(), 1):
                 statut = "(FAILLITE)" if j.est_en_faillite else ""
-                print(f"  {i}. {j.nom}: {j.argent}€ {statut}")
+                journal.emettre("classement_ligne", i, j.nom, j.patrimoine(), statut)
 
 # =============================================================================
 # EXECUTION
@@ -675,6 +1773,14 @@ class StrategieIA:
         """Décide où construire"""
         return None
 
+    def decider_levee_hypotheque(self, joueur: 'Joueur', propriete: Propriete) -> bool:
+        """Décide de rembourser l'hypothèque du terrain où l'on s'arrête"""
+        return joueur.argent >= 500 + propriete.prix
+
+    def preparer(self, jeu: 'Monopoly'):
+        """Appelé par la partie qui utilise la stratégie (rien à faire par défaut)"""
+        pass
+
 
 class IAAgressive(StrategieIA):
     """Achète systématiquement toutes les propriétés"""
@@ -702,8 +1808,16 @@ class IAConservative(StrategieIA):
 
 class IAStrategique(StrategieIA):
     """Privilégie les quartiers et propriétés rentables"""
-    def __init__(self):
+    def __init__(self, table: Optional['TableRevenus'] = None):
         super().__init__("Stratégique")
+        # Revenus attendus par case (calculés au premier besoin sur le plateau standard)
+        self._table = table
+    
+    @property
+    def table(self) -> 'TableRevenus':
+        if self._table is None:
+            self._table = TableRevenus.pour_plateau()
+        return self._table
     
     def decider_achat(self, joueur: 'Joueur', propriete: Propriete) -> bool:
         # Ne pas dépenser si trop peu d'argent (moins de 1,5 x le prix d'achat)
@@ -711,8 +1825,7 @@ class IAStrategique(StrategieIA):
             return False
         
         # Compter combien de propriétés de cette couleur possédées
-        nb_possede = sum(1 for p in joueur.proprietes 
-                        if hasattr(p, 'couleur') and p.couleur == propriete.couleur)
+        nb_possede = joueur.quartiers.get(propriete.couleur, 0)
         
         # On achete si ça rapproche d'un quartier complet (déjà au moins 1 de cette couleur)
         if nb_possede >= 1:
@@ -722,7 +1835,8 @@ class IAStrategique(StrategieIA):
         if joueur.argent >= propriete.prix * 3:
             return True
         
-        return False
+        # Ou si le loyer attendu par euro investi est au-dessus de la médiane du plateau
+        return self.table.rentabilite_achat(propriete.position) >= self.table.rentabilite_mediane
     
     def decider_construction(self, joueur: 'Joueur') -> Optional[Propriete]:
         """Décide sur quelle propriété construire"""
@@ -735,22 +1849,19 @@ class IAStrategique(StrategieIA):
         # Chercher la propriété avec le meilleur ROI (retour sur investissement)
         meilleure = None
         meilleur_roi = 0
+        table = self.table
         
         for couleur, proprietes in quartiers.items():
             for prop in proprietes:
                 # Vérifier si on peut construire
-                if prop.nb_maisons < 4 and not prop.a_hotel and joueur.argent >= prop.prix_maison:
-                    # Calculer le retour sur investissement
-                    loyer_actuel = prop.calculer_loyer()
-                    prop.nb_maisons += 1  # Simulation
-                    loyer_futur = prop.calculer_loyer()
-                    prop.nb_maisons -= 1  # Annuler la simulation
-                    
-                    if prop.prix_maison > 0:
-                        roi = (loyer_futur - loyer_actuel) / prop.prix_maison
-                        if roi > meilleur_roi:
-                            meilleur_roi = roi
-                            meilleure = prop
+                nb_maisons = prop.nb_maisons
+                if (nb_maisons < 4 and not prop.a_hotel and joueur.argent >= prop.prix_maison
+                        and prop.construction_autorisee()):
+                    # ROI lu dans la table des revenus attendus (O(1), sans modifier la propriété)
+                    roi = table.rendement_construction(prop.position, nb_maisons)
+                    if roi > meilleur_roi:
+                        meilleur_roi = roi
+                        meilleure = prop
         
         return meilleure
     
@@ -758,53 +1869,166 @@ class IAStrategique(StrategieIA):
         """Liste les quartiers complets du joueur"""
         quartiers = {}
         
-        # Compter les propriétés par couleur
-        couleurs_joueur = {}
-        for prop in joueur.proprietes:
-            if isinstance(prop, Propriete) and not isinstance(prop, (Gare, Compagnie)):
-                couleur = prop.couleur
-                if couleur not in couleurs_joueur:
-                    couleurs_joueur[couleur] = []
-                couleurs_joueur[couleur].append(prop)
-        
-        # Garder seulement les quartiers "complets" (simplifié: au moins 2 propriétés)
-        for couleur, props in couleurs_joueur.items():
-            if len(props) >= 2:
-                quartiers[couleur] = props
+        # Couleurs complètes d'après les compteurs du joueur (gares et compagnies exclues)
+        complets = [c for c in joueur.quartiers
+                    if c not in ("gare", "Compagnie") and joueur.possede_quartier_complet(c)]
+        if not complets:
+            return quartiers
         
+        for prop in joueur.proprietes:
+            if prop.couleur in complets:
+                if prop.couleur not in quartiers:
+                    quartiers[prop.couleur] = []
+                quartiers[prop.couleur].append(prop)
+
         return quartiers
 
 
+class IAMonteCarlo(IAStrategique):
+    """Évalue chaque décision par des parties simulées (recherche Monte-Carlo)
+
+    À chaque achat ou construction, l'état de la partie est copié (instantane) puis
+    chaque option est rejouée dans une partie silencieuse sur `horizon` tours avec
+    la stratégie `politique`. Les simulations sont réparties entre les options par
+    UCB1 ; l'option retenue est celle de meilleure part de patrimoine moyenne.
+    Les simulations utilisent leur propre flux aléatoire et remélangent les pioches :
+    elles ne connaissent ni les dés ni les cartes à venir de la vraie partie.
+    """
+    def __init__(self, nb_simulations: int = 200, horizon: int = 15, duree_max: Optional[float] = None,
+                 politique: Optional[StrategieIA] = None, graine: Optional[int] = None,
+                 table: Optional['TableRevenus'] = None):
+        super().__init__(table)
+        self.nom = "MonteCarlo"
+        self.nb_simulations = nb_simulations
+        self.horizon = horizon
+        self.duree_max = duree_max
+        self.politique = politique if politique else IAStrategique(table)
+        self.rng = FluxAleatoire(graine)
+        self.jeu = None
+        self._simulation = None
+        # Nombre de simulations jouées (toutes décisions confondues)
+        self.nb_simulations_jouees = 0
+
+    def preparer(self, jeu: 'Monopoly'):
+        self.jeu = jeu
+        self._simulation = None
+
+    def decider_achat(self, joueur: 'Joueur', propriete: Propriete) -> bool:
+        if joueur.argent < propriete.prix:
+            return False
+        return self._meilleure_option(joueur, [None, ("achat", propriete.position)]) is not None
+
+    def decider_construction(self, joueur: 'Joueur') -> Optional[Propriete]:
+        options = [None] + [("construction", prop.position)
+                            for proprietes in self._trouver_quartiers(joueur).values()
+                            for prop in proprietes
+                            if not prop.a_hotel and joueur.argent >= prop.prix_maison
+                            and prop.construction_autorisee()]
+        if len(options) == 1:
+            return None
+        choix = self._meilleure_option(joueur, options)
+        return self.jeu.plateau.cases[choix[1]] if choix else None
+
+    def _meilleure_option(self, joueur: 'Joueur', options: list):
+        """Option de meilleure valeur moyenne après répartition UCB1 des simulations"""
+        jeu = self.jeu
+        if jeu is None:
+            raise ValueError("IAMonteCarlo doit être utilisée par une partie MonopolyIA")
+        if self._simulation is None:
+            self._simulation = MonopolyIA([j.nom for j in jeu.joueurs], self.politique,
+                                          JournalSilencieux(), FluxAleatoire(0), regles=jeu.regles)
+        etat = jeu.instantane()
+        indice = jeu.joueurs.index(joueur)
+        sommes = [0.0] * len(options)
+        visites = [0] * len(options)
+        fin = time.perf_counter() + self.duree_max if self.duree_max else None
+        for n in range(self.nb_simulations):
+            if n < len(options):
+                k = n
+            else:
+                log_n = math.log(n)
+                k = max(range(len(options)),
+                        key=lambda i: sommes[i] / visites[i] + math.sqrt(2 * log_n / visites[i]))
+            sommes[k] += self._simuler(etat, indice, options[k])
+            visites[k] += 1
+            if fin is not None and time.perf_counter() >= fin:
+                break
+        self.nb_simulations_jouees += sum(visites)
+        meilleure = max(range(len(options)), key=lambda i: sommes[i] / visites[i] if visites[i] else -1.0)
+        return options[meilleure]
+
+    def _simuler(self, etat: bytes, indice: int, option) -> float:
+        """Joue une partie simulée depuis `etat` ; part du patrimoine du joueur à l'horizon"""
+        sim = self._simulation
+        sim.restaurer(etat)
+        rng = sim.rng
+        rng.seed(self.rng.getrandbits(64))
+        rng.imposer_des(b"")
+        sim.cartes_chance.melanger_restantes()
+        sim.cartes_communaute.melanger_restantes()
+
+        joueur = sim.joueurs[indice]
+        if option is not None:
+            action, position = option
+            case = sim.plateau.cases[position]
+            if action == "achat":
+                joueur.acheter_propriete(case)
+            else:
+                case.construire_maison(joueur)
+        # Fin du tour de table en cours, puis `horizon` tours complets
+        for autre in sim.joueurs[indice + 1:]:
+            if sim.partie_terminee():
+                break
+            if not autre.est_en_faillite:
+                sim.jouer_tour(autre)
+        sim.jouer_partie(max_tours=sim.tour_numero + self.horizon)
+
+        patrimoines = [j.patrimoine() for j in sim.joueurs]
+        total = sum(patrimoines)
+        return patrimoines[indice] / total if total else 0.0
+
+
 # =============================================================================
 # SÉANCE 4 : STATISTIQUES
 # =============================================================================
 
 class StatistiquesPartie:
     """Collecte des statistiques sur une partie"""
-    def __init__(self):
-        self.passages_par_case: Dict[int, int] = {}
-        self.revenus_par_propriete: Dict[str, int] = {}
+    def __init__(self, definition: Optional['DefinitionPlateau'] = None):
+        # Compteurs fixes de 40 cases, indexés par position
+        self.passages_par_case = array('q', bytes(8 * 40))
+        self.revenus_par_case = array('q', bytes(8 * 40))
+        # Noms des cases pour l'affichage
+        self.definition = definition
         self.duree_partie = 0
         self.nb_tours = 0
         self.gagnant = None
     
     def enregistrer_passage(self, case: Case):
         """Enregistre le passage sur une case"""
-        position = case.position
-        # Ajout dans le dictionnaire si 1er passage, incrémentation sinon
-        if position not in self.passages_par_case:
-            self.passages_par_case[position] = 1
-        else:
-            self.passages_par_case[position] += 1
+        self.passages_par_case[case.position] += 1
     
     def enregistrer_loyer(self, propriete: Propriete, montant: int):
         """Enregistre un paiement de loyer"""
-        nom = propriete.nom
-        # Ajout du nom de la propriété si 1er loyer payé, cumul du montant sinon
-        if nom not in self.revenus_par_propriete:
-            self.revenus_par_propriete[nom] = montant
-        else:
-            self.revenus_par_propriete[nom] += montant
+        self.revenus_par_case[propriete.position] += montant
+    
+    def nom_case(self, position: int) -> str:
+        return self.definition.cases[position].nom if self.definition else f"Position {position}"
+    
+    @property
+    def revenus_par_propriete(self) -> Dict[str, int]:
+        """Loyers encaissés par nom de propriété (propriétés ayant rapporté)"""
+        return {self.nom_case(pos): montant for pos, montant in enumerate(self.revenus_par_case) if montant}
+    
+    def fusionner(self, autre: 'StatistiquesPartie'):
+        """Ajoute les statistiques d'une autre partie (ou d'un lot de parties)"""
+        for pos in range(40):
+            self.passages_par_case[pos] += autre.passages_par_case[pos]
+            self.revenus_par_case[pos] += autre.revenus_par_case[pos]
+        self.duree_partie += autre.duree_partie
+        self.nb_tours += autre.nb_tours
+        # Un gagnant n'a pas de sens pour un cumul de parties
+        self.gagnant = None
     
     def afficher_statistiques(self):
         """Affiche un résumé des statistiques"""
@@ -819,13 +2043,13 @@ class StatistiquesPartie:
         
         # Top 5 cases visitées
         print("\nTop 5 des cases les plus visitées:")
-        top_cases = sorted(self.passages_par_case.items(), 
+        top_cases = sorted(((pos, nb) for pos, nb in enumerate(self.passages_par_case) if nb),
                           key=lambda x: x[1], reverse=True)[:5]
         for position, nb in top_cases:
             print(f"  Position {position}: {nb} passages")
         
         # Top 5 propriétés rentables
-        if self.revenus_par_propriete:
+        if any(self.revenus_par_case):
             print("\nTop 5 des propriétés les plus rentables:")
             top_props = sorted(self.revenus_par_propriete.items(),
                               key=lambda x: x[1], reverse=True)[:5]
@@ -833,6 +2057,355 @@ class StatistiquesPartie:
                 print(f"  {nom}: {revenus}€ de loyers")
 
 
+class Distribution:
+    """Moyenne, variance (Welford, fusion de Chan) et quantiles approchés d'une série
+    
+    Les quantiles viennent d'une esquisse à seaux logarithmiques (erreur relative
+    `precision`) : la mémoire dépend de l'étendue des valeurs, pas de leur nombre,
+    et deux esquisses se fusionnent en additionnant leurs seaux.
+    """
+    __slots__ = ("n", "moyenne", "m2", "minimum", "maximum", "precision", "_log_gamma",
+                 "positifs", "negatifs", "zeros")
+
+    def __init__(self, precision: float = 0.01):
+        self.n = 0
+        self.moyenne = 0.0
+        self.m2 = 0.0
+        self.minimum = float("inf")
+        self.maximum = float("-inf")
+        self.precision = precision
+        self._log_gamma = math.log((1 + precision) / (1 - precision))
+        self.positifs: Dict[int, int] = {}
+        self.negatifs: Dict[int, int] = {}
+        self.zeros = 0
+
+    def ajouter(self, x: float):
+        self.n += 1
+        delta = x - self.moyenne
+        self.moyenne += delta / self.n
+        self.m2 += delta * (x - self.moyenne)
+        if x < self.minimum:
+            self.minimum = x
+        if x > self.maximum:
+            self.maximum = x
+        if x > 0:
+            k = math.ceil(math.log(x) / self._log_gamma)
+            self.positifs[k] = self.positifs.get(k, 0) + 1
+        elif x < 0:
+            k = math.ceil(math.log(-x) / self._log_gamma)
+            self.negatifs[k] = self.negatifs.get(k, 0) + 1
+        else:
+            self.zeros += 1
+
+    def fusionner(self, autre: 'Distribution'):
+        if not autre.n:
+            return
+        n = self.n + autre.n
+        delta = autre.moyenne - self.moyenne
+        self.moyenne += delta * autre.n / n
+        self.m2 += autre.m2 + delta * delta * self.n * autre.n / n
+        self.n = n
+        self.minimum = min(self.minimum, autre.minimum)
+        self.maximum = max(self.maximum, autre.maximum)
+        for k, nb in autre.positifs.items():
+            self.positifs[k] = self.positifs.get(k, 0) + nb
+        for k, nb in autre.negatifs.items():
+            self.negatifs[k] = self.negatifs.get(k, 0) + nb
+        self.zeros += autre.zeros
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def ecart_type(self) -> float:
+        return math.sqrt(self.variance)
+
+    def _valeur(self, k: int) -> float:
+        """Milieu (relatif) du seau k"""
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma ** k / (gamma + 1)
+
+    def quantile(self, q: float) -> float:
+        """Quantile q (0 à 1) à `precision` près en relatif"""
+        if not self.n:
+            return 0.0
+        rang = q * (self.n - 1)
+        cumul = 0
+        for k in sorted(self.negatifs, reverse=True):
+            cumul += self.negatifs[k]
+            if cumul > rang:
+                return max(-self._valeur(k), self.minimum)
+        cumul += self.zeros
+        if cumul > rang:
+            return 0.0
+        for k in sorted(self.positifs):
+            cumul += self.positifs[k]
+            if cumul > rang:
+                return min(self._valeur(k), self.maximum)
+        return self.maximum
+
+
+class AgregatStatistiques:
+    """Résumé à mémoire constante d'un nombre quelconque de parties, fusionnable entre processus"""
+    def __init__(self, precision: float = 0.01):
+        self.nb_parties = 0
+        self.nb_gagnants = 0
+        self.nb_tours = 0
+        self.passages_par_case = array('q', bytes(8 * 40))
+        self.revenus_par_case = array('q', bytes(8 * 40))
+        # Durée des parties, argent final de chaque joueur, loyers payés par partie
+        self.duree = Distribution(precision)
+        self.argent_final = Distribution(precision)
+        self.revenus_loyers = Distribution(precision)
+
+    def ajouter(self, stats: StatistiquesPartie, joueurs: List[Joueur]):
+        """Ajoute une partie terminée"""
+        self.nb_parties += 1
+        self.nb_gagnants += stats.gagnant is not None
+        self.nb_tours += stats.nb_tours
+        for pos in range(40):
+            self.passages_par_case[pos] += stats.passages_par_case[pos]
+            self.revenus_par_case[pos] += stats.revenus_par_case[pos]
+        self.duree.ajouter(stats.nb_tours)
+        for j in joueurs:
+            self.argent_final.ajouter(j.argent)
+        self.revenus_loyers.ajouter(sum(stats.revenus_par_case))
+
+    def ajouter_partie(self, jeu: 'MonopolyIA'):
+        self.ajouter(jeu.stats, jeu.joueurs)
+
+    def fusionner(self, autre: 'AgregatStatistiques'):
+        self.nb_parties += autre.nb_parties
+        self.nb_gagnants += autre.nb_gagnants
+        self.nb_tours += autre.nb_tours
+        for pos in range(40):
+            self.passages_par_case[pos] += autre.passages_par_case[pos]
+            self.revenus_par_case[pos] += autre.revenus_par_case[pos]
+        self.duree.fusionner(autre.duree)
+        self.argent_final.fusionner(autre.argent_final)
+        self.revenus_loyers.fusionner(autre.revenus_loyers)
+
+    def resume(self) -> Dict[str, Dict[str, float]]:
+        """Moyenne, écart-type, extrêmes et quantiles de chaque série"""
+        return {nom: {"moyenne": d.moyenne, "ecart_type": d.ecart_type, "min": d.minimum,
+                      "p50": d.quantile(0.5), "p90": d.quantile(0.9), "p99": d.quantile(0.99),
+                      "max": d.maximum}
+                for nom, d in (("duree", self.duree), ("argent_final", self.argent_final),
+                               ("revenus_loyers", self.revenus_loyers))}
+
+    def afficher(self):
+        print(f"\n{self.nb_parties} parties, {self.nb_gagnants} avec gagnant")
+        for nom, r in self.resume().items():
+            print(f"  {nom:<15} moyenne {r['moyenne']:9.1f} ± {r['ecart_type']:8.1f}   "
+                  f"médiane {r['p50']:9.1f}   p90 {r['p90']:9.1f}   max {r['max']:9.1f}")
+
+
+# =============================================================================
+# ANALYSE PROBABILISTE (CHAÎNE DE MARKOV)
+# =============================================================================
+
+class ChaineMarkov:
+    """Probabilités exactes d'atterrissage sur chaque case (chaîne de Markov)
+    
+    États de fin de tour : (position, doubles consécutifs) hors prison et
+    (tours déjà passés) en prison, soit 123 états. Les transitions suivent
+    Monopoly.jouer_tour et _gerer_prison : 3 doubles, Allez Prison, cartes de
+    déplacement (tirées uniformément) et sortie de prison avec déplacement
+    suivi d'un lancer normal. L'argent n'intervient pas : la sortie se fait aux
+    dés, ou en payant dès le premier tour si paie_sortie=True.
+    """
+    PRISON = -1
+    LANCERS = [(d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)]
+
+    def __init__(self, definition: Optional[DefinitionPlateau] = None, paie_sortie: bool = False):
+        self.definition = definition if definition else DefinitionPlateau.standard(JournalSilencieux())
+        self.paie_sortie = paie_sortie
+        self.types = self.definition.types
+        self.nb_etats = 40 * 3 + 3
+        # Pour chaque état : transitions {état: probabilité} et atterrissages attendus par case
+        self.transitions: List[Dict[int, float]] = []
+        self.atterrissages: List[List[float]] = []
+        for etat in range(self.nb_etats):
+            fin, atterrissages = {}, [0.0] * 40
+            if etat < 120:
+                self._lancer_normal(etat // 3, etat % 3, 1.0, fin, atterrissages)
+            else:
+                self._tour_prison(etat - 120, fin, atterrissages)
+            self.transitions.append(fin)
+            self.atterrissages.append(atterrissages)
+        self.distribution = self._distribution_stationnaire()
+        # Nombre moyen d'atterrissages sur chaque case par tour de jeu d'un joueur
+        self.atterrissages_par_tour = [
+            sum(self.distribution[s] * self.atterrissages[s][pos] for s in range(self.nb_etats))
+            for pos in range(40)]
+
+    @staticmethod
+    def etat_prison(tours: int) -> int:
+        return 120 + tours
+
+    def _atterrir(self, pos: int, prob: float, issues: Dict[int, float], atterrissages: List[float]):
+        """Atterrissage sur une case, cartes de déplacement comprises"""
+        atterrissages[pos] += prob
+        type_case = self.types[pos]
+        if type_case == TYPE_ALLEZ_PRISON:
+            issues[self.PRISON] = issues.get(self.PRISON, 0.0) + prob
+        elif type_case == TYPE_CHANCE or type_case == TYPE_CAISSE:
+            table = TABLES_CARTES["chance" if type_case == TYPE_CHANCE else "communaute"]
+            p = prob / len(table)
+            for carte in table:
+                if carte.effet == EFFET_ALLER_A:
+                    self._atterrir(carte.valeur, p, issues, atterrissages)
+                elif carte.effet == EFFET_RECULER:
+                    self._atterrir((pos - carte.valeur) % 40, p, issues, atterrissages)
+                elif carte.effet == EFFET_PRISON:
+                    issues[self.PRISON] = issues.get(self.PRISON, 0.0) + p
+                else:
+                    issues[pos] = issues.get(pos, 0.0) + p
+        else:
+            issues[pos] = issues.get(pos, 0.0) + prob
+
+    def _lancer_normal(self, pos: int, doubles: int, prob: float, fin: Dict[int, float], atterrissages: List[float]):
+        """Lancer de dés hors prison (règle des 3 doubles)"""
+        for d1, d2 in self.LANCERS:
+            p = prob / 36
+            nouveaux_doubles = doubles + 1 if d1 == d2 else 0
+            if nouveaux_doubles == 3:
+                fin[self.etat_prison(0)] = fin.get(self.etat_prison(0), 0.0) + p
+                continue
+            issues = {}
+            self._atterrir((pos + d1 + d2) % 40, p, issues, atterrissages)
+            for dest, q in issues.items():
+                etat = self.etat_prison(0) if dest == self.PRISON else dest * 3 + nouveaux_doubles
+                fin[etat] = fin.get(etat, 0.0) + q
+
+    def _tour_prison(self, tours: int, fin: Dict[int, float], atterrissages: List[float]):
+        """Tour en prison : double ou 3e tour -> sortie, déplacement puis lancer normal"""
+        if self.paie_sortie:
+            self._lancer_normal(10, 0, 1.0, fin, atterrissages)
+            return
+        for d1, d2 in self.LANCERS:
+            p = 1.0 / 36
+            if d1 != d2 and tours + 1 < 3:
+                etat = self.etat_prison(tours + 1)
+                fin[etat] = fin.get(etat, 0.0) + p
+                continue
+            issues = {}
+            self._atterrir(10 + d1 + d2, p, issues, atterrissages)
+            for dest, q in issues.items():
+                if dest == self.PRISON:
+                    fin[self.etat_prison(0)] = fin.get(self.etat_prison(0), 0.0) + q
+                else:
+                    self._lancer_normal(dest, 0, q, fin, atterrissages)
+
+    def _distribution_stationnaire(self, tolerance: float = 1e-14, max_iterations: int = 10000) -> List[float]:
+        """Résout pi = pi.P par itérations successives sur la matrice creuse"""
+        transitions = [list(t.items()) for t in self.transitions]
+        pi = [1.0 / self.nb_etats] * self.nb_etats
+        for _ in range(max_iterations):
+            suivant = [0.0] * self.nb_etats
+            for etat, p in enumerate(pi):
+                if p:
+                    for dest, q in transitions[etat]:
+                        suivant[dest] += p * q
+            ecart = sum(abs(a - b) for a, b in zip(pi, suivant))
+            pi = suivant
+            if ecart < tolerance:
+                break
+        return pi
+
+    def probabilites_atterrissage(self) -> List[float]:
+        """Probabilité qu'un atterrissage ait lieu sur chaque case (somme = 1)"""
+        total = sum(self.atterrissages_par_tour)
+        return [a / total for a in self.atterrissages_par_tour]
+
+    def probabilite_prison(self) -> float:
+        """Probabilité d'être en prison à la fin d'un tour"""
+        return sum(self.distribution[self.etat_prison(t)] for t in range(3))
+
+
+class TableRevenus:
+    """Loyer attendu par tour adverse pour chaque case et niveau de construction
+    
+    Calculée une fois par plateau à partir des probabilités d'atterrissage de
+    ChaineMarkov. Niveaux d'un terrain : 0 nu, 1 nu avec quartier complet
+    (loyer doublé), 2 à 5 pour 1 à 4 maisons, 6 hôtel. Pour les gares et
+    compagnies, le niveau est le nombre possédé (doublé si la série est complète).
+    """
+    NIVEAU_NU = 0
+    NIVEAU_COMPLET = 1
+    NIVEAU_HOTEL = 6
+    # Somme moyenne des dés (loyer des compagnies)
+    LANCER_MOYEN = 7
+
+    def __init__(self, definition: Optional[DefinitionPlateau] = None, chaine: Optional[ChaineMarkov] = None):
+        self.definition = definition if definition else DefinitionPlateau.standard(JournalSilencieux())
+        chaine = chaine if chaine else ChaineMarkov(self.definition)
+        self.probabilites = chaine.atterrissages_par_tour
+        
+        self.revenus: List[Tuple[float, ...]] = []
+        self.rendements: List[Tuple[float, ...]] = []
+        self.rentabilites: List[float] = []
+        for d in self.definition.cases:
+            loyers = self._loyers_par_niveau(d)
+            revenus = tuple(self.probabilites[d.position] * loyer for loyer in loyers)
+            self.revenus.append(revenus)
+            self.rendements.append(self._rendements(d, revenus))
+            prix = 200 if d.type_case == "gare" else 150 if d.type_case == "compagnie" else d.prix
+            # Une gare ou une compagnie achetée rapporte au moins le loyer d'un exemplaire
+            niveau = self.NIVEAU_NU if d.type_case == "propriete" else 1
+            self.rentabilites.append(revenus[niveau] / prix if prix else 0.0)
+        
+        achetables = sorted(r for r in self.rentabilites if r > 0)
+        self.rentabilite_mediane = achetables[len(achetables) // 2] if achetables else 0.0
+
+    @classmethod
+    def pour_plateau(cls, definition: Optional[DefinitionPlateau] = None) -> 'TableRevenus':
+        """Table du plateau (calculée au premier appel, puis gardée par la définition)"""
+        definition = definition if definition else DefinitionPlateau.standard(JournalSilencieux())
+        if definition.table_revenus is None:
+            definition.table_revenus = cls(definition)
+        return definition.table_revenus
+
+    def _loyers_par_niveau(self, d: DefinitionCase) -> Tuple[int, ...]:
+        """Loyers de Propriete/Gare/Compagnie.calculer_loyer, règle du doublement comprise"""
+        if d.type_case == "propriete":
+            b = d.loyer
+            return (b, 2 * b, 2 * b, 4 * b, 8 * b, 16 * b, 5 * b)
+        if d.type_case == "gare":
+            taille = self.definition.tailles_quartiers["gare"]
+            return (0,) + tuple(25 * 2 ** (n - 1) * (2 if n == taille else 1) for n in range(1, taille + 1))
+        if d.type_case == "compagnie":
+            taille = self.definition.tailles_quartiers["Compagnie"]
+            return (0,) + tuple(self.LANCER_MOYEN * (10 if n == 2 else 4) * (2 if n == taille else 1)
+                                for n in range(1, taille + 1))
+        return (0,)
+
+    def _rendements(self, d: DefinitionCase, revenus: Tuple[float, ...]) -> Tuple[float, ...]:
+        """Pour 0 à 3 maisons : meilleur gain de revenu par euro investi en continuant à bâtir"""
+        if d.type_case != "propriete" or not d.prix_maison:
+            return (0.0,) * 4
+        rendements = []
+        for n in range(4):
+            actuel = revenus[self.NIVEAU_COMPLET + n]
+            rendements.append(max((revenus[self.NIVEAU_COMPLET + k] - actuel) / (d.prix_maison * (k - n))
+                                  for k in range(n + 1, 5)))
+        return tuple(rendements)
+
+    def revenu_attendu(self, position: int, niveau: int) -> float:
+        """Loyer attendu par tour adverse sur la case au niveau donné"""
+        return self.revenus[position][niveau]
+
+    def rendement_construction(self, position: int, nb_maisons: int) -> float:
+        """Gain de loyer attendu par euro investi en bâtissant à partir de nb_maisons"""
+        return self.rendements[position][nb_maisons]
+
+    def rentabilite_achat(self, position: int) -> float:
+        """Loyer attendu à l'achat (terrain nu, ou un seul exemplaire pour une gare ou
+        une compagnie) par tour adverse, rapporté au prix d'achat"""
+        return self.rentabilites[position]
+
+
 # =============================================================================
 # FONCTIONS DE TEST SÉANCE 4
 # =============================================================================
@@ -848,6 +2421,48 @@ def tester_plateau():
     assert isinstance(plateau.cases[30], CaseSpeciale), "Case 30 = Allez Prison"
     print("  ✓ Plateau validé!")
 
+def tester_plateaux_independants():
+    """Test de l'indépendance des parties (définition partagée, état propre)"""
+    print("\nTEST PLATEAUX INDÉPENDANTS")
+    jeu1 = Monopoly(["A", "B"], journal=JournalSilencieux())
+    jeu2 = Monopoly(["C", "D"], journal=JournalSilencieux())
+    assert jeu1.plateau.definition is jeu2.plateau.definition, "Définition partagée"
+    
+    rue = jeu1.plateau.get_case(39)
+    jeu1.joueurs[0].acheter_propriete(rue)
+    rue.nb_maisons = 2
+    autre = jeu2.plateau.get_case(39)
+    assert autre.proprietaire is None, "Pas de fuite de propriétaire"
+    assert autre.nb_maisons == 0, "Pas de fuite de maisons"
+    assert rue.proprietaire is jeu1.joueurs[0], "Propriétaire conservé"
+    
+    # Un joueur étranger à la partie ne peut pas devenir propriétaire
+    try:
+        autre.proprietaire = Joueur("X", journal=JournalSilencieux())
+        assert False, "Joueur étranger refusé"
+    except ValueError:
+        pass
+    assert [j.nom for j in jeu2.joueurs] == ["C", "D"] and autre.proprietaire is None
+    
+    # Parties en série : les cases d'une partie rendue sont reprises, sans rien en hériter
+    jeu = MonopolyIA(["A", "B"], IAAgressive(), JournalSilencieux(), FluxAleatoire(3))
+    jeu.jouer_partie(max_tours=60)
+    cases = jeu.plateau.cases
+    assert any(c.proprietaire for c in cases if isinstance(c, Propriete)), "Partie avec des propriétaires"
+    jeu.liberer()
+    suivante = MonopolyIA(["C", "D"], IAAgressive(), JournalSilencieux(), FluxAleatoire(4))
+    assert suivante.plateau.cases is cases, "Cases reprises, pas recréées"
+    assert all(c.proprietaire is None and c.nb_maisons == 0 and not c.hypothequee
+               for c in cases if isinstance(c, Propriete)), "État neuf"
+    assert all(cases[p].dernier_lancer == 0 for p in suivante.plateau.definition.quartiers["Compagnie"])
+    temoin = MonopolyIA(["C", "D"], IAAgressive(), JournalSilencieux(), FluxAleatoire(4))
+    assert temoin.plateau.cases is not cases, "Cases d'une partie en cours jamais partagées"
+    suivante.jouer_partie(max_tours=60)
+    temoin.jouer_partie(max_tours=60)
+    assert [j.argent for j in suivante.joueurs] == [j.argent for j in temoin.joueurs], "Même partie"
+    
+    print("  ✓ Plateaux indépendants validés!")
+
 def tester_deplacement():
     """Test du déplacement et passage par Départ (Séance 1)"""
     print("\nTEST DÉPLACEMENT (Séance 1)")
@@ -943,6 +2558,28 @@ def tester_construction():
     print(f"  Loyer: {loyer_avant}€ → {loyer_apres}€")
     print("  ✓ Construction validée!")
 
+def tester_quartiers():
+    """Test de l'index des quartiers et des compteurs par joueur"""
+    print("\nTEST QUARTIERS")
+    jeu = Monopoly(["A", "B"], journal=JournalSilencieux())
+    a, b = jeu.joueurs
+    cases = jeu.plateau.cases
+    tailles = jeu.plateau.definition.tailles_quartiers
+    assert tailles["marron"] == 2 and tailles["gare"] == 4, "Tailles lues sur le plateau"
+    
+    a.acheter_propriete(cases[1])
+    assert not a.possede_quartier_complet("marron"), "Quartier incomplet"
+    a.acheter_propriete(cases[3])
+    assert a.possede_quartier_complet("marron"), "Quartier complet"
+    assert cases[1].possede_quartier_complet(a, jeu), "Les deux vérifications concordent"
+    
+    # La faillite transfère les compteurs au créancier
+    a.declarer_faillite(b)
+    assert b.possede_quartier_complet("marron"), "Quartier transféré"
+    assert a.quartiers["marron"] == 0, "Compteur du failli remis à zéro"
+    
+    print("  ✓ Quartiers validés!")
+
 def tester_gares():
     """Test des gares (Séance 2)"""
     print("\nTEST GARES (Séance 2)")
@@ -1004,9 +2641,669 @@ def tester_cartes():
                   joueur.position != position_avant or
                   joueur.en_prison or
                   joueur.cartes_liberte > 0)
-    
+
+    # Un cycle de pioche tire chaque carte une fois ; le paquet se copie par pickle
+    import pickle
+    paquet = PaquetCartes("communaute", FluxAleatoire(3))
+    copie = pickle.loads(pickle.dumps(paquet))
+    cycle = [paquet.piocher() for _ in range(len(paquet.table))]
+    assert sorted(c.code & 0x0F for c in cycle) == list(range(len(paquet.table)))
+    assert [copie.piocher() for _ in range(len(cycle))] == cycle
+    assert paquet.table is TABLES_CARTES["communaute"], "Table partagée entre les parties"
+
     print("  ✓ Cartes validées!")
 
+def tester_journal():
+    """Test du journal d'événements (mode silencieux et mémoire)"""
+    print("\nTEST JOURNAL D'ÉVÉNEMENTS")
+    journal = JournalMemoire()
+    jeu = MonopolyIA(["IA1", "IA2"], strategie=IAAgressive(), journal=journal)
+    jeu.jouer_partie(max_tours=5)
+    codes = [code for code, _ in journal.evenements]
+    assert "debut_partie" in codes, "Le début de partie est journalisé"
+    assert "des" in codes, "Les lancers de dés sont journalisés"
+    
+    # Une partie silencieuse n'écrit rien
+    import contextlib, io
+    sortie = io.StringIO()
+    with contextlib.redirect_stdout(sortie):
+        jeu = MonopolyIA(["IA1", "IA2"], strategie=IAAgressive(), journal=JournalSilencieux())
+        jeu.jouer_partie(max_tours=5)
+    assert jeu.tour_numero > 0 and sortie.getvalue() == "", "Aucune sortie en mode silencieux"
+    
+    print("  ✓ Journal validé!")
+
+def tester_simulateur_vectorise():
+    """Test du simulateur vectorisé (ignoré si NumPy est absent)"""
+    print("\nTEST SIMULATEUR VECTORISÉ")
+    try:
+        sim = SimulateurVectorise(200, 3, IAStrategique(), graine=42)
+    except ImportError:
+        print("  NumPy absent : test ignoré")
+        return
+    resultats = sim.simuler(max_tours=100)
+    assert resultats["gagnants"].shape == (200,), "Un gagnant par partie"
+    assert (resultats["nb_tours"] <= 100).all(), "Limite de tours respectée"
+    assert (resultats["argent"] >= 0).all(), "Pas d'argent négatif"
+    patrimoines, gagnants = resultats["patrimoines"], resultats["gagnants"]
+    assert (patrimoines >= resultats["argent"]).all(), "Patrimoine = argent + biens"
+    assert (patrimoines[gagnants >= 0].max(axis=1) == patrimoines[gagnants >= 0, gagnants[gagnants >= 0]]).all(), \
+        "Gagnant au plus gros patrimoine"
+    
+    # Même graine -> mêmes résultats
+    encore = SimulateurVectorise(200, 3, IAStrategique(), graine=42).simuler(max_tours=100)
+    assert (encore["nb_tours"] == resultats["nb_tours"]).all(), "Simulation reproductible"
+    
+    # Mêmes règles que le moteur objet : taux de faillite et durée moyenne comparables
+    # (tolérances d'environ 4 écarts-types pour 300 parties)
+    maitre = FluxAleatoire(1)
+    for strategie in (None, StrategieIA("Défaut"), IAAgressive(), IAConservative(), IAStrategique()):
+        vecteur = SimulateurVectorise(300, 3, strategie, graine=1).simuler(max_tours=100)
+        faillites, tours = [], []
+        for i in range(300):
+            noms = ["A", "B", "C"]
+            if strategie is None:
+                jeu = Monopoly(noms, JournalSilencieux(), maitre.engendrer(i))
+            else:
+                jeu = MonopolyIA(noms, strategie, JournalSilencieux(), maitre.engendrer(i))
+            jeu.jouer_partie(max_tours=100)
+            faillites += [j.est_en_faillite for j in jeu.joueurs]
+            tours.append(jeu.tour_numero)
+        nom = strategie.nom if strategie else "règles de base"
+        assert abs(vecteur["faillites"].mean() - sum(faillites) / len(faillites)) < 0.06, f"Faillites ({nom})"
+        assert abs(vecteur["nb_tours"].mean() - sum(tours) / len(tours)) < 4, f"Durée ({nom})"
+    
+    try:
+        SimulateurVectorise(10, 2, regles=Regles.officielles())
+        assert False, "Règles facultatives refusées"
+    except ValueError:
+        pass
+    SimulateurVectorise(10, 2, regles=Regles())
+    
+    print("  ✓ Simulateur vectorisé validé!")
+
+def tester_flux_aleatoire():
+    """Test des flux aléatoires : une graine reproduit une partie entière"""
+    print("\nTEST FLUX ALÉATOIRES")
+    parties = []
+    for _ in range(2):
+        jeu = MonopolyIA(["A", "B", "C"], strategie=IAStrategique(), journal=JournalSilencieux(),
+                         rng=FluxAleatoire(11))
+        jeu.jouer_partie(max_tours=60)
+        parties.append(([j.argent for j in jeu.joueurs], list(jeu.plateau.etat.proprietaires)))
+    assert parties[0] == parties[1], "Même graine -> même partie"
+    
+    maitre = FluxAleatoire(5)
+    assert maitre.engendrer(0).random() != maitre.engendrer(1).random(), "Flux engendrés indépendants"
+    assert maitre.engendrer(3).random() == FluxAleatoire(5).engendrer(3).random(), "Flux engendrés reproductibles"
+    # L'état (bloc de dés compris) se copie
+    rng = FluxAleatoire(2)
+    rng.lancer_des()
+    copie = FluxAleatoire()
+    copie.setstate(rng.getstate())
+    assert [rng.lancer_des() for _ in range(200)] == [copie.lancer_des() for _ in range(200)]
+    assert all(1 <= d <= 6 for lancer in rng.tirer_des(600) for d in lancer), "Dés entre 1 et 6"
+    
+    print("  ✓ Flux aléatoires validés!")
+
+def tester_banc_essai():
+    """Test du banc d'essai (mesures réduites et comparaison à une référence)"""
+    print("\nTEST BANC D'ESSAI")
+    banc = BancEssai(nb_tours=300, nb_parties=2, repetitions=1, nb_joueurs=(2,))
+    mesures = banc.executer()
+    assert mesures["tours_par_s.Monopoly"] > 0 and mesures["memoire_octets.partie"] > 0
+    assert "parties_par_s.Stratégique.2j" in mesures and "loyer_ns.compagnie" in mesures
+    
+    assert not any(l[4] for l in BancEssai.comparer(mesures, mesures)), "Pas de régression contre soi-même"
+    # Référence deux fois plus rapide et deux fois plus légère : tout régresse
+    reference = {nom: v * 2 if nom.startswith(("tours_par_s", "parties_par_s")) else v / 2
+                 for nom, v in mesures.items()}
+    assert all(l[4] for l in BancEssai.comparer(mesures, reference)), "Régressions détectées"
+    
+    print("  ✓ Banc d'essai validé!")
+
+def tester_source_sqlite():
+    """Test de la base SQLite construite depuis plato.sql"""
+    print("\nTEST SOURCE SQLITE")
+    import tempfile
+    definitions = SourceSQLite().charger(JournalSilencieux())
+    assert len(definitions) == 28, "28 propriétés dans v_proprietes"
+    plateau, defaut = DefinitionPlateau(definitions), DefinitionPlateau([])
+    assert plateau.tailles_quartiers == defaut.tailles_quartiers, "Mêmes quartiers"
+    assert all((a.type_case, a.prix, a.loyer) == (b.type_case, b.prix, b.loyer)
+               for a, b in zip(plateau.cases, defaut.cases)), "Mêmes prix et loyers"
+    
+    # Base compilée dans un fichier puis relue
+    base = os.path.join(tempfile.mkdtemp(), "plateau.sqlite")
+    assert SourceSQLite(base=base).charger(JournalSilencieux()) == definitions
+    assert os.path.exists(base) and SourceSQLite(base=base).charger(JournalSilencieux()) == definitions
+    assert SourceSQLite(script=base + ".absent").charger(JournalSilencieux()) == []
+    
+    print("  ✓ Source SQLite validée!")
+
+def tester_chargement_bdd():
+    """Test du coupe-circuit et de la copie locale de v_proprietes"""
+    print("\nTEST CHARGEMENT BDD")
+    import tempfile
+    connexion_origine, instantane_origine = DB.__dict__["connexionBase"], DB.fichier_instantane
+    appels = []
+    
+    class CurseurTest:
+        def execute(self, requete): pass
+        def fetchall(self):
+            return [{"position": 39, "nom": "Rue Test", "type_propriete_code": "propriete", "prix_achat": 400,
+                     "loyer_base": 50, "couleur": "bleu_fonce", "prix_maison": 200}]
+        def close(self): pass
+    
+    class ConnexionTest:
+        def cursor(self, dictionary=False): return CurseurTest()
+        def close(self): pass
+    
+    def connexion_en_panne(cls):
+        appels.append(1)
+        raise ConnectionError("base arrêtée")
+    
+    try:
+        DB.fichier_instantane = os.path.join(tempfile.mkdtemp(), "cache", "v_proprietes.json")
+        DB.connexionBase = classmethod(connexion_en_panne)
+        DB.vider_cache()
+        assert DB.get_proprietes(JournalSilencieux()) == []
+        assert DB.get_proprietes(JournalSilencieux()) == [] and len(appels) == 1, "Coupe-circuit ouvert"
+        
+        DB.connexionBase = classmethod(lambda cls: ConnexionTest())
+        DB.vider_cache()
+        assert DB.get_proprietes(JournalSilencieux())[0].nom == "Rue Test"
+        assert os.path.exists(DB.fichier_instantane), "Copie locale écrite"
+        
+        # Nouveau processus : la copie locale suffit, la base n'est pas contactée
+        DB.connexionBase = classmethod(connexion_en_panne)
+        DB.vider_cache()
+        assert DB.get_proprietes(JournalSilencieux())[0].nom == "Rue Test" and len(appels) == 1
+        # Copie périmée : la base est retentée, la copie sert de repli
+        DB.validite_instantane, validite = 0, DB.validite_instantane
+        DB.delai_reessai, delai = 0, DB.delai_reessai
+        DB.vider_cache()
+        assert DB.get_proprietes(JournalSilencieux())[0].nom == "Rue Test" and len(appels) == 2
+        # Délai de réessai écoulé : la base est recontactée malgré le repli en mémoire
+        assert DB.get_proprietes(JournalSilencieux())[0].nom == "Rue Test" and len(appels) == 3
+        # Coupe-circuit ouvert : le repli reste en mémoire, la copie n'est pas relue
+        DB.delai_reessai = delai
+        DB.vider_cache()
+        DB.get_proprietes(JournalSilencieux())
+        os.remove(DB.fichier_instantane)
+        assert DB.get_proprietes(JournalSilencieux())[0].nom == "Rue Test" and len(appels) == 4
+        DB.validite_instantane = validite
+    finally:
+        DB.connexionBase, DB.fichier_instantane = connexion_origine, instantane_origine
+        DB.vider_cache()
+    
+    print("  ✓ Chargement BDD validé!")
+
+def tester_ecrivain_resultats():
+    """Test de l'enregistrement des résultats par lots (SQLite)"""
+    print("\nTEST ÉCRIVAIN DE RÉSULTATS")
+    import sqlite3, tempfile
+    chemin = os.path.join(tempfile.mkdtemp(), "resultats.sqlite")
+    maitre = FluxAleatoire(3)
+    with EcrivainResultats.sqlite(chemin, taille_lot=4) as ecrivain:
+        for i in range(10):
+            jeu = MonopolyIA(["A", "B", "C"], IAStrategique(), JournalSilencieux(), maitre.engendrer(i))
+            jeu.jouer_partie(max_tours=50)
+            ecrivain.ajouter(jeu)
+        assert ecrivain.nb_ecrites == 8, "Deux lots complets écrits"
+    
+    connexion = sqlite3.connect(chemin)
+    assert connexion.execute("SELECT COUNT(*), MAX(nb_tours) FROM parties").fetchone() == (10, 50)
+    assert connexion.execute("SELECT COUNT(*) FROM joueurs_parties").fetchone()[0] == 30
+    assert connexion.execute("SELECT MAX(position) FROM passages_cases").fetchone()[0] < 40
+    assert connexion.execute("SELECT SUM(montant) FROM revenus_proprietes").fetchone()[0] > 0
+    connexion.close()
+    
+    # Deux écrivains ouverts en même temps sur la même base : identifiants distincts, à la suite
+    premier, second = EcrivainResultats.sqlite(chemin), EcrivainResultats.sqlite(chemin)
+    for ecrivain in (premier, second, premier):
+        ecrivain.ajouter(jeu)
+        ecrivain.vider()
+    premier.fermer()
+    second.fermer()
+    connexion = sqlite3.connect(chemin)
+    ids = [ligne[0] for ligne in connexion.execute("SELECT id FROM parties ORDER BY id")]
+    assert ids == list(range(1, 14)), "Identifiants à la suite, sans collision"
+    connexion.close()
+    
+    print("  ✓ Écrivain de résultats validé!")
+
+def tester_sources_plateau():
+    """Test des sources du plateau (fichier, défaut) et de l'import paresseux du pilote"""
+    print("\nTEST SOURCES DU PLATEAU")
+    import subprocess, tempfile
+    chemin = os.path.join(tempfile.mkdtemp(), "plateau.json")
+    source = SourceFichier(chemin)
+    source.enregistrer(DefinitionPlateau([]).cases)
+    definitions = source.charger(JournalSilencieux())
+    assert len(definitions) == 28, "28 propriétés relues"
+    assert DefinitionPlateau(definitions).cases == DefinitionPlateau([]).cases, "Aller-retour fidèle"
+    source.enregistrer(DefinitionPlateau([]).cases)
+    assert os.listdir(os.path.dirname(chemin)) == ["plateau.json"], "Réécrit sans fichier temporaire restant"
+    assert SourceFichier(chemin + ".absent").charger(JournalSilencieux()) == [], "Fichier absent -> défaut"
+    assert SourceDefaut().charger() == []
+    
+    ancienne = DefinitionPlateau.source
+    DefinitionPlateau.utiliser_source(source)
+    assert DefinitionPlateau.standard(JournalSilencieux()).cases[39].nom == "Rue de la Paix"
+    DefinitionPlateau.utiliser_source(ancienne)
+    
+    # Le pilote MySQL et concurrent.futures ne sont pas chargés à l'import
+    code = "import monopoly, sys; print('mysql' in sys.modules, 'concurrent.futures' in sys.modules)"
+    sortie = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout
+    assert sortie.split() == ["False", "False"], "Imports paresseux"
+    
+    print("  ✓ Sources du plateau validées!")
+
+def tester_agregat_statistiques():
+    """Test des compteurs par case et de l'agrégat fusionnable (moyenne, variance, quantiles)"""
+    print("\nTEST AGRÉGAT DE STATISTIQUES")
+    rng = random.Random(4)
+    valeurs = [rng.lognormvariate(5, 1) - 50 for _ in range(5000)] + [0] * 10
+    tout, moitie1, moitie2 = Distribution(), Distribution(), Distribution()
+    for i, x in enumerate(valeurs):
+        tout.ajouter(x)
+        (moitie1 if i % 2 else moitie2).ajouter(x)
+    moitie1.fusionner(moitie2)
+    moyenne = sum(valeurs) / len(valeurs)
+    variance = sum((x - moyenne) ** 2 for x in valeurs) / (len(valeurs) - 1)
+    assert abs(tout.moyenne - moyenne) < 1e-6 and abs(tout.variance - variance) < 1e-6 * variance
+    assert abs(moitie1.moyenne - moyenne) < 1e-6 and abs(moitie1.variance - variance) < 1e-6 * variance
+    exacts = sorted(valeurs)
+    for q in (0.1, 0.5, 0.9, 0.99):
+        exact = exacts[int(q * (len(exacts) - 1))]
+        assert abs(tout.quantile(q) - exact) <= 0.011 * abs(exact) + 1e-9, f"Quantile {q}"
+        assert moitie1.quantile(q) == tout.quantile(q), "Fusion exacte des esquisses"
+    
+    # Agrégat de parties : compteurs de 40 cases cumulés
+    agregat, maitre = AgregatStatistiques(), FluxAleatoire(8)
+    passages = 0
+    for i in range(5):
+        jeu = MonopolyIA(["A", "B"], IAAgressive(), JournalSilencieux(), maitre.engendrer(i))
+        jeu.jouer_partie(max_tours=40)
+        passages += sum(jeu.stats.passages_par_case)
+        agregat.ajouter_partie(jeu)
+    assert agregat.nb_parties == 5 and sum(agregat.passages_par_case) == passages
+    assert agregat.argent_final.n == 10 and agregat.duree.maximum <= 40
+    assert jeu.stats.revenus_par_propriete == {jeu.stats.nom_case(p): m
+                                               for p, m in enumerate(jeu.stats.revenus_par_case) if m}
+    
+    print("  ✓ Agrégat de statistiques validé!")
+
+def tester_instantane():
+    """Test instantané / restauration : la partie reprend à l'identique"""
+    print("\nTEST INSTANTANÉ")
+    
+    def etat(jeu):
+        return ([(j.argent, j.position, j.en_prison, j.est_en_faillite, [p.position for p in j.proprietes],
+                  sorted((c, n) for c, n in j.quartiers.items() if n)) for j in jeu.joueurs],
+                bytes(jeu.plateau.etat.maisons), list(jeu.plateau.etat.proprietaires),
+                list(jeu.stats.passages_par_case), jeu.tour_numero)
+    
+    jeu = MonopolyIA(["A", "B", "C"], IAStrategique(), JournalSilencieux(), FluxAleatoire(21))
+    jeu.jouer_partie(max_tours=40)
+    donnees = jeu.instantane()
+    jeu.jouer_partie(max_tours=120)
+    attendu = etat(jeu)
+    
+    # Restauration dans la même partie puis dans une partie neuve (autre processus)
+    jeu.restaurer(donnees)
+    assert jeu.tour_numero == 40
+    jeu.jouer_partie(max_tours=120)
+    assert etat(jeu) == attendu, "Même suite après restauration"
+    copie = MonopolyIA(["A", "B", "C"], IAStrategique(), JournalSilencieux())
+    copie.restaurer(donnees)
+    copie.jouer_partie(max_tours=120)
+    assert etat(copie) == attendu, "Même suite dans une autre partie"
+    
+    try:
+        Monopoly(["A", "B"], JournalSilencieux()).restaurer(donnees)
+        assert False, "Nombre de joueurs différent refusé"
+    except ValueError:
+        pass
+    
+    print(f"  ✓ Instantané validé! ({len(donnees)} octets)")
+
+def tester_rejeu():
+    """Test du journal binaire : le rejeu reconstruit chaque tour de la partie"""
+    print("\nTEST JOURNAL BINAIRE ET REJEU")
+    
+    def etat(jeu):
+        return ([(j.argent, j.position, j.en_prison, j.est_en_faillite, [p.position for p in j.proprietes])
+                 for j in jeu.joueurs], bytes(jeu.plateau.etat.maisons), list(jeu.plateau.etat.proprietaires))
+    
+    noms = ["A", "B", "C"]
+    journal = JournalBinaire(noms, "Stratégique")
+    jeu = MonopolyIA(noms, IAStrategique(), journal, FluxAleatoire(8))
+    jeu.jouer_partie(max_tours=150)
+    rejeu = RejeuPartie(journal.donnees)
+    assert rejeu.nb_tours == jeu.tour_numero
+    assert etat(rejeu.etat_au_tour()) == etat(jeu), "Même état final"
+    
+    # État intermédiaire : identique à une partie arrêtée au même tour
+    temoin = MonopolyIA(noms, IAStrategique(), JournalSilencieux(), FluxAleatoire(8))
+    temoin.jouer_partie(max_tours=60)
+    assert etat(rejeu.etat_au_tour(60)) == etat(temoin), "Même état au tour 60"
+    codes = [e[0] for e in rejeu.evenements()]
+    assert "achat" in codes and "loyer" in codes and "carte" in codes
+    try:
+        RejeuPartie(journal.donnees, IAAgressive()).etat_au_tour()
+        assert False, "Rejeu avec une autre stratégie détecté"
+    except ValueError:
+        pass
+    
+    # Moteur de base (sans stratégie) et journal incompatible
+    journal = JournalBinaire(["X", "Y"])
+    jeu = Monopoly(["X", "Y"], journal, FluxAleatoire(3))
+    jeu.jouer_partie(max_tours=80)
+    assert etat(RejeuPartie(journal.donnees).etat_au_tour()) == etat(jeu)
+    try:
+        RejeuPartie(journal.donnees[:journal.taille_entete] + b"\xff")
+        assert False, "Journal corrompu refusé"
+    except ValueError:
+        pass
+    
+    print(f"  ✓ Rejeu validé! ({len(journal.donnees)} octets pour {jeu.tour_numero} tours)")
+
+def tester_ia_monte_carlo():
+    """Test de la stratégie Monte-Carlo (simulations silencieuses, budget, reproductibilité)"""
+    print("\nTEST IA MONTE-CARLO")
+    
+    def partie(graine_ia):
+        strategie = IAMonteCarlo(nb_simulations=20, horizon=5, graine=graine_ia)
+        jeu = MonopolyIA(["A", "B", "C"], strategie, JournalSilencieux(), FluxAleatoire(4))
+        jeu.jouer_partie(max_tours=25)
+        return strategie, [(j.argent, [p.position for p in j.proprietes]) for j in jeu.joueurs]
+    
+    strategie, etat = partie(1)
+    assert strategie.nb_simulations_jouees > 0, "Les décisions sont simulées"
+    assert partie(1)[1] == etat, "Même graine, mêmes décisions"
+    
+    # Budget en temps : une décision s'arrête dès la durée écoulée
+    strategie = IAMonteCarlo(nb_simulations=10 ** 6, duree_max=0.02, graine=2)
+    jeu = MonopolyIA(["A", "B"], strategie, JournalSilencieux(), FluxAleatoire(4))
+    debut = time.perf_counter()
+    assert strategie.decider_achat(jeu.joueurs[0], jeu.plateau.cases[1]) in (True, False)
+    assert time.perf_counter() - debut < 0.5
+    
+    print(f"  ✓ IA Monte-Carlo validée! ({strategie.nb_simulations_jouees} simulations en 20 ms)")
+
+def tester_championnat():
+    """Test des stratégies par joueur et du championnat (sièges tournants, Elo)"""
+    print("\nTEST CHAMPIONNAT")
+    
+    # Stratégie par joueur : seul le joueur agressif achète
+    noms = ["Agressif", "Passif"]
+    journal = JournalBinaire(noms, ["Agressive", "Défaut"])
+    jeu = MonopolyIA(noms, journal=journal, rng=FluxAleatoire(2),
+                     strategies=[IAAgressive(), StrategieIA("Défaut")])
+    jeu.jouer_partie(max_tours=30)
+    assert len(jeu.joueurs[0].proprietes) > len(jeu.joueurs[1].proprietes)
+    assert jeu.nom_strategies == "Agressive/Défaut"
+    rejeu = RejeuPartie(journal.donnees).etat_au_tour()
+    assert [j.argent for j in rejeu.joueurs] == [j.argent for j in jeu.joueurs], "Rejeu par joueur"
+    
+    strategies = [IAAgressive(), IAConservative(), IAStrategique()]
+    championnat = Championnat(strategies, nb_joueurs=2, nb_processus=1, graine=3, taille_lot=4)
+    assert len(championnat.tables) == 6, "3 paires dans les 2 sens"
+    seul = championnat.executer(12)
+    deux = Championnat(strategies, nb_joueurs=2, nb_processus=2, graine=3, taille_lot=4).executer(12)
+    assert seul == deux, "Résultats indépendants du nombre de processus"
+    assert all(n == 8 for n in seul["parties"].values()), "Chaque stratégie joue autant de parties"
+    assert abs(sum(seul["elo"].values()) - 3 * Championnat.ELO_INITIAL) < 1e-6, "Elo à somme constante"
+    # Plus de sièges que de stratégies : chaque stratégie occupe autant de sièges
+    a_quatre = Championnat(strategies, nb_joueurs=4, nb_processus=1)
+    sieges = [sum(table.count(k) for table in a_quatre.tables) for k in range(3)]
+    assert len(a_quatre.tables) == 12 and sieges[0] == sieges[1] == sieges[2], "Exemplaires en plus répartis"
+    bas, haut = intervalle_wilson(30, 100)
+    assert bas < 0.3 < haut and intervalle_wilson(0, 0) == (0.0, 1.0)
+    
+    print("  ✓ Championnat validé!")
+
+def tester_arret_anticipe():
+    """Test de l'arrêt anticipé des parties et de l'arrêt séquentiel d'un championnat"""
+    print("\nTEST ARRÊT ANTICIPÉ")
+    
+    # Une partie stoppée quand un joueur domine : le meneur est déclaré gagnant
+    arret = ArretAnticipe(seuil=0.6, nb_tours=10)
+    nb_anticipees = 0
+    for i in range(20):
+        jeu = MonopolyIA(["A", "B"], IAAgressive(), JournalSilencieux(), FluxAleatoire(i))
+        gagnant = jeu.jouer_partie(max_tours=200, arret=arret)
+        if jeu.issue_acquise:
+            nb_anticipees += 1
+            assert gagnant is jeu.meneur and jeu.tour_numero < 200
+            parts = [j.patrimoine() for j in jeu.joueurs]
+            assert gagnant.patrimoine() >= 0.6 * sum(parts), "Seuil atteint au moment de l'arrêt"
+    assert nb_anticipees > 0, "Au moins une partie jouée d'avance"
+    
+    # Part du meneur calculée sur Joueur.patrimoine
+    meneur, part = ArretAnticipe(seuil=0.0).meneur(jeu)
+    assert part == max(j.patrimoine() for j in jeu.joueurs) / sum(j.patrimoine() for j in jeu.joueurs)
+    
+    # Championnat : arrêt dès que les intervalles sont assez étroits
+    championnat = Championnat([IAAgressive(), IAStrategique()], nb_joueurs=2, nb_processus=1,
+                              graine=5, taille_lot=10, arret=arret)
+    resultats = championnat.executer(10_000, precision=0.1)
+    assert resultats["nb_parties"] < 10_000 and resultats["nb_parties"] % 20 == 0
+    assert all((haut - bas) / 2 <= 0.1 for bas, haut in (l["intervalle"] for l in resultats["classement"]))
+    
+    print(f"  ✓ Arrêt anticipé validé! ({nb_anticipees}/20 parties, championnat en {resultats['nb_parties']} parties)")
+
+def tester_patrimoine():
+    """Test du patrimoine tenu à jour à chaque transaction (achats, constructions, faillites)"""
+    print("\nTEST PATRIMOINE")
+    
+    def recalcul(j):
+        if j.est_en_faillite:
+            return 0
+        return j.argent + sum(p.prix + (5 if p.a_hotel else p.nb_maisons) * p.prix_maison for p in j.proprietes)
+    
+    nb_faillites = nb_constructions = 0
+    for i in range(10):
+        jeu = Monopoly(["A", "B", "C"], JournalSilencieux(), FluxAleatoire(i))
+        for _ in range(60):
+            jeu.tour_numero += 1
+            for j in jeu.joueurs:
+                if not j.est_en_faillite:
+                    jeu.jouer_tour(j)
+            assert [j.patrimoine() for j in jeu.joueurs] == [recalcul(j) for j in jeu.joueurs]
+        nb_faillites += sum(j.est_en_faillite for j in jeu.joueurs)
+        nb_constructions += sum(jeu.plateau.etat.maisons) + sum(jeu.plateau.etat.hotels)
+        
+        # Limite de tours : le plus gros patrimoine en lice l'emporte, classement cohérent
+        classement = jeu.classement()
+        if not jeu.partie_terminee():
+            assert jeu.obtenir_gagnant() is classement[0]
+        assert [j.patrimoine() for j in classement if not j.est_en_faillite] == sorted(
+            (j.patrimoine() for j in jeu.joueurs if not j.est_en_faillite), reverse=True)
+        
+        # Reconstruit par restaurer
+        copie = Monopoly(["A", "B", "C"], JournalSilencieux())
+        copie.restaurer(jeu.instantane())
+        assert [j.patrimoine() for j in copie.joueurs] == [j.patrimoine() for j in jeu.joueurs]
+    assert nb_faillites and nb_constructions, "Faillites et constructions couvertes"
+    
+    print(f"  ✓ Patrimoine validé! ({nb_faillites} faillites, {nb_constructions} constructions)")
+
+def tester_regles():
+    """Test des règles facultatives : stock de la banque, construction uniforme, hypothèques"""
+    print("\nTEST RÈGLES FACULTATIVES")
+    assert Monopoly(["A"], JournalSilencieux()).regles is REGLES_HISTORIQUES, "Désactivées par défaut"
+    
+    # Construction uniforme et stock de maisons (marron : positions 1 et 3)
+    jeu = Monopoly(["A", "B"], JournalSilencieux(), regles=Regles(limite_maisons=3, construction_uniforme=True))
+    a, b = jeu.joueurs
+    a.argent = 5000
+    rue1, rue3 = jeu.plateau.cases[1], jeu.plateau.cases[3]
+    a.acheter_propriete(rue1)
+    a.acheter_propriete(rue3)
+    assert rue1.construire_maison(a) and not rue1.construire_maison(a), "Écart d'une maison au plus"
+    assert rue3.construire_maison(a) and rue1.construire_maison(a)
+    assert jeu.plateau.etat.maisons_posees == 3 and not rue3.construire_maison(a), "Banque vide"
+    
+    # Hypothèques : payer au-delà de son argent, pas de loyer, levée à 110 %
+    jeu = Monopoly(["A", "B"], JournalSilencieux(), regles=Regles.officielles())
+    a, b = jeu.joueurs
+    rue1, rue3 = jeu.plateau.cases[1], jeu.plateau.cases[3]
+    a.acheter_propriete(rue1)
+    a.acheter_propriete(rue3)
+    a.payer(a.argent + rue1.prix // 2, b)
+    assert not a.est_en_faillite and rue1.hypothequee and a.argent == 0
+    assert a.patrimoine() == rue1.prix - rue1.prix // 2 + rue3.prix, "Patrimoine net du prêt"
+    assert rue1.calculer_loyer() == 0 and not rue3.construction_autorisee(), "Quartier hypothéqué"
+    a.argent = 1000
+    assert rue1.lever_hypotheque(a) and a.argent == 1000 - rue1.prix // 2 * 11 // 10
+    
+    # Parties complètes : stock respecté, quartiers réguliers, compteurs exacts
+    def recalcul(j):
+        if j.est_en_faillite:
+            return 0
+        return j.argent + sum(p.prix + (5 if p.a_hotel else p.nb_maisons) * p.prix_maison
+                              - (p.prix // 2 if p.hypothequee else 0) for p in j.proprietes)
+    
+    nb_hypotheques = nb_maisons = 0
+    for i in range(12):
+        jeu = MonopolyIA(["A", "B", "C"], IAStrategique(), JournalSilencieux(), FluxAleatoire(i),
+                         regles=Regles.officielles())
+        jeu.jouer_partie(max_tours=150)
+        etat, definition = jeu.plateau.etat, jeu.plateau.definition
+        assert etat.maisons_posees <= 32 and etat.hotels_poses <= 12
+        for couleur, positions in definition.quartiers.items():
+            niveaux = [5 if etat.hotels[p] else etat.maisons[p] for p in positions]
+            assert max(niveaux) - min(niveaux) <= 1, f"Construction uniforme ({couleur})"
+        assert [j.patrimoine() for j in jeu.joueurs] == [recalcul(j) for j in jeu.joueurs]
+        copie = MonopolyIA(["A", "B", "C"], IAStrategique(), JournalSilencieux(), regles=Regles.officielles())
+        copie.restaurer(jeu.instantane())
+        etat_copie = copie.plateau.etat
+        assert (etat_copie.hypotheques, etat_copie.maisons_posees, etat_copie.niveaux) == (
+            etat.hypotheques, etat.maisons_posees, etat.niveaux), "Compteurs restaurés"
+        nb_hypotheques += bin(etat.hypotheques).count("1")
+        nb_maisons += etat.maisons_posees
+    assert nb_hypotheques and nb_maisons, "Hypothèques et constructions couvertes"
+    
+    # Les règles sont enregistrées dans le journal binaire et dans l'instantané
+    for i in range(6):
+        journal = JournalBinaire(["A", "B", "C"], "Stratégique")
+        jeu = MonopolyIA(["A", "B", "C"], IAStrategique(), journal, FluxAleatoire(i),
+                         regles=Regles(limite_maisons=20, construction_uniforme=True, hypotheques=True))
+        jeu.jouer_partie(max_tours=150)
+        rejeu = RejeuPartie(journal.donnees)
+        assert repr(rejeu.regles) == repr(jeu.regles)
+        assert [j.patrimoine() for j in rejeu.etat_au_tour().joueurs] == [j.patrimoine() for j in jeu.joueurs]
+    copie = Monopoly(["A", "B", "C"], JournalSilencieux())
+    copie.restaurer(jeu.instantane())
+    assert repr(copie.regles) == repr(jeu.regles) and copie.plateau.etat.regles is copie.regles
+    
+    print(f"  ✓ Règles validées! ({nb_hypotheques} hypothèques, {nb_maisons} maisons en fin de partie)")
+
+def tester_profileur():
+    """Test du profileur (temps par phase, piles, aucune trace après désactivation)"""
+    print("\nTEST PROFILEUR")
+    import tempfile
+    originale = Monopoly.__dict__["lancer_des"]
+    journal = JournalMemoire()
+    with Profileur() as profileur:
+        jeu = MonopolyIA(["A", "B"], IAStrategique(), journal, FluxAleatoire(6))
+        jeu.jouer_partie(max_tours=30)
+    assert Monopoly.__dict__["lancer_des"] is originale, "Méthodes remises à la sortie du bloc"
+    
+    phases = profileur.resume()
+    nb_lancers = sum(1 for code, _ in journal.evenements if code in ("des", "prison_des"))
+    assert phases["des"]["appels"] == nb_lancers and phases["partie"]["appels"] == 1
+    assert {"tour", "case", "strategie", "stats", "deplacement"} <= set(phases)
+    assert sum(profileur.piles.values()) == sum(c[2] for c in profileur.phases.values())
+    # La partie créée dans le bloc ne passe plus par le profileur après la sortie
+    appels = {phase: c[0] for phase, c in profileur.phases.items()}
+    for _ in range(10):
+        for joueur in jeu.joueurs:
+            jeu.jouer_tour(joueur)
+    assert {phase: c[0] for phase, c in profileur.phases.items()} == appels, "Aucune mesure hors du bloc"
+    
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = os.path.join(dossier, "profil.folded")
+        profileur.exporter_piles(chemin)
+        with open(chemin, encoding="utf-8") as f:
+            lignes = [ligne.rsplit(" ", 1) for ligne in f]
+    assert all(pile.startswith("partie") and int(us) > 0 for pile, us in lignes)
+    
+    print(f"  ✓ Profileur validé! ({len(lignes)} piles)")
+
+def tester_tournoi_parallele():
+    """Test du tournoi parallèle (résultats indépendants du nombre de processus)"""
+    print("\nTEST TOURNOI PARALLÈLE")
+    strategies = [IAAgressive(), IAConservative(), IAStrategique()]
+    seul = TournoiParallele(strategies, 3, nb_processus=1, graine=7, taille_lot=5).executer(20)
+    deux = TournoiParallele(strategies, 3, nb_processus=2, graine=7, taille_lot=5).executer(20)
+    assert seul["victoires"] == deux["victoires"], "Mêmes victoires"
+    assert seul["total_tours"] == deux["total_tours"], "Même nombre de tours"
+    assert sum(seul["parties"].values()) == 20, "Toutes les parties jouées"
+    
+    # Sans graine : graine maître aléatoire, mais commune à tous les lots
+    tournoi = TournoiParallele(strategies, 3, nb_processus=2, taille_lot=5)
+    assert tournoi.graine != TournoiParallele(strategies, 3).graine, "Graine tirée au hasard"
+    rejoue = TournoiParallele(strategies, 3, nb_processus=1, graine=tournoi.graine, taille_lot=5)
+    assert tournoi.executer(10)["victoires"] == rejoue.executer(10)["victoires"], "Rejouable avec sa graine"
+    
+    # Un journal n'est pas perdu avec plusieurs processus : parties jouées ici
+    journal = JournalMemoire()
+    simuler_parties(2, 2, IAStrategique(), journal=journal, nb_processus=2, graine=1)
+    assert sum(1 for code, _ in journal.evenements if code == "debut_partie") == 2, "Événements journalisés"
+    
+    print("  ✓ Tournoi parallèle validé!")
+
+def tester_chaine_markov():
+    """Test des probabilités exactes d'atterrissage"""
+    print("\nTEST CHAÎNE DE MARKOV")
+    chaine = ChaineMarkov()
+    probabilites = chaine.probabilites_atterrissage()
+    assert abs(sum(probabilites) - 1) < 1e-9, "Les probabilités somment à 1"
+    assert abs(sum(chaine.distribution) - 1) < 1e-9, "Distribution stationnaire normalisée"
+    assert 0 < chaine.probabilite_prison() < 1, "Des états prison sont atteints"
+    # Les cartes renvoient souvent vers Départ : plus probable qu'une case voisine
+    assert probabilites[0] > probabilites[1], "Départ favorisé par les cartes"
+    
+    print("  ✓ Chaîne de Markov validée!")
+
+def tester_table_revenus():
+    """Test de la table des revenus attendus et du ROI de construction"""
+    print("\nTEST TABLE DES REVENUS")
+    table = TableRevenus.pour_plateau()
+    assert table is TableRevenus.pour_plateau(), "Table partagée entre les appels"
+    # Une table par définition, libérée avec elle
+    import gc
+    autre = DefinitionPlateau([])
+    table_autre = TableRevenus.pour_plateau(autre)
+    assert table_autre is not table and table_autre.definition is autre
+    reference = weakref.ref(table_autre)
+    del autre, table_autre
+    gc.collect()
+    assert reference() is None, "Table libérée avec sa définition"
+    # Rue de la Paix : l'hôtel rapporte plus qu'une maison, et la 1re maison est rentable
+    assert table.revenu_attendu(39, TableRevenus.NIVEAU_HOTEL) > table.revenu_attendu(39, 2)
+    assert table.rendement_construction(39, 0) > 0, "ROI positif sans maison"
+    assert table.rentabilite_achat(0) == 0, "Départ n'est pas achetable"
+    assert table.rentabilite_achat(5) > 0 and table.rentabilite_achat(12) > 0, "Gares et compagnies comprises"
+    
+    # La stratégie lit le ROI sans modifier les propriétés
+    jeu = MonopolyIA(["IA1", "IA2"], strategie=IAStrategique(table), journal=JournalSilencieux())
+    joueur = jeu.joueurs[0]
+    for pos in (37, 39):
+        propriete = jeu.plateau.get_case(pos)
+        propriete.proprietaire = joueur
+        joueur.proprietes.append(propriete)
+    joueur.argent = 1000
+    choix = jeu.strategie.decider_construction(joueur)
+    assert choix is not None and choix.nb_maisons == 0, "Construction choisie sans simulation"
+    
+    print("  ✓ Table des revenus validée!")
+
 def tester_strategies():
     """Test des différentes stratégies IA"""
     print("\nTEST DES STRATÉGIES IA")
@@ -1032,79 +3329,91 @@ def tester_strategies():
         jeu.stats.afficher_statistiques()
 
 
-def simuler_parties(nb_parties: int, nb_joueurs: int, strategie: StrategieIA):
-    """Simule plusieurs parties avec une stratégie"""
+def simuler_parties(nb_parties: int, nb_joueurs: int, strategie: StrategieIA,
+                    journal: Optional[Journal] = None, nb_processus: int = 1, graine: Optional[int] = None,
+                    ecrivain: Optional['EcrivainResultats'] = None, arret: Optional[ArretAnticipe] = None,
+                    regles: Optional[Regles] = None):
+    """Simule plusieurs parties avec une stratégie (silencieuses par défaut)
+    
+    Retourne l'agrégat des parties (durée, argent final, loyers). Avec `ecrivain`,
+    les résultats de chaque partie sont enregistrés en base ; avec `journal`, leurs
+    événements y sont émis : les parties sont alors jouées dans ce processus, comme
+    pour Championnat.executer. Sans `graine`, une graine maître est tirée au hasard.
+    Avec `arret`, les parties dont l'issue est acquise s'arrêtent plus tôt ; `regles`
+    choisit les règles facultatives de toutes les parties.
+    """
+    # Un journal ou un écrivain ne peut pas être partagé avec les processus de travail
+    en_parallele = nb_processus > 1 and not (journal or ecrivain)
+    journal = journal if journal else JournalSilencieux()
     print(f"\nSimulation de {nb_parties} parties avec stratégie {strategie.nom}")
     
     victoires = 0
-    total_tours = 0
+    maitre = FluxAleatoire(graine)
     
-    for i in range(nb_parties):
-        noms = [f"Joueur{j+1}" for j in range(nb_joueurs)]
-        jeu = MonopolyIA(noms, strategie=strategie)
-        gagnant = jeu.jouer_partie(max_tours=200)
-        total_tours += jeu.stats.nb_tours
-        
-        if gagnant:
-            victoires += 1
+    if en_parallele:
+        # Parties réparties entre processus (graine par partie, résultats reproductibles)
+        resultats = TournoiParallele([strategie], nb_joueurs, nb_processus, maitre.graine, arret=arret,
+                                     regles=regles).executer(nb_parties)
+        victoires = resultats["victoires"][strategie.nom]
+        agregat = resultats["stats"]
+    else:
+        agregat = AgregatStatistiques()
+        for i in range(nb_parties):
+            noms = [f"Joueur{j+1}" for j in range(nb_joueurs)]
+            jeu = MonopolyIA(noms, strategie=strategie, journal=journal, rng=maitre.engendrer(i), regles=regles)
+            gagnant = jeu.jouer_partie(max_tours=200, arret=arret)
+            agregat.ajouter_partie(jeu)
+            if ecrivain:
+                ecrivain.ajouter(jeu)
+            jeu.liberer()
+            
+            if gagnant:
+                victoires += 1
     
+    if ecrivain:
+        ecrivain.vider()
     print(f"  Parties terminées avec gagnant: {victoires}/{nb_parties}")
-    print(f"  Durée moyenne: {total_tours / nb_parties:.1f} tours")
+    print(f"  Durée moyenne: {agregat.duree.moyenne:.1f} tours (médiane {agregat.duree.quantile(0.5):.0f}, "
+          f"p90 {agregat.duree.quantile(0.9):.0f})")
+    return agregat
 
 
-def comparer_strategies(nb_parties: int, nb_joueurs: int):
-    """Compare les différentes stratégies"""
+def comparer_strategies(nb_parties: int, nb_joueurs: int, journal: Optional[Journal] = None,
+                        nb_processus: int = 1, graine: Optional[int] = None,
+                        ecrivain: Optional['EcrivainResultats'] = None):
+    """Compare les stratégies en affrontements directs (parties silencieuses par défaut)
+    
+    Sans `graine`, une graine maître est tirée au hasard ; avec `journal` ou `ecrivain`,
+    les parties sont jouées dans ce processus (voir Championnat.executer).
+    """
     print(f"\n{'=' * 60}")
     print("COMPARAISON DES STRATÉGIES")
     print(f"{'=' * 60}")
     
-    resultats = {
-        "Agressive": 0,
-        "Conservative": 0,
-        "Stratégique": 0
-    }
-    
     strategies = [IAAgressive(), IAConservative(), IAStrategique()]
-    
-    for i in range(nb_parties):
-        # Choisir une stratégie aléatoire pour cette partie
-        strat = random.choice(strategies)
-        noms = [f"J{j+1}" for j in range(nb_joueurs)]
-        jeu = MonopolyIA(noms, strategie=strat)
-        gagnant = jeu.jouer_partie(max_tours=200)
-        
-        if gagnant:
-            resultats[strat.nom] += 1
-    
-    print("\nRésultats:")
-    for nom, victoires in resultats.items():
-        print(f"  {nom}: {victoires} victoires ({victoires * 100 / nb_parties:.1f}%)")
+    # Chaque joueur a sa stratégie ; sièges tournants (voir Championnat)
+    championnat = Championnat(strategies, nb_joueurs, nb_processus, graine)
+    resultats = championnat.executer(nb_parties, journal, ecrivain)
+    Championnat.afficher(resultats)
+    return resultats
 
 
-def analyser_probabilites_cases():
-    """Analyse les probabilités de tomber sur chaque case"""
+def analyser_probabilites_cases(paie_sortie: bool = False):
+    """Analyse les probabilités de tomber sur chaque case (calcul exact, chaîne de Markov)"""
     print(f"\n{'=' * 60}")
     print("ANALYSE PROBABILISTE DES CASES")
     print(f"{'=' * 60}")
     
-    # Simuler beaucoup de lancers
-    passages = {}
-    position = 0
-    
-    for _ in range(10000):
-        d1 = random.randint(1, 6)
-        d2 = random.randint(1, 6)
-        position = (position + d1 + d2) % 40
-        
-        if position not in passages:
-            passages[position] = 0
-        passages[position] += 1
+    chaine = ChaineMarkov(paie_sortie=paie_sortie)
+    probabilites = chaine.probabilites_atterrissage()
     
     # Afficher le top 10
-    print("\nTop 10 des cases les plus probables (sur 10000 lancers):")
-    top = sorted(passages.items(), key=lambda x: x[1], reverse=True)[:10]
-    for pos, nb in top:
-        print(f"  Case {pos}: {nb} passages ({nb / 100:.2f}%)")
+    print("\nTop 10 des cases les plus probables (distribution stationnaire):")
+    top = sorted(enumerate(probabilites), key=lambda x: x[1], reverse=True)[:10]
+    for pos, p in top:
+        print(f"  Case {pos} ({chaine.definition.cases[pos].nom}): {p * 100:.2f}%")
+    print(f"\nProbabilité d'être en prison en fin de tour: {chaine.probabilite_prison() * 100:.2f}%")
+    return probabilites
 
 
 # =============================================================================
@@ -1113,14 +3422,62 @@ def analyser_probabilites_cases():
 
 class MonopolyIA(Monopoly):
     """Version du Monopoly avec support des stratégies IA et statistiques"""
-    def __init__(self, noms_joueurs: List[str], strategie: StrategieIA = None):
-        super().__init__(noms_joueurs)
-        self.strategie = strategie if strategie else StrategieIA("Défaut")
-        self.stats = StatistiquesPartie()
+    def __init__(self, noms_joueurs: List[str], strategie: StrategieIA = None,
+                 journal: Optional[Journal] = None, rng: Optional[FluxAleatoire] = None,
+                 strategies: Optional[List[StrategieIA]] = None, regles: Optional[Regles] = None):
+        """strategies : une stratégie par joueur (sinon `strategie` pour tous)"""
+        super().__init__(noms_joueurs, journal, rng, regles)
+        if strategies is not None and len(strategies) != len(self.joueurs):
+            raise ValueError("Une stratégie par joueur attendue")
+        self.strategie = strategie if strategie else strategies[0] if strategies else StrategieIA("Défaut")
+        self.stats = StatistiquesPartie(self.plateau.definition)
+        for j, strat in zip(self.joueurs, strategies or [self.strategie] * len(self.joueurs)):
+            j.strategie = strat
+        for strat in {id(j.strategie): j.strategie for j in self.joueurs}.values():
+            strat.preparer(self)
+        self._installer_actions()
+    
+    def _installer_actions(self):
+        super()._installer_actions()
+        # Arrivée par les dés : les propriétés passent par la stratégie du joueur (les
+        # déplacements par carte et les sorties de prison gardent plateau.actions)
+        self.actions_des = list(self.plateau.actions)
+        for position in self.plateau.definition.positions_proprietes:
+            self.actions_des[position] = self._arrivee_propriete
+    
+    def liberer(self):
+        super().liberer()
+        self.actions_des = []
+    
+    @property
+    def strategies(self) -> List[StrategieIA]:
+        return [j.strategie for j in self.joueurs]
+    
+    @property
+    def nom_strategies(self) -> str:
+        """Nom de la stratégie commune, ou des stratégies en présence ("Agressive/Stratégique")"""
+        noms = list(dict.fromkeys(s.nom for s in self.strategies))
+        return "/".join(noms)
+    
+    def instantane(self) -> bytes:
+        """Instantané du moteur suivi des statistiques (tours, passages, loyers)"""
+        stats = self.stats
+        return (super().instantane() + struct.pack("<H", stats.nb_tours)
+                + stats.passages_par_case.tobytes() + stats.revenus_par_case.tobytes())
+    
+    def restaurer(self, donnees: bytes) -> int:
+        i = super().restaurer(donnees)
+        stats = self.stats
+        (stats.nb_tours,) = struct.unpack_from("<H", donnees, i)
+        i += 2
+        stats.passages_par_case[:] = array('q', donnees[i:i + 320])
+        stats.revenus_par_case[:] = array('q', donnees[i + 320:i + 640])
+        return i + 640
     
     def jouer_tour(self, joueur: Joueur):
         """Jouer un tour avec enregistrement des stats"""
-        print(f"\n--- Tour {self.tour_numero} : {joueur.nom} ({joueur.argent}€) ---")
+        journal = self.journal
+        journal.emettre("debut_tour", self.tour_numero, joueur.nom, joueur.argent)
         
         if joueur.en_prison:
             self._gerer_prison(joueur)
@@ -1128,72 +3485,73 @@ class MonopolyIA(Monopoly):
                 return
         
         d1, d2 = self.lancer_des()
-        print(f"Lancer : {d1} + {d2} = {d1 + d2}")
+        journal.emettre("des", d1, d2, d1 + d2)
         
         # Règle des 3 doubles
         if d1 == d2:
             joueur.doubles_consecutifs += 1
             if joueur.doubles_consecutifs == 3:
-                print("3 Doubles -> Prison !")
+                journal.emettre("trois_doubles")
                 joueur.aller_en_prison()
                 return
         else:
             joueur.doubles_consecutifs = 0
         
         joueur.deplacer(d1 + d2)
-        case = self.plateau.get_case(joueur.position)
+        position = joueur.position
         
         # Enregistrer le passage dans les stats
-        self.stats.enregistrer_passage(case)
+        self.stats.enregistrer_passage(self.plateau.cases[position])
         
-        # Action avec IA
-        self._action_avec_ia(joueur, case)
+        # Action de la case (stratégie IA pour les propriétés)
+        self.actions_des[position](joueur, self)
     
-    def _action_avec_ia(self, joueur: Joueur, case: Case):
-        """Exécute l'action sur la case en utilisant la stratégie IA"""
-        if isinstance(case, Propriete):
-            print(f"-> {case.nom} (Prix: {case.prix}€, Loyer: {case.calculer_loyer()}€)")
-            
-            if case.proprietaire is None:
-                # Demander à l'IA si on achète
-                if self.strategie.decider_achat(joueur, case):
-                    if joueur.acheter_propriete(case):
-                        print(f"{joueur.nom} achète {case.nom} pour {case.prix}€")
-                    else:
-                        print(f"{joueur.nom} ne peut pas acheter (pas assez d'argent)")
+    def _arrivee_propriete(self, joueur: Joueur, jeu: 'Monopoly' = None):
+        """Arrivée sur une propriété : achat, construction ou loyer selon la stratégie"""
+        case = self.plateau.cases[joueur.position]
+        journal = self.journal
+        if journal.actif:
+            journal.emettre("arrivee_propriete", case.nom, case.prix, case.calculer_loyer())
+        
+        if case.proprietaire is None:
+            # Demander à l'IA du joueur si on achète
+            if joueur.strategie.decider_achat(joueur, case):
+                if joueur.acheter_propriete(case):
+                    journal.emettre("achat", joueur.nom, case.nom, case.prix, case.position)
                 else:
-                    print(f"{joueur.nom} décide de ne pas acheter")
-            
-            elif case.proprietaire == joueur:
-                print("Vous êtes chez vous.")
-                # Essayer de construire avec l'IA stratégique
-                if isinstance(self.strategie, IAStrategique):
-                    prop_construire = self.strategie.decider_construction(joueur)
-                    if prop_construire:
-                        prop_construire.construire_maison(joueur)
-            
+                    journal.emettre("achat_impossible", joueur.nom, case.position)
             else:
-                # Payer le loyer
-                loyer = case.calculer_loyer()
-                
-                # Règle : Loyer doublé si terrain nu + quartier complet
-                if case.nb_maisons == 0 and not case.a_hotel:
-                    if case.proprietaire.possede_quartier(case.couleur, self.plateau.cases):
-                        loyer = loyer * 2
-                        print("(Loyer doublé : quartier complet !)")
-                
-                joueur.payer(loyer, case.proprietaire)
-                print(f"Loyer de {loyer}€ payé à {case.proprietaire.nom}")
-                
-                # Enregistrer le loyer dans les stats
-                self.stats.enregistrer_loyer(case, loyer)
+                journal.emettre("achat_refuse", joueur.nom, case.position)
+        
+        elif case.proprietaire == joueur:
+            journal.emettre("chez_soi")
+            if case.hypothequee and joueur.strategie.decider_levee_hypotheque(joueur, case):
+                case.lever_hypotheque(joueur)
+            # Construire si la stratégie le décide (la stratégie de base ne construit pas)
+            prop_construire = joueur.strategie.decider_construction(joueur)
+            if prop_construire:
+                prop_construire.construire_maison(joueur)
+        
         else:
-            # Case spéciale
-            case.action(joueur, self)
+            # Payer le loyer
+            loyer = case.calculer_loyer()
+            
+            # Règle : Loyer doublé si terrain nu + quartier complet
+            if case.nb_maisons == 0 and not case.a_hotel:
+                if case.proprietaire.possede_quartier(case.couleur, self.plateau.cases):
+                    loyer = loyer * 2
+                    journal.emettre("loyer_double")
+            
+            joueur.payer(loyer, case.proprietaire)
+            journal.emettre("loyer", loyer, case.proprietaire.nom)
+            
+            # Enregistrer le loyer dans les stats
+            self.stats.enregistrer_loyer(case, loyer)
     
-    def jouer_partie(self, max_tours: int = 200) -> Optional[Joueur]:
-        """Joue une partie complète et retourne le gagnant"""
-        print("=== DÉBUT PARTIE ===")
+    def jouer_partie(self, max_tours: int = 200, arret: Optional[ArretAnticipe] = None) -> Optional[Joueur]:
+        """Joue une partie complète et retourne le gagnant (arrêt anticipé : voir Monopoly)"""
+        self.journal.emettre("debut_partie")
+        self.meneur, self.tours_en_tete, self.issue_acquise = None, 0, False
         
         while not self.partie_terminee() and self.tour_numero < max_tours:
             self.tour_numero += 1
@@ -1206,6 +3564,8 @@ class MonopolyIA(Monopoly):
             # Afficher un résumé tous les 10 tours (Séance 3)
             if self.tour_numero % 10 == 0:
                 self._afficher_resume_tour()
+            if arret and self._verifier_issue(arret):
+                break
         
         # Enregistrer les stats finales
         self.stats.nb_tours = self.tour_numero
@@ -1216,31 +3576,1346 @@ class MonopolyIA(Monopoly):
         self._afficher_resultat_final()
         return gagnant
     
-    def _afficher_resume_tour(self):
-        """Affiche un résumé de la situation"""
-        print(f"\n--- RÉSUMÉ TOUR {self.tour_numero} ---")
-        for j in self.joueurs:
-            statut = "FAILLITE" if j.est_en_faillite else f"{j.argent}€, {len(j.proprietes)} props"
-            print(f"  {j.nom}: {statut}")
-    
     def _afficher_resultat_final(self):
         """Affiche le résultat final de la partie"""
-        print("\n" + "=" * 50)
-        print("RÉSULTAT FINAL")
-        print("=" * 50)
+        super()._afficher_resultat_final(detail_proprietes=False)
+
+
+# =============================================================================
+# REJEU DES PARTIES (JOURNAL BINAIRE)
+# =============================================================================
+
+# Stratégies reconstruites à partir du nom enregistré dans un journal binaire
+STRATEGIES_PAR_NOM = {
+    "Agressive": IAAgressive,
+    "Conservative": IAConservative,
+    "Stratégique": IAStrategique,
+    "Défaut": lambda: StrategieIA("Défaut"),
+}
+
+
+class RejeuPartie:
+    """Reconstruit une partie enregistrée par JournalBinaire
+
+    Le moteur est déterministe une fois les dés et les cartes connus : le rejeu
+    impose à une nouvelle partie les lancers et l'ordre des pioches lus dans le
+    journal, puis vérifie que la partie rejouée produit le même journal.
+    """
+    def __init__(self, donnees: bytes, strategie=None, regles: Optional[Regles] = None):
+        """strategie : stratégie (ou liste d'une stratégie par joueur) à la place de celle
+        reconstruite depuis son nom ; regles : à la place de celles lues dans le journal"""
+        self.donnees = bytes(donnees)
+        self.noms, self.nom_strategie, debut = JournalBinaire.lire_entete(self.donnees)
+        self.strategie = strategie
+        self.regles = regles if regles is not None else JournalBinaire.lire_regles(self.donnees)
+        des = bytearray()
+        self.pioches = {paquet: [] for paquet in PAQUETS_CARTES}
+        self.nb_tours = 0
+        precedent = len(self.noms)
+        for type_, valeur, *_ in JournalBinaire.enregistrements(self.donnees, debut):
+            if type_ == JournalBinaire.DES:
+                des.append(valeur)
+            elif type_ == JournalBinaire.CARTE:
+                self.pioches[PAQUETS_CARTES[valeur >> 4]].append(valeur & 0x0F)
+            elif type_ == JournalBinaire.TOUR:
+                # Nouveau tour de table quand l'ordre des joueurs repart en arrière
+                if valeur <= precedent:
+                    self.nb_tours += 1
+                precedent = valeur
+        self.des = bytes(des)
+
+    def _nouvelle_partie(self) -> Monopoly:
+        journal = JournalBinaire(self.noms, self.nom_strategie)
+        rng = FluxAleatoire(0)
+        if self.nom_strategie is None:
+            jeu = Monopoly(self.noms, journal=journal, rng=rng, regles=self.regles)
+        elif isinstance(self.nom_strategie, str):
+            strategie = self.strategie or STRATEGIES_PAR_NOM[self.nom_strategie]()
+            jeu = MonopolyIA(self.noms, strategie=strategie, journal=journal, rng=rng, regles=self.regles)
+        else:
+            strategies = self.strategie or [STRATEGIES_PAR_NOM[nom]() for nom in self.nom_strategie]
+            jeu = MonopolyIA(self.noms, journal=journal, rng=rng, strategies=strategies, regles=self.regles)
+        rng.imposer_des(self.des)
+        for paquet in (jeu.cartes_chance, jeu.cartes_communaute):
+            paquet.imposer(self.pioches[paquet.type_paquet])
+        return jeu
+
+    def etat_au_tour(self, tour: Optional[int] = None) -> Monopoly:
+        """Partie rejouée jusqu'à la fin du tour de table `tour` (par défaut, la fin)"""
+        tour = self.nb_tours if tour is None else min(tour, self.nb_tours)
+        jeu = self._nouvelle_partie()
+        jeu.jouer_partie(max_tours=tour)
+        rejoue = jeu.journal.donnees
+        if self.donnees[:len(rejoue)] != rejoue:
+            raise ValueError(f"Rejeu divergent au tour {jeu.tour_numero} : journal incompatible avec ce plateau "
+                             "ou cette stratégie")
+        return jeu
+
+    def evenements(self) -> List[tuple]:
+        """Journal décodé en tuples lisibles ("des", 3, 5), ("loyer", "Bob", 26)..."""
+        noms = self.noms
+        _, _, debut = JournalBinaire.lire_entete(self.donnees)
+        lisibles = []
+        for type_, valeur, *montant in JournalBinaire.enregistrements(self.donnees, debut):
+            if type_ == JournalBinaire.DES:
+                lisibles.append(("des",) + FluxAleatoire.PAIRES[valeur])
+            elif type_ == JournalBinaire.TOUR:
+                lisibles.append(("tour", noms[valeur]))
+            elif type_ == JournalBinaire.CARTE:
+                carte = TABLES_CARTES[PAQUETS_CARTES[valeur >> 4]][valeur & 0x0F]
+                lisibles.append(("carte", carte.description))
+            elif type_ == JournalBinaire.LOYER:
+                lisibles.append(("loyer", noms[valeur], montant[0]))
+            elif type_ == JournalBinaire.FAILLITE:
+                lisibles.append(("faillite", noms[valeur]))
+            else:
+                code = {JournalBinaire.ACHAT: "achat", JournalBinaire.REFUS: "refus",
+                        JournalBinaire.CONSTRUCTION: "construction"}[type_]
+                lisibles.append((code, valeur))
+        return lisibles
+
+
+# =============================================================================
+# SIMULATION VECTORISÉE (NUMPY)
+# =============================================================================
+
+def _importer_numpy():
+    """Importe NumPy à la demande (dépendance optionnelle du simulateur vectorisé)"""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Le simulateur vectorisé nécessite NumPy (pip install numpy)") from e
+    return numpy
+
+
+class SimulateurVectorise:
+    """Joue un lot de parties en parallèle (lock-step) avec des opérations NumPy
+    
+    L'état de toutes les parties est stocké dans des tableaux (parties × joueurs)
+    et (parties × cases). Les règles reproduisent MonopolyIA.jouer_tour : prison,
+    3 doubles, passage par Départ, cartes, achat selon la stratégie, loyers,
+    construction de l'IA stratégique et faillites. Les cases atteintes par une
+    carte ou une sortie de prison suivent les règles de Propriete.action, comme
+    dans le moteur objet. Les égalités de ROI sont départagées par position.
+    Seules les règles historiques sont simulées (pas de Regles facultatives).
+    """
+    # Codes des stratégies intégrées (StrategieIA.nom -> code)
+    CODES_STRATEGIES = {"Défaut": 0, "Agressive": 1, "Conservative": 2, "Stratégique": 3}
+    # Règles de Monopoly.jouer_tour / Propriete.action (achat automatique, construction sur place)
+    REGLES_BASE = 4
+
+    def __init__(self, nb_parties: int, nb_joueurs: int, strategies=None,
+                 definition: Optional[DefinitionPlateau] = None, graine: Optional[int] = None,
+                 regles: Optional[Regles] = None):
+        if regles is not None and regles.binaire() != REGLES_HISTORIQUES.binaire():
+            raise ValueError(f"Règles non vectorisables: {regles!r} (seules les règles historiques le sont)")
+        np = _importer_numpy()
+        self.np = np
+        self.nb_parties = nb_parties
+        self.nb_joueurs = nb_joueurs
+        self.rng = np.random.default_rng(graine)
         
-        gagnant = self.obtenir_gagnant()
+        # Stratégie par siège : None = règles de base, une stratégie ou une liste par joueur
+        if strategies is None or isinstance(strategies, StrategieIA):
+            strategies = [strategies] * nb_joueurs
+        codes = []
+        for strat in strategies:
+            if strat is None:
+                codes.append(self.REGLES_BASE)
+            elif strat.nom in self.CODES_STRATEGIES:
+                codes.append(self.CODES_STRATEGIES[strat.nom])
+            else:
+                raise ValueError(f"Stratégie non vectorisable: {strat.nom}")
+        self.codes_strategies = codes
+        
+        # Tableaux constants du plateau
+        definition = definition if definition else DefinitionPlateau.standard(JournalSilencieux())
+        couleurs = list(definition.quartiers)
+        prix, loyers, prix_maisons, groupes = [], [], [], []
+        for d in definition.cases:
+            couleur = couleur_quartier(d)
+            groupes.append(couleurs.index(couleur) if couleur is not None else -1)
+            # Mêmes valeurs que les classes Gare et Compagnie
+            if d.type_case == "gare":
+                prix.append(200); loyers.append(25); prix_maisons.append(0)
+            elif d.type_case == "compagnie":
+                prix.append(150); loyers.append(0); prix_maisons.append(0)
+            else:
+                prix.append(d.prix); loyers.append(d.loyer); prix_maisons.append(d.prix_maison)
+        self.types = np.array(definition.types)
+        self.prix = np.array(prix, dtype=np.int64)
+        self.loyers = np.array(loyers, dtype=np.int64)
+        self.prix_maisons = np.array(prix_maisons, dtype=np.int64)
+        self.groupes = np.array(groupes)
+        self.tailles = np.array([definition.tailles_quartiers[c] for c in couleurs])
+        # Matrice d'appartenance case -> quartier (40 × nb quartiers)
+        self.appartenance = np.zeros((40, len(couleurs)), dtype=np.int64)
+        for pos, g in enumerate(groupes):
+            if g >= 0:
+                self.appartenance[pos, g] = 1
+        self.terrains = self.types == TYPE_PROPRIETE
+        # Quartiers constructibles (ni gares ni compagnies)
+        self.quartiers_terrains = np.array([c not in ("gare", "Compagnie") for c in couleurs])
+        
+        # Paquets de cartes : codes d'effet et valeurs
+        # Revenus attendus (IAStrategique) : rendement de construction et rentabilité d'achat
+        table = TableRevenus.pour_plateau(definition)
+        self.rendements = np.array([list(r) + [0.0] for r in table.rendements])
+        self.achat_rentable = np.array(table.rentabilites) >= table.rentabilite_mediane
+        
+        tables = [TABLES_CARTES[paquet] for paquet in PAQUETS_CARTES]
+        self.effets = [np.array([carte.effet for carte in table]) for table in tables]
+        self.valeurs = [np.array([carte.valeur for carte in table], dtype=np.int64) for table in tables]
+
+    # ------------------------------------------------------------------
+    # Boucle principale
+    # ------------------------------------------------------------------
+
+    def simuler(self, max_tours: int = 200) -> Dict[str, object]:
+        """Joue toutes les parties et retourne les résultats sous forme de tableaux"""
+        np = self.np
+        G, P = self.nb_parties, self.nb_joueurs
+        self.argent = np.full((G, P), 1500, dtype=np.int64)
+        self.position = np.zeros((G, P), dtype=np.int64)
+        self.prison = np.zeros((G, P), dtype=bool)
+        self.tours_prison = np.zeros((G, P), dtype=np.int64)
+        self.doubles = np.zeros((G, P), dtype=np.int64)
+        self.liberte = np.zeros((G, P), dtype=np.int64)
+        self.faillite = np.zeros((G, P), dtype=bool)
+        self.proprietaires = np.full((G, 40), -1, dtype=np.int64)
+        self.maisons = np.zeros((G, 40), dtype=np.int64)
+        self.hotels = np.zeros((G, 40), dtype=bool)
+        self.dernier_lancer = np.zeros((G, 40), dtype=np.int64)
+        # Nombre de cases possédées par (partie, joueur, quartier), tenu à jour à chaque achat
+        self.compteurs = np.zeros((G, P, len(self.tailles)), dtype=np.int64)
+        self.des = np.zeros(G, dtype=np.int64)
+        self.pioches = [self._nouvelles_pioches(G) for _ in range(2)]
+        self.curseurs = [np.zeros(G, dtype=np.int64) for _ in range(2)]
+        self.passages = np.zeros(40, dtype=np.int64)
+        self.revenus = np.zeros(40, dtype=np.int64)
+        
+        termine = np.zeros(G, dtype=bool)
+        nb_tours = np.zeros(G, dtype=np.int64)
+        for tour in range(1, max_tours + 1):
+            if termine.all():
+                break
+            nb_tours[~termine] = tour
+            for p in range(P):
+                idx = np.flatnonzero(~termine & ~self.faillite[:, p])
+                if idx.size:
+                    self._jouer_tour(idx, p)
+                termine |= (~self.faillite).sum(axis=1) <= 1
+        
+        # Même règle que Monopoly.obtenir_gagnant : joueur en lice au plus gros patrimoine
+        patrimoines = self._patrimoines()
+        en_jeu = ~self.faillite
+        gagnants = np.where(en_jeu.any(axis=1), np.where(en_jeu, patrimoines, -1).argmax(axis=1), -1)
+        return {
+            "gagnants": gagnants,
+            "patrimoines": patrimoines,
+            "nb_tours": nb_tours,
+            "argent": self.argent,
+            "faillites": self.faillite,
+            "passages": self.passages,
+            "revenus": self.revenus,
+        }
+
+    def _jouer_tour(self, idx, p: int):
+        """Tour du joueur p dans les parties idx (voir MonopolyIA.jouer_tour)"""
+        np = self.np
+        en_prison = self.prison[idx, p]
+        if en_prison.any():
+            self._gerer_prison(idx[en_prison], p)
+            idx = idx[~self.prison[idx, p] & ~self.faillite[idx, p]]
+        if not idx.size:
+            return
+        
+        d1, d2 = self._lancer(idx)
+        # Règle des 3 doubles
+        self.doubles[idx, p] = np.where(d1 == d2, self.doubles[idx, p] + 1, 0)
+        trois = self.doubles[idx, p] == 3
+        self._aller_en_prison(idx[trois], p)
+        idx, somme = idx[~trois], (d1 + d2)[~trois]
+        
+        self._deplacer(idx, p, somme)
+        self.passages += np.bincount(self.position[idx, p], minlength=40)
+        self._resoudre(idx, p, ia=True)
+
+    def _gerer_prison(self, idx, p: int):
+        """Sortie de prison : carte, paiement si riche, sinon essai aux dés"""
+        np = self.np
+        carte = self.liberte[idx, p] > 0
+        sortie = idx[carte]
+        self.liberte[sortie, p] -= 1
+        self._sortir(sortie, p)
+        
+        reste = idx[~carte]
+        riche = self.argent[reste, p] > 1000
+        sortie = reste[riche]
+        self.argent[sortie, p] -= 50
+        self._sortir(sortie, p)
+        
+        reste = reste[~riche]
+        if not reste.size:
+            return
+        d1, d2 = self._lancer(reste)
+        double = d1 == d2
+        sortie = reste[double]
+        self._sortir(sortie, p)
+        self._deplacer(sortie, p, (d1 + d2)[double])
+        self._resoudre(sortie, p, ia=False)
+        
+        reste, somme = reste[~double], (d1 + d2)[~double]
+        self.tours_prison[reste, p] += 1
+        forcee = self.tours_prison[reste, p] >= 3
+        sortie, somme = reste[forcee], somme[forcee]
+        self._payer(sortie, p, np.full(sortie.size, 50), -1)
+        self._sortir(sortie, p)
+        solvable = ~self.faillite[sortie, p]
+        sortie = sortie[solvable]
+        self._deplacer(sortie, p, somme[solvable])
+        self._resoudre(sortie, p, ia=False)
+
+    # ------------------------------------------------------------------
+    # Primitives (équivalents vectorisés des méthodes de Joueur)
+    # ------------------------------------------------------------------
+
+    def _lancer(self, idx):
+        d = self.rng.integers(1, 7, size=(2, idx.size))
+        self.des[idx] = d[0] + d[1]
+        return d[0], d[1]
+
+    def _deplacer(self, idx, p: int, nombre):
+        ancienne = self.position[idx, p]
+        nouvelle = (ancienne + nombre) % 40
+        self.position[idx, p] = nouvelle
+        self.argent[idx, p] += 200 * ((nouvelle < ancienne) & (nombre > 0))
+
+    def _aller_en_prison(self, idx, p: int):
+        self.position[idx, p] = 10
+        self.prison[idx, p] = True
+        self.tours_prison[idx, p] = 0
+        self.doubles[idx, p] = 0
+
+    def _sortir(self, idx, p: int):
+        self.prison[idx, p] = False
+        self.tours_prison[idx, p] = 0
+
+    def _payer(self, idx, payeur: int, montants, creanciers):
+        """Joueur.payer : paiement si possible, sinon faillite au profit du créancier"""
+        np = self.np
+        if not idx.size:
+            return
+        creanciers = np.broadcast_to(creanciers, idx.shape)
+        solvable = self.argent[idx, payeur] >= montants
+        g, m, c = idx[solvable], montants[solvable], creanciers[solvable]
+        self.argent[g, payeur] -= m
+        joueur = c >= 0
+        self.argent[g[joueur], c[joueur]] += m[joueur]
+        if not solvable.all():
+            self._faillite(idx[~solvable], payeur, creanciers[~solvable])
+
+    def _faillite(self, idx, p: int, creanciers):
+        """Joueur.declarer_faillite : biens au créancier, ou à la banque sans constructions"""
+        np = self.np
+        self.faillite[idx, p] = True
+        self.argent[idx, p] = 0
+        possedees = self.proprietaires[idx] == p
+        creanciers = creanciers[:, None]
+        self.proprietaires[idx] = np.where(possedees, creanciers, self.proprietaires[idx])
+        banque = possedees & (creanciers < 0)
+        self.maisons[idx] = np.where(banque, 0, self.maisons[idx])
+        self.hotels[idx] = self.hotels[idx] & ~banque
+        # Recalcul des compteurs des parties concernées (événement rare)
+        par_joueur = self.proprietaires[idx][:, :, None] == np.arange(self.nb_joueurs)
+        self.compteurs[idx] = np.einsum("kcp,cq->kpq", par_joueur.astype(np.int64), self.appartenance)
+
+    def _patrimoines(self):
+        """Joueur.patrimoine de chaque siège dans chaque partie (parties × joueurs)"""
+        np = self.np
+        valeurs = self.prix[None, :] + np.where(self.hotels, 5, self.maisons) * self.prix_maisons[None, :]
+        par_joueur = self.proprietaires[:, :, None] == np.arange(self.nb_joueurs)
+        biens = np.einsum("gcp,gc->gp", par_joueur.astype(np.int64), valeurs)
+        return np.where(self.faillite, 0, self.argent + biens)
+
+    def _nb_possedees(self, idx, joueurs, positions):
+        """Nombre de cases du quartier de `positions` possédées par `joueurs`"""
+        return self.compteurs[idx, joueurs, self.groupes[positions]]
+
+    # ------------------------------------------------------------------
+    # Résolution des cases
+    # ------------------------------------------------------------------
+
+    def _resoudre(self, idx, p: int, ia: bool):
+        """Action de la case atteinte ; les déplacements par carte sont résolus ensuite"""
+        np = self.np
+        while idx.size:
+            types = self.types[self.position[idx, p]]
+            taxe = idx[types == TYPE_TAXE]
+            self._payer(taxe, p, np.full(taxe.size, 100), -1)
+            self._aller_en_prison(idx[types == TYPE_ALLEZ_PRISON], p)
+            deplaces = [
+                self._piocher(idx[types == TYPE_CHANCE], p, 0),
+                self._piocher(idx[types == TYPE_CAISSE], p, 1),
+            ]
+            self._propriete(idx[types <= TYPE_COMPAGNIE], p, ia)
+            # Case.action après une carte : règles de base
+            idx = np.concatenate(deplaces)
+            ia = False
+
+    def _propriete(self, idx, p: int, ia: bool):
+        np = self.np
+        if not idx.size:
+            return
+        pos = self.position[idx, p]
+        code = self.codes_strategies[p] if ia else self.REGLES_BASE
+        if code == self.REGLES_BASE:
+            # Compagnie.action retient le lancer (pas MonopolyIA._arrivee_propriete)
+            compagnie = self.types[pos] == TYPE_COMPAGNIE
+            self.dernier_lancer[idx[compagnie], pos[compagnie]] = self.des[idx[compagnie]]
+        proprio = self.proprietaires[idx, pos]
+        
+        # Achat
+        libre = proprio < 0
+        g, pos_l = idx[libre], pos[libre]
+        argent, prix = self.argent[g, p], self.prix[pos_l]
+        if code == 0:
+            achat = np.zeros(g.size, dtype=bool)
+        elif code == 2:
+            achat = argent >= 2 * prix
+        elif code == 3:
+            deja = self._nb_possedees(g, np.full(g.size, p), pos_l) >= 1
+            achat = (argent >= 1.5 * prix) & (deja | (argent >= 3 * prix) | self.achat_rentable[pos_l])
+        else:
+            achat = argent >= prix
+        achat &= argent >= prix
+        g, pos_l = g[achat], pos_l[achat]
+        self.argent[g, p] -= self.prix[pos_l]
+        self.proprietaires[g, pos_l] = p
+        self.compteurs[g, p, self.groupes[pos_l]] += 1
+        
+        # Chez soi : construction
+        chez_soi = proprio == p
+        g, pos_c = idx[chez_soi], pos[chez_soi]
+        if code == 3:
+            self._construire_strategique(g, p)
+        elif code == self.REGLES_BASE and g.size:
+            complet = self._nb_possedees(g, np.full(g.size, p), pos_c) == self.tailles[self.groupes[pos_c]]
+            ok = complet & (self.argent[g, p] > 500)
+            self._construire(g[ok], p, pos_c[ok])
+        
+        # Loyer
+        autre = (proprio >= 0) & (proprio != p)
+        g, pos_a, creancier = idx[autre], pos[autre], proprio[autre]
+        if g.size:
+            loyers = self._loyers(g, pos_a, creancier)
+            if ia:
+                np.add.at(self.revenus, pos_a, loyers)
+            self._payer(g, p, loyers, creancier)
+
+    def _loyers(self, idx, pos, proprio):
+        """Propriete/Gare/Compagnie.calculer_loyer, avec le doublement du quartier complet"""
+        np = self.np
+        base, maisons, hotel = self.loyers[pos], self.maisons[idx, pos], self.hotels[idx, pos]
+        loyers = np.where(hotel, base * 5, np.where(maisons > 0, base * (2 ** maisons), base))
+        nb = self._nb_possedees(idx, proprio, pos)
+        types = self.types[pos]
+        loyers = np.where(types == TYPE_GARE, 25 * 2 ** np.maximum(nb - 1, 0), loyers)
+        loyers = np.where(types == TYPE_COMPAGNIE,
+                          self.dernier_lancer[idx, pos] * np.where(nb == 2, 10, 4), loyers)
+        # Règle : loyer doublé si terrain nu + quartier complet
+        double = (maisons == 0) & ~hotel & (nb == self.tailles[self.groupes[pos]])
+        return np.where(double, loyers * 2, loyers)
+
+    def _construire(self, idx, p: int, pos):
+        """Propriete.construire_maison (quartier complet déjà vérifié)"""
+        hotel = self.hotels[idx, pos]
+        ok = ~hotel & (self.argent[idx, p] >= self.prix_maisons[pos])
+        g, pos = idx[ok], pos[ok]
+        self.argent[g, p] -= self.prix_maisons[pos]
+        maisons = self.maisons[g, pos]
+        vers_hotel = maisons >= 4
+        self.maisons[g, pos] = self.np.where(vers_hotel, 0, maisons + 1)
+        self.hotels[g[vers_hotel], pos[vers_hotel]] = True
+
+    def _construire_strategique(self, idx, p: int):
+        """IAStrategique.decider_construction : meilleur ROI sur les quartiers complets"""
+        np = self.np
+        complets = (self.compteurs[idx, p] == self.tailles[None, :]) & self.quartiers_terrains[None, :]
+        # Seules les parties avec au moins un quartier complet sont examinées
+        idx, complets = idx[complets.any(axis=1)], complets[complets.any(axis=1)]
+        if not idx.size:
+            return
+        possedees = self.proprietaires[idx] == p
+        complet_case = np.where(self.groupes >= 0, complets[:, np.maximum(self.groupes, 0)], False)
+        maisons = self.maisons[idx]
+        candidates = (possedees & complet_case & self.terrains[None, :] & (maisons < 4)
+                      & ~self.hotels[idx] & (self.argent[idx, p][:, None] >= self.prix_maisons[None, :]))
+        # ROI lu dans la table des revenus attendus (case × nombre de maisons)
+        roi = np.where(candidates, self.rendements[np.arange(40)[None, :], np.minimum(maisons, 4)], 0)
+        meilleure = roi.argmax(axis=1)
+        ok = roi[np.arange(idx.size), meilleure] > 0
+        g, pos = idx[ok], meilleure[ok]
+        self.argent[g, p] -= self.prix_maisons[pos]
+        self.maisons[g, pos] += 1
+
+    # ------------------------------------------------------------------
+    # Cartes
+    # ------------------------------------------------------------------
+
+    def _nouvelles_pioches(self, n: int):
+        return self.np.argsort(self.rng.random((n, 10)), axis=1)
+
+    def _piocher(self, idx, p: int, paquet: int):
+        """PaquetCartes.piocher_et_executer ; retourne les parties où le joueur s'est déplacé"""
+        np = self.np
+        if not idx.size:
+            return idx
+        pioche, curseur = self.pioches[paquet], self.curseurs[paquet]
+        vide = idx[curseur[idx] >= pioche.shape[1]]
+        if vide.size:
+            pioche[vide] = self._nouvelles_pioches(vide.size)
+            curseur[vide] = 0
+        cartes = pioche[idx, curseur[idx]]
+        curseur[idx] += 1
+        effets, valeurs = self.effets[paquet][cartes], self.valeurs[paquet][cartes]
+        
+        sel = effets == EFFET_ALLER_A
+        g, cible = idx[sel], valeurs[sel]
+        self.argent[g, p] += 200 * (cible < self.position[g, p])
+        self.position[g, p] = cible
+        deplaces = [g]
+        
+        sel = effets == EFFET_RECULER
+        g = idx[sel]
+        self.position[g, p] = (self.position[g, p] - valeurs[sel]) % 40
+        deplaces.append(g)
+        
+        self._aller_en_prison(idx[effets == EFFET_PRISON], p)
+        sel = effets == EFFET_PAYER
+        self._payer(idx[sel], p, valeurs[sel], -1)
+        self.liberte[idx[effets == EFFET_LIBERTE], p] += 1
+        sel = effets == EFFET_RECEVOIR
+        self.argent[idx[sel], p] += valeurs[sel]
+        
+        sel = effets == EFFET_PAYER_CHACUN
+        g, v = idx[sel], valeurs[sel]
+        for q in range(self.nb_joueurs):
+            if q != p:
+                actif = ~self.faillite[g, q]
+                self._payer(g[actif], p, v[actif], q)
+        sel = effets == EFFET_RECEVOIR_CHACUN
+        g, v = idx[sel], valeurs[sel]
+        for q in range(self.nb_joueurs):
+            if q != p:
+                actif = ~self.faillite[g, q]
+                self._payer(g[actif], q, v[actif], p)
+        
+        return np.concatenate(deplaces)
+
+
+def simuler_parties_vectorise(nb_parties: int, nb_joueurs: int, strategie: Optional[StrategieIA] = None,
+                              max_tours: int = 200, graine: Optional[int] = None) -> Dict[str, object]:
+    """Équivalent vectorisé de simuler_parties (toutes les parties en un seul lot)"""
+    nom = strategie.nom if strategie else "règles de base"
+    print(f"\nSimulation vectorisée de {nb_parties} parties avec stratégie {nom}")
+    resultats = SimulateurVectorise(nb_parties, nb_joueurs, strategie, graine=graine).simuler(max_tours)
+    
+    victoires = int((resultats["gagnants"] >= 0).sum())
+    print(f"  Parties terminées avec gagnant: {victoires}/{nb_parties}")
+    print(f"  Durée moyenne: {resultats['nb_tours'].mean():.1f} tours")
+    return resultats
+
+
+# =============================================================================
+# SIMULATION PARALLÈLE (PLUSIEURS PROCESSUS)
+# =============================================================================
+
+def _jouer_lot(strategies: List[StrategieIA], nb_joueurs: int, max_tours: int,
+               graine: int, arret: Optional[ArretAnticipe], regles: Optional[Regles],
+               indices: range) -> Dict[str, object]:
+    """Joue les parties `indices` d'un tournoi (exécuté dans un processus de travail)"""
+    victoires = {s.nom: 0 for s in strategies}
+    parties = {s.nom: 0 for s in strategies}
+    stats = AgregatStatistiques()
+    journal = JournalSilencieux()
+    noms = [f"J{j+1}" for j in range(nb_joueurs)]
+    maitre = FluxAleatoire(graine)
+    
+    for i in indices:
+        # Flux aléatoire propre à la partie : même résultat quel que soit le processus
+        rng = maitre.engendrer(i)
+        strat = rng.choice(strategies)
+        jeu = MonopolyIA(noms, strategie=strat, journal=journal, rng=rng, regles=regles)
+        gagnant = jeu.jouer_partie(max_tours=max_tours, arret=arret)
+        parties[strat.nom] += 1
         if gagnant:
-            print(f"\nGAGNANT: {gagnant.nom} avec {gagnant.argent}€")
-            print(f"Propriétés: {len(gagnant.proprietes)}")
+            victoires[strat.nom] += 1
+        stats.ajouter_partie(jeu)
+        jeu.liberer()
+    
+    return {"victoires": victoires, "parties": parties, "stats": stats}
+
+
+class TournoiParallele:
+    """Répartit les parties d'un tournoi entre plusieurs processus et fusionne les résultats"""
+    def __init__(self, strategies: List[StrategieIA], nb_joueurs: int, nb_processus: Optional[int] = None,
+                 graine: Optional[int] = None, max_tours: int = 200, taille_lot: int = 25,
+                 arret: Optional[ArretAnticipe] = None, regles: Optional[Regles] = None):
+        self.strategies = strategies
+        self.nb_joueurs = nb_joueurs
+        self.nb_processus = nb_processus if nb_processus else os.cpu_count()
+        # Sans graine, graine maître tirée au hasard (gardée pour rejouer le tournoi)
+        self.graine = graine if graine is not None else FluxAleatoire().graine
+        self.max_tours = max_tours
+        self.taille_lot = taille_lot
+        self.arret = arret
+        self.regles = regles
+
+    def executer(self, nb_parties: int) -> Dict[str, object]:
+        """Joue nb_parties parties ; chaque partie choisit sa stratégie au hasard"""
+        lots = [range(debut, min(debut + self.taille_lot, nb_parties))
+                for debut in range(0, nb_parties, self.taille_lot)]
+        args = (self.strategies, self.nb_joueurs, self.max_tours, self.graine, self.arret, self.regles)
+        
+        if self.nb_processus <= 1:
+            resultats = [_jouer_lot(*args, lot) for lot in lots]
         else:
-            print(f"\nLimite de {self.tour_numero} tours atteinte")
-            # Classement par argent
-            joueurs_tries = sorted(self.joueurs, key=lambda x: x.argent, reverse=True)
-            print("\nClassement:")
-            for i, j in enumerate(joueurs_tries, 1):
-                statut = "(FAILLITE)" if j.est_en_faillite else ""
-                print(f"  {i}. {j.nom}: {j.argent}€ {statut}")
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=self.nb_processus) as pool:
+                resultats = list(pool.map(_jouer_lot, *zip(*[args + (lot,) for lot in lots])))
+        
+        # Fusion dans l'ordre des lots (indépendant du nombre de processus)
+        total = {"victoires": {s.nom: 0 for s in self.strategies},
+                 "parties": {s.nom: 0 for s in self.strategies},
+                 "stats": AgregatStatistiques()}
+        for r in resultats:
+            for nom in total["victoires"]:
+                total["victoires"][nom] += r["victoires"][nom]
+                total["parties"][nom] += r["parties"][nom]
+            total["stats"].fusionner(r["stats"])
+        total["total_tours"] = total["stats"].nb_tours
+        return total
+
+
+# =============================================================================
+# CHAMPIONNAT (AFFRONTEMENTS DIRECTS ENTRE STRATÉGIES)
+# =============================================================================
+
+def intervalle_wilson(succes: float, n: int, z: float = 1.96) -> Tuple[float, float]:
+    """Intervalle de confiance de Wilson d'une proportion (95 % par défaut)"""
+    if n == 0:
+        return 0.0, 1.0
+    p = succes / n
+    denominateur = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denominateur
+    marge = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominateur
+    return max(0.0, centre - marge), min(1.0, centre + marge)
+
+
+def rangs_partie(jeu: 'Monopoly') -> List[int]:
+    """Rang de chaque joueur en fin de partie (0 = premier, ex æquo au même rang)
+
+    Les joueurs en activité sont classés par patrimoine, devant les joueurs en faillite.
+    """
+    scores = [(not j.est_en_faillite, j.patrimoine()) for j in jeu.joueurs]
+    return [sum(1 for autre in scores if autre > score) for score in scores]
+
+
+def _jouer_rencontres(strategies: List[StrategieIA], tables: List[Tuple[int, ...]], max_tours: int,
+                      graine: int, arret: Optional[ArretAnticipe], regles: Optional[Regles], indices: range,
+                      journal: Optional[Journal] = None,
+                      ecrivain: Optional['EcrivainResultats'] = None) -> List[Tuple[int, ...]]:
+    """Joue les parties `indices` d'un championnat ; rangs des sièges de chaque partie"""
+    journal = journal if journal else JournalSilencieux()
+    maitre = FluxAleatoire(graine)
+    resultats = []
+    for i in indices:
+        table = tables[i % len(tables)]
+        noms = [f"J{siege + 1} {strategies[k].nom}" for siege, k in enumerate(table)]
+        jeu = MonopolyIA(noms, journal=journal, rng=maitre.engendrer(i),
+                         strategies=[strategies[k] for k in table], regles=regles)
+        jeu.jouer_partie(max_tours=max_tours, arret=arret)
+        if ecrivain:
+            ecrivain.ajouter(jeu)
+        resultats.append(tuple(rangs_partie(jeu)))
+        jeu.liberer()
+    return resultats
+
+
+class Championnat:
+    """Affrontements directs entre stratégies, chaque joueur ayant la sienne
+
+    Chaque combinaison de stratégies est jouée dans toutes les rotations des
+    sièges (l'avantage de jouer en premier s'annule). Avec moins de stratégies que
+    de joueurs, chaque table les réunit toutes et chaque façon de compléter les
+    sièges avec des exemplaires en plus est jouée : aucune stratégie n'est
+    favorisée. Les parties sont distribuées comme dans TournoiParallele : le
+    résultat ne dépend pas du nombre de processus.
+    """
+    ELO_INITIAL = 1500.0
+
+    def __init__(self, strategies: List[StrategieIA], nb_joueurs: int = 2, nb_processus: Optional[int] = None,
+                 graine: Optional[int] = None, max_tours: int = 200, taille_lot: int = 25, k_elo: float = 16.0,
+                 arret: Optional[ArretAnticipe] = None, regles: Optional[Regles] = None):
+        from itertools import combinations, combinations_with_replacement
+        self.strategies = strategies
+        self.nb_joueurs = nb_joueurs
+        self.nb_processus = nb_processus if nb_processus else os.cpu_count()
+        # Sans graine, graine maître tirée au hasard (gardée pour rejouer le championnat)
+        self.graine = graine if graine is not None else FluxAleatoire().graine
+        self.max_tours = max_tours
+        self.taille_lot = taille_lot
+        self.k_elo = k_elo
+        self.arret = arret
+        self.regles = regles
+        # Noms uniques (deux instances d'une même stratégie restent distinctes)
+        noms = [s.nom for s in strategies]
+        self.noms = [nom if noms.count(nom) == 1 else f"{nom} #{i + 1}" for i, nom in enumerate(noms)]
+        m = len(strategies)
+        if m >= nb_joueurs:
+            rencontres = list(combinations(range(m), nb_joueurs))
+        else:
+            rencontres = [r for r in combinations_with_replacement(range(m), nb_joueurs) if len(set(r)) == m]
+        self.tables = [rencontre[r:] + rencontre[:r] for rencontre in rencontres for r in range(nb_joueurs)]
+
+    def executer(self, nb_parties: int, journal: Optional[Journal] = None,
+                 ecrivain: Optional['EcrivainResultats'] = None, precision: Optional[float] = None) -> Dict[str, object]:
+        """Joue nb_parties parties (de préférence un multiple de len(self.tables))
+
+        Avec `precision`, le championnat s'arrête dès que chaque intervalle de confiance
+        du taux de victoire a une demi-largeur inférieure à `precision` ; le contrôle
+        a lieu tous les len(self.tables) * taille_lot parties et nb_parties reste le
+        maximum. Un journal ou un écrivain de résultats impose de jouer dans ce processus.
+        """
+        pas = len(self.tables) * self.taille_lot if precision is not None else max(nb_parties, 1)
+        args = (self.strategies, self.tables, self.max_tours, self.graine, self.arret, self.regles)
+        pool = None
+        if self.nb_processus > 1 and not (journal or ecrivain):
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(max_workers=self.nb_processus)
+        
+        rangs = []
+        try:
+            for debut_bloc in range(0, nb_parties, pas):
+                fin_bloc = min(debut_bloc + pas, nb_parties)
+                lots = [range(debut, min(debut + self.taille_lot, fin_bloc))
+                        for debut in range(debut_bloc, fin_bloc, self.taille_lot)]
+                if pool is None:
+                    rangs += [r for lot in lots for r in _jouer_rencontres(*args, lot, journal, ecrivain)]
+                else:
+                    rangs += [r for resultat in pool.map(_jouer_rencontres, *zip(*[args + (lot,) for lot in lots]))
+                              for r in resultat]
+                if precision is not None and self._demi_largeur(rangs) <= precision:
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        if ecrivain:
+            ecrivain.vider()
+        return self._classer(rangs)
+
+    def _demi_largeur(self, rangs: List[Tuple[int, ...]]) -> float:
+        """Plus grande demi-largeur des intervalles de confiance des taux de victoire"""
+        intervalles = [ligne["intervalle"] for ligne in self._classer(rangs)["classement"]]
+        return max((haut - bas) / 2 for bas, haut in intervalles)
+
+    def _classer(self, rangs: List[Tuple[int, ...]]) -> Dict[str, object]:
+        """Elo (mis à jour partie après partie, dans l'ordre), victoires et duels"""
+        m = len(self.strategies)
+        elo = [self.ELO_INITIAL] * m
+        parties, victoires = [0] * m, [0] * m
+        # Duels : points (1 gagné, 0,5 égalité) et nombre de confrontations, par paire (a, b)
+        points = [[0.0] * m for _ in range(m)]
+        duels = [[0] * m for _ in range(m)]
+        k = self.k_elo / (self.nb_joueurs - 1)
+
+        for i, rang in enumerate(rangs):
+            table = self.tables[i % len(self.tables)]
+            ecarts = [0.0] * m
+            for siege, a in enumerate(table):
+                parties[a] += 1
+                if rang[siege] == 0 and rang.count(0) == 1:
+                    victoires[a] += 1
+                for autre, b in enumerate(table):
+                    if a == b:
+                        continue
+                    score = 1.0 if rang[siege] < rang[autre] else 0.5 if rang[siege] == rang[autre] else 0.0
+                    points[a][b] += score
+                    duels[a][b] += 1
+                    attendu = 1 / (1 + 10 ** ((elo[b] - elo[a]) / 400))
+                    ecarts[a] += k * (score - attendu)
+            elo = [e + d for e, d in zip(elo, ecarts)]
+
+        classement = []
+        for a in sorted(range(m), key=lambda a: -elo[a]):
+            classement.append({
+                "nom": self.noms[a], "elo": elo[a], "parties": parties[a], "victoires": victoires[a],
+                "taux_victoire": victoires[a] / parties[a] if parties[a] else 0.0,
+                "intervalle": intervalle_wilson(victoires[a], parties[a]),
+            })
+        return {
+            "classement": classement,
+            "elo": dict(zip(self.noms, elo)),
+            "victoires": dict(zip(self.noms, victoires)),
+            "parties": dict(zip(self.noms, parties)),
+            "duels": {(self.noms[a], self.noms[b]): (points[a][b], duels[a][b])
+                      for a in range(m) for b in range(m) if duels[a][b]},
+            "nb_parties": len(rangs),
+        }
+
+    @staticmethod
+    def afficher(resultats: Dict[str, object]):
+        """Classement Elo avec l'intervalle de confiance à 95 % du taux de victoire"""
+        print(f"\nClassement ({resultats['nb_parties']} parties):")
+        for ligne in resultats["classement"]:
+            bas, haut = ligne["intervalle"]
+            print(f"  {ligne['nom']:<15} Elo {ligne['elo']:6.0f}  victoires {ligne['victoires']:>5}/"
+                  f"{ligne['parties']:<5} ({ligne['taux_victoire'] * 100:.1f}% [{bas * 100:.1f}-{haut * 100:.1f}])")
+
+
+# =============================================================================
+# PERSISTANCE DES RÉSULTATS
+# =============================================================================
+
+# Script des tables de résultats (parties, joueurs, passages, revenus)
+SCRIPT_RESULTATS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "monopoly", "resultats.sql")
+
+
+class PoolConnexions:
+    """Connexions ouvertes à la demande (au plus `taille`) et réutilisées entre les écritures"""
+    def __init__(self, fabrique, taille: int = 4):
+        import queue
+        import threading
+        self.fabrique = fabrique
+        self.taille = taille
+        self._libres = queue.LifoQueue()
+        self._verrou = threading.Lock()
+        self._ouvertes = 0
+
+    def obtenir(self):
+        """Connexion libre, nouvelle si le pool n'est pas plein, sinon attente"""
+        import queue
+        try:
+            return self._libres.get_nowait()
+        except queue.Empty:
+            pass
+        with self._verrou:
+            if self._ouvertes < self.taille:
+                self._ouvertes += 1
+                creer = True
+            else:
+                creer = False
+        if not creer:
+            return self._libres.get()
+        try:
+            return self.fabrique()
+        except Exception:
+            with self._verrou:
+                self._ouvertes -= 1
+            raise
+
+    def rendre(self, connexion):
+        self._libres.put(connexion)
+
+    def fermer(self):
+        """Ferme les connexions libres"""
+        import queue
+        while True:
+            try:
+                self._libres.get_nowait().close()
+            except queue.Empty:
+                break
+            with self._verrou:
+                self._ouvertes -= 1
+
+
+class EcrivainResultats:
+    """Enregistre les parties terminées par lots (executemany, une transaction par lot)
+    
+    Chaque lot réserve dans sa transaction une plage d'identifiants (table sequences) :
+    pas d'aller-retour par partie pour récupérer la clé, et plusieurs écrivains
+    peuvent remplir la même base sans collision.
+    """
+    TABLES = {
+        "parties": ("id", "strategie", "nb_joueurs", "nb_tours", "gagnant"),
+        "joueurs_parties": ("partie_id", "ordre", "nom", "argent", "nb_proprietes", "en_faillite"),
+        "passages_cases": ("partie_id", "position", "nb_passages"),
+        "revenus_proprietes": ("partie_id", "position", "montant"),
+    }
+
+    def __init__(self, pool: PoolConnexions, marqueur: str = "?", taille_lot: int = 1000):
+        self.pool = pool
+        self.taille_lot = taille_lot
+        self.requetes = {table: f"INSERT INTO {table} ({', '.join(colonnes)}) "
+                                f"VALUES ({', '.join([marqueur] * len(colonnes))})"
+                         for table, colonnes in self.TABLES.items()}
+        self.reserver = (f"UPDATE sequences SET valeur = valeur + {marqueur} WHERE nom = 'parties'",
+                         "SELECT valeur FROM sequences WHERE nom = 'parties'")
+        # Lignes en attente ; la première colonne est le rang de la partie dans le lot
+        self.lignes: Dict[str, list] = {table: [] for table in self.TABLES}
+        self.nb_ecrites = 0
+        connexion = pool.obtenir()
+        try:
+            self.creer_tables(connexion)
+            self._initialiser_sequence(connexion)
+        finally:
+            pool.rendre(connexion)
+
+    @classmethod
+    def sqlite(cls, chemin: str, taille_lot: int = 1000) -> 'EcrivainResultats':
+        """Résultats dans un fichier SQLite"""
+        import sqlite3
+        return cls(PoolConnexions(lambda: sqlite3.connect(chemin, check_same_thread=False), 1),
+                   "?", taille_lot)
+
+    @classmethod
+    def mysql(cls, taille_pool: int = 4, taille_lot: int = 1000) -> 'EcrivainResultats':
+        """Résultats dans la base MySQL du jeu (DB.connexionBase)"""
+        return cls(PoolConnexions(DB.connexionBase, taille_pool), "%s", taille_lot)
+
+    @staticmethod
+    def creer_tables(connexion):
+        """Exécute resultats.sql instruction par instruction (commun à MySQL et SQLite)"""
+        with open(SCRIPT_RESULTATS, encoding="utf-8") as f:
+            lignes = [l for l in f if not l.lstrip().startswith("--")]
+        curseur = connexion.cursor()
+        for instruction in "".join(lignes).split(";"):
+            if instruction.strip():
+                curseur.execute(instruction)
+        curseur.close()
+        connexion.commit()
+
+    @staticmethod
+    def _initialiser_sequence(connexion):
+        """Crée la séquence des parties à la suite du plus grand id existant"""
+        curseur = connexion.cursor()
+        try:
+            curseur.execute("INSERT INTO sequences (nom, valeur) SELECT 'parties', COALESCE(MAX(id), 0) FROM parties "
+                            "WHERE NOT EXISTS (SELECT 1 FROM sequences WHERE nom = 'parties')")
+            connexion.commit()
+        except Exception:
+            # Un autre écrivain l'a créée en même temps
+            connexion.rollback()
+            curseur.execute("SELECT COUNT(*) FROM sequences WHERE nom = 'parties'")
+            if not curseur.fetchone()[0]:
+                raise
+        finally:
+            curseur.close()
+
+    def ajouter(self, jeu: 'MonopolyIA'):
+        """Met en attente les résultats d'une partie terminée"""
+        partie_id = len(self.lignes["parties"])
+        gagnant = jeu.stats.gagnant
+        self.lignes["parties"].append((partie_id, jeu.nom_strategies, len(jeu.joueurs), jeu.stats.nb_tours,
+                                       gagnant.nom if gagnant else None))
+        self.lignes["joueurs_parties"].extend(
+            (partie_id, ordre, j.nom, j.argent, len(j.proprietes), int(j.est_en_faillite))
+            for ordre, j in enumerate(jeu.joueurs))
+        self.lignes["passages_cases"].extend(
+            (partie_id, position, nb) for position, nb in enumerate(jeu.stats.passages_par_case) if nb)
+        self.lignes["revenus_proprietes"].extend(
+            (partie_id, position, montant) for position, montant in enumerate(jeu.stats.revenus_par_case) if montant)
+        if len(self.lignes["parties"]) >= self.taille_lot:
+            self.vider()
+
+    def vider(self):
+        """Écrit les lignes en attente dans une seule transaction"""
+        if not self.lignes["parties"]:
+            return
+        nb_parties = len(self.lignes["parties"])
+        connexion = self.pool.obtenir()
+        try:
+            curseur = connexion.cursor()
+            # L'UPDATE verrouille la séquence jusqu'au commit : plage réservée à ce lot
+            curseur.execute(self.reserver[0], (nb_parties,))
+            curseur.execute(self.reserver[1])
+            premier_id = curseur.fetchone()[0] - nb_parties + 1
+            for table, lignes in self.lignes.items():
+                if lignes:
+                    curseur.executemany(self.requetes[table],
+                                        [(premier_id + ligne[0],) + ligne[1:] for ligne in lignes])
+            curseur.close()
+            connexion.commit()
+        except Exception:
+            connexion.rollback()
+            raise
+        finally:
+            self.pool.rendre(connexion)
+        self.nb_ecrites += nb_parties
+        self.lignes = {table: [] for table in self.TABLES}
+
+    def fermer(self):
+        self.vider()
+        self.pool.fermer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+# =============================================================================
+# BANC D'ESSAI (PERFORMANCES DU MOTEUR)
+# =============================================================================
+
+class BancEssai:
+    """Mesure les chemins critiques du moteur et les compare à une référence JSON
+    
+    Les mesures nommées *_par_s sont meilleures quand elles augmentent, toutes
+    les autres (durées, octets) quand elles diminuent. Chaque durée est la
+    meilleure de `repetitions` essais.
+    """
+    VERSION = 1
+
+    def __init__(self, nb_tours: int = 20000, nb_parties: int = 20, repetitions: int = 5,
+                 nb_joueurs: Tuple[int, ...] = (2, 4), avec_bdd: bool = False, graine: int = 0):
+        self.nb_tours = nb_tours
+        self.nb_parties = nb_parties
+        self.repetitions = repetitions
+        self.nb_joueurs = nb_joueurs
+        self.avec_bdd = avec_bdd
+        self.graine = graine
+        self.journal = JournalSilencieux()
+
+    def executer(self) -> Dict[str, float]:
+        """Lance toutes les mesures"""
+        mesures: Dict[str, float] = {}
+        flux = FluxAleatoire(self.graine)
+        
+        # Tours joués par seconde (jouer_tour seul, création des parties exclue)
+        mesures["tours_par_s.Monopoly"] = self._tours_par_seconde(
+            lambda i: Monopoly(["A", "B", "C"], self.journal, flux.engendrer(i)))
+        mesures["tours_par_s.MonopolyIA"] = self._tours_par_seconde(
+            lambda i: MonopolyIA(["A", "B", "C"], IAStrategique(), self.journal, flux.engendrer(i)))
+        
+        # Parties complètes par seconde, par stratégie et nombre de joueurs
+        for strategie in (StrategieIA("Défaut"), IAAgressive(), IAConservative(), IAStrategique()):
+            for n in self.nb_joueurs:
+                mesures[f"parties_par_s.{strategie.nom}.{n}j"] = self._parties_par_seconde(strategie, n)
+        
+        # Coût d'un calcul de loyer
+        for nom, case in self._cases_louees().items():
+            mesures[f"loyer_ns.{nom}"] = self._meilleure_duree(case.calculer_loyer, 20000) * 1e9
+        
+        # Construction du plateau : définition neuve, plateau d'une partie, chargement BDD
+        mesures["plateau_us.definition"] = self._meilleure_duree(lambda: DefinitionPlateau([]), 20) * 1e6
+        mesures["plateau_us.partie"] = self._meilleure_duree(lambda: Plateau(self.journal), 200) * 1e6
+        mesures["plateau_us.sqlite"] = self._meilleure_duree(
+            lambda: SourceSQLite().charger(self.journal), 20) * 1e6
+        if self.avec_bdd:
+            def charger_bdd():
+                DB.vider_cache()
+                DefinitionPlateau(DB.get_proprietes(self.journal))
+            mesures["plateau_us.bdd"] = self._meilleure_duree(charger_bdd, 1) * 1e6
+        
+        # Instantané et restauration d'une partie en cours
+        jeu = MonopolyIA(["A", "B", "C"], IAStrategique(), self.journal, flux.engendrer(0))
+        jeu.jouer_partie(max_tours=60)
+        donnees = jeu.instantane()
+        mesures["instantane_us.creer"] = self._meilleure_duree(jeu.instantane, 2000) * 1e6
+        mesures["instantane_us.restaurer"] = self._meilleure_duree(lambda: jeu.restaurer(donnees), 2000) * 1e6
+        
+        mesures["memoire_octets.partie"] = self._memoire_par_partie()
+        mesures["import_ms.monopoly"] = self._duree_import() * 1e3
+        return mesures
+
+    def _meilleure_duree(self, fonction, nb_appels: int) -> float:
+        """Durée d'un appel (secondes), meilleur de `repetitions` essais"""
+        meilleure = float("inf")
+        for _ in range(self.repetitions):
+            debut = time.perf_counter()
+            for _ in range(nb_appels):
+                fonction()
+            meilleure = min(meilleure, time.perf_counter() - debut)
+        return meilleure / nb_appels
+
+    def _tours_par_seconde(self, fabrique) -> float:
+        """Mêmes parties à chaque essai (flux engendrés), meilleur débit retenu"""
+        meilleur = 0.0
+        for _ in range(self.repetitions):
+            tours, duree, i = 0, 0.0, 0
+            while tours < self.nb_tours:
+                jeu = fabrique(i)
+                i += 1
+                debut = time.perf_counter()
+                while tours < self.nb_tours and not jeu.partie_terminee() and jeu.tour_numero < 200:
+                    jeu.tour_numero += 1
+                    for j in jeu.joueurs:
+                        if not j.est_en_faillite:
+                            jeu.jouer_tour(j)
+                            tours += 1
+                duree += time.perf_counter() - debut
+            meilleur = max(meilleur, tours / duree)
+        return meilleur
+
+    def _parties_par_seconde(self, strategie: StrategieIA, nb_joueurs: int) -> float:
+        flux = FluxAleatoire(self.graine)
+        noms = [f"J{j+1}" for j in range(nb_joueurs)]
+        
+        def jouer_parties():
+            for i in range(self.nb_parties):
+                MonopolyIA(noms, strategie, self.journal, flux.engendrer(i)).jouer_partie(max_tours=200)
+        return 1 / self._meilleure_duree(jouer_parties, 1) * self.nb_parties
+
+    def _cases_louees(self) -> Dict[str, Case]:
+        """Terrain avec 3 maisons, gare (2 possédées) et compagnie"""
+        jeu = Monopoly(["A", "B"], self.journal)
+        joueur = jeu.joueurs[0]
+        for pos in (37, 39, 5, 15, 12):
+            jeu.plateau.get_case(pos).proprietaire = joueur
+        jeu.plateau.get_case(39).nb_maisons = 3
+        compagnie = jeu.plateau.get_case(12)
+        compagnie.dernier_lancer = 7
+        return {"propriete": jeu.plateau.get_case(39), "gare": jeu.plateau.get_case(5), "compagnie": compagnie}
+
+    def _duree_import(self) -> float:
+        """Import du module dans un interpréteur neuf, démarrage de Python déduit"""
+        import subprocess
+        dossier = os.path.dirname(os.path.abspath(__file__))
+        
+        def lancer(code):
+            subprocess.run([sys.executable, "-c", code], cwd=dossier, check=True)
+        return self._meilleure_duree(lambda: lancer("import monopoly"), 1) - self._meilleure_duree(lambda: lancer("pass"), 1)
+
+    def _memoire_par_partie(self, nb: int = 50) -> float:
+        """Octets alloués par une partie neuve (plateau, joueurs, paquets de cartes)"""
+        import tracemalloc
+        DefinitionPlateau.standard(self.journal)
+        tracemalloc.start()
+        avant = tracemalloc.get_traced_memory()[0]
+        parties = [MonopolyIA(["A", "B", "C"], IAStrategique(), self.journal, FluxAleatoire(i))
+                   for i in range(nb)]
+        apres = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del parties
+        return (apres - avant) / nb
+
+    def enregistrer(self, mesures: Dict[str, float], fichier: str):
+        """Sauvegarde des mesures comme référence"""
+        import json
+        with open(fichier, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "python": sys.version.split()[0],
+                       "mesures": mesures}, f, indent=2, sort_keys=True)
+
+    @staticmethod
+    def charger(fichier: str) -> Dict[str, float]:
+        import json
+        with open(fichier, encoding="utf-8") as f:
+            return json.load(f)["mesures"]
+
+    @staticmethod
+    def comparer(mesures: Dict[str, float], reference: Dict[str, float],
+                 tolerance: float = 0.10) -> List[Tuple[str, float, float, float, bool]]:
+        """(nom, référence, mesure, écart relatif, régression) pour les mesures communes
+        
+        L'écart est positif quand la mesure s'améliore.
+        """
+        lignes = []
+        for nom in sorted(mesures):
+            if nom not in reference or not reference[nom]:
+                continue
+            ecart = (mesures[nom] - reference[nom]) / reference[nom]
+            if not nom.split(".")[0].endswith("_par_s"):
+                ecart = -ecart
+            lignes.append((nom, reference[nom], mesures[nom], ecart, ecart < -tolerance))
+        return lignes
+
+    @staticmethod
+    def afficher_rapport(mesures: Dict[str, float], comparaison=None):
+        print(f"\n{'=' * 72}")
+        print("BANC D'ESSAI")
+        print(f"{'=' * 72}")
+        if comparaison is None:
+            for nom in sorted(mesures):
+                print(f"  {nom:<36} {mesures[nom]:>14.1f}")
+            return
+        for nom, reference, valeur, ecart, regression in comparaison:
+            alerte = "  ✗ RÉGRESSION" if regression else ""
+            print(f"  {nom:<36} {reference:>12.1f} -> {valeur:>12.1f}  {ecart * 100:+6.1f}%{alerte}")
+
+
+def lancer_banc_essai(fichier: str = "banc_reference.json", enregistrer: bool = False,
+                      tolerance: float = 0.15, banc: Optional[BancEssai] = None) -> bool:
+    """Mesure le moteur et compare à la référence ; False en cas de régression
+    
+    Sans référence (ou avec enregistrer=True), les mesures deviennent la référence.
+    """
+    banc = banc if banc else BancEssai()
+    mesures = banc.executer()
+    if enregistrer or not os.path.exists(fichier):
+        BancEssai.afficher_rapport(mesures)
+        banc.enregistrer(mesures, fichier)
+        print(f"\nRéférence enregistrée dans {fichier}")
+        return True
+    
+    comparaison = BancEssai.comparer(mesures, BancEssai.charger(fichier), tolerance)
+    BancEssai.afficher_rapport(mesures, comparaison)
+    regressions = [ligne[0] for ligne in comparaison if ligne[4]]
+    if regressions:
+        print(f"\n✗ {len(regressions)} régression(s) au-delà de {tolerance * 100:.0f}%")
+    return not regressions
+
+
+# =============================================================================
+# PROFILAGE DU MOTEUR (TEMPS PAR PHASE)
+# =============================================================================
+
+class Profileur:
+    """Nombre d'appels et temps passé par phase du moteur, le temps d'un bloc with
+    
+    Les méthodes des phases sont remplacées au niveau des classes à l'entrée du bloc
+    et remises à la sortie : hors profilage, le moteur n'exécute aucun code en plus.
+    Les parties créées dans le bloc sont mesurées (leurs plateaux retiennent les
+    actions des cases à la création) ; à la sortie, leurs tables d'actions sont
+    reconstruites sans les enveloppes. Le temps propre d'une phase exclut ses sous-phases ; les piles (phase appelante;phase) sont
+    exportées au format « collapsed » des flame graphs (flamegraph.pl, speedscope).
+    """
+    # (phase, classe, méthode)
+    CIBLES = (
+        ("partie", "Monopoly", "jouer_partie"), ("partie", "MonopolyIA", "jouer_partie"),
+        ("tour", "Monopoly", "jouer_tour"), ("tour", "MonopolyIA", "jouer_tour"),
+        ("prison", "Monopoly", "_gerer_prison"),
+        ("des", "Monopoly", "lancer_des"),
+        ("deplacement", "Joueur", "deplacer"),
+        ("case", "MonopolyIA", "_arrivee_propriete"), ("case", "Propriete", "action"),
+        ("case", "Compagnie", "action"), ("case", "CaseSpeciale", "action"),
+        ("construction", "Propriete", "construire_maison"),
+        ("cartes", "PaquetCartes", "piocher_et_executer"),
+        ("stats", "StatistiquesPartie", "enregistrer_passage"), ("stats", "StatistiquesPartie", "enregistrer_loyer"),
+    )
+    METHODES_STRATEGIES = ("decider_achat", "decider_construction")
+    # Parties créées pendant qu'un profileur est actif (None hors profilage)
+    _parties: Optional[weakref.WeakSet] = None
+
+    def __init__(self):
+        # phase -> [appels, temps total (ns), temps propre (ns)]
+        self.phases: Dict[str, List[int]] = {}
+        # "partie;tour;case" -> temps propre (ns)
+        self.piles: Dict[str, int] = {}
+        self._pile: List[list] = []
+        self._originaux: List[tuple] = []
+
+    def _cibles(self):
+        espace = globals()
+        for phase, nom_classe, methode in self.CIBLES:
+            yield phase, espace[nom_classe], methode
+        # Toutes les stratégies connues, y compris celles définies hors du module
+        a_voir = [StrategieIA]
+        while a_voir:
+            classe = a_voir.pop()
+            a_voir.extend(classe.__subclasses__())
+            for methode in self.METHODES_STRATEGIES:
+                if methode in classe.__dict__:
+                    yield "strategie", classe, methode
+
+    def activer(self):
+        if self._originaux:
+            return
+        for phase, classe, methode in self._cibles():
+            fonction = classe.__dict__[methode]
+            self._originaux.append((classe, methode, fonction))
+            setattr(classe, methode, self._envelopper(phase, fonction))
+        if Profileur._parties is None:
+            Profileur._parties = weakref.WeakSet()
+
+    def desactiver(self):
+        if not self._originaux:
+            return
+        for classe, methode, fonction in reversed(self._originaux):
+            setattr(classe, methode, fonction)
+        self._originaux = []
+        # Les actions liées pendant le bloc pointent encore vers les enveloppes
+        parties, Profileur._parties = Profileur._parties, None
+        for jeu in parties or ():
+            if jeu.plateau.cases:
+                jeu._installer_actions()
+
+    def __enter__(self) -> 'Profileur':
+        self.activer()
+        return self
+
+    def __exit__(self, *exc):
+        self.desactiver()
+
+    def _envelopper(self, phase: str, fonction):
+        pile = self._pile
+        phases, piles = self.phases, self.piles
+        horloge = time.perf_counter_ns
+
+        def enveloppe(*args, **kwargs):
+            # Appel de la même phase imbriqué (super().action...) : compté une seule fois
+            if pile and pile[-1][0] == phase:
+                return fonction(*args, **kwargs)
+            chemin = pile[-1][2] + ";" + phase if pile else phase
+            cadre = [phase, 0, chemin]
+            pile.append(cadre)
+            debut = horloge()
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                duree = horloge() - debut
+                pile.pop()
+                propre = duree - cadre[1]
+                compteurs = phases.get(phase)
+                if compteurs is None:
+                    compteurs = phases[phase] = [0, 0, 0]
+                compteurs[0] += 1
+                compteurs[1] += duree
+                compteurs[2] += propre
+                piles[chemin] = piles.get(chemin, 0) + propre
+                if pile:
+                    pile[-1][1] += duree
+
+        enveloppe.__name__ = fonction.__name__
+        enveloppe.__doc__ = fonction.__doc__
+        return enveloppe
+
+    def resume(self) -> Dict[str, Dict[str, float]]:
+        """Par phase : appels, temps total et propre (secondes), part du temps propre"""
+        total = sum(c[2] for c in self.phases.values()) or 1
+        return {phase: {"appels": appels, "total_s": duree / 1e9, "propre_s": propre / 1e9,
+                        "part": propre / total}
+                for phase, (appels, duree, propre) in sorted(self.phases.items(), key=lambda e: -e[1][2])}
+
+    def exporter_json(self, chemin: str):
+        import json
+        with open(chemin, "w", encoding="utf-8") as f:
+            json.dump({"phases": self.resume(), "piles_us": self.piles_us()}, f, indent=2, ensure_ascii=False)
+
+    def piles_us(self) -> Dict[str, int]:
+        return {chemin: propre // 1000 for chemin, propre in self.piles.items()}
+
+    def exporter_piles(self, chemin: str):
+        """Format collapsed : une ligne « partie;tour;case;strategie <µs> » par pile"""
+        with open(chemin, "w", encoding="utf-8") as f:
+            for pile, us in sorted(self.piles_us().items()):
+                if us:
+                    f.write(f"{pile} {us}\n")
+
+    def afficher(self):
+        print(f"\n{'Phase':<14}{'Appels':>10}{'Total (ms)':>13}{'Propre (ms)':>13}{'Part':>8}")
+        for phase, m in self.resume().items():
+            print(f"{phase:<14}{m['appels']:>10}{m['total_s'] * 1e3:>13.1f}{m['propre_s'] * 1e3:>13.1f}"
+                  f"{m['part'] * 100:>7.1f}%")
+
+
+def profiler_parties(nb_parties: int = 50, nb_joueurs: int = 3, strategie: Optional[StrategieIA] = None,
+                     fichier_piles: Optional[str] = None, graine: int = 0) -> Profileur:
+    """Joue des parties silencieuses sous profilage et affiche le temps par phase"""
+    strategie = strategie if strategie else IAStrategique()
+    noms = [f"J{j + 1}" for j in range(nb_joueurs)]
+    maitre = FluxAleatoire(graine)
+    journal = JournalSilencieux()
+    with Profileur() as profileur:
+        for i in range(nb_parties):
+            MonopolyIA(noms, strategie, journal, maitre.engendrer(i)).jouer_partie(max_tours=200)
+    profileur.afficher()
+    if fichier_piles:
+        profileur.exporter_piles(fichier_piles)
+        print(f"\nPiles enregistrées dans {fichier_piles}")
+    return profileur
 
 
 # =============================================================================
@@ -1248,6 +4923,14 @@ class MonopolyIA(Monopoly):
 # =============================================================================
 
 if __name__ == "__main__":
+    # Banc d'essai : python monopoly.py --banc [--enregistrer]
+    if "--banc" in sys.argv:
+        sys.exit(0 if lancer_banc_essai(enregistrer="--enregistrer" in sys.argv) else 1)
+    # Temps par phase : python monopoly.py --profil (piles dans profil.folded)
+    if "--profil" in sys.argv:
+        profiler_parties(fichier_piles="profil.folded")
+        sys.exit(0)
+    
     print("=" * 60)
     print("TESTS DE VALIDATION - MONOPOLY PYTHON")
     print("=" * 60)
@@ -1257,6 +4940,7 @@ if __name__ == "__main__":
     print("SÉANCE 1 : FONDATIONS")
     print("=" * 60)
     tester_plateau()
+    tester_plateaux_independants()
     tester_deplacement()
     tester_achat()
     tester_loyer()
@@ -1267,6 +4951,7 @@ if __name__ == "__main__":
     print("=" * 60)
     tester_cases_speciales()
     tester_construction()
+    tester_quartiers()
     tester_gares()
     tester_compagnies()
     
@@ -1276,6 +4961,7 @@ if __name__ == "__main__":
     print("=" * 60)
     tester_prison()
     tester_cartes()
+    tester_journal()
     
     # ========== TESTS SÉANCE 4 ==========
     print("\n" + "=" * 60)
@@ -1289,9 +4975,29 @@ if __name__ == "__main__":
         print(f"Stratégie: {strat.nom}")
         simuler_parties(5, 3, strat)
     
+    tester_chaine_markov()
+    tester_table_revenus()
+    tester_simulateur_vectorise()
+    tester_flux_aleatoire()
+    tester_sources_plateau()
+    tester_chargement_bdd()
+    tester_source_sqlite()
+    tester_ecrivain_resultats()
+    tester_agregat_statistiques()
+    tester_instantane()
+    tester_rejeu()
+    tester_ia_monte_carlo()
+    tester_championnat()
+    tester_arret_anticipe()
+    tester_patrimoine()
+    tester_regles()
+    tester_profileur()
+    tester_tournoi_parallele()
+    tester_banc_essai()
+    
     # Comparaison directe
     print("\n>>> COMPARAISON DIRECTE <<<")
-    comparer_strategies(15, 4)
+    comparer_strategies(24, 4)
     
     # Analyse probabiliste
     print("\n>>> ANALYSE PROBABILISTE <<<")
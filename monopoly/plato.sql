@@ -105,3 +105,12 @@ INSERT INTO proprietes (position, nom, type_propriete_id, prix_achat, loyer_base
 INSERT INTO proprietes (position, nom, type_propriete_id, prix_achat, loyer_base, couleur, prix_maison) VALUES
 (39, 'Rue de la Paix', 1, 400, 50, 'bleu_fonce', 200);
 
+
+-- ============================================
+-- Vue lue par le jeu (DB.get_proprietes, SourceSQLite)
+-- ============================================
+CREATE VIEW v_proprietes AS
+SELECT p.position, p.nom, t.code AS type_propriete_code, p.prix_achat,
+       p.loyer_base, p.couleur, p.prix_maison
+FROM proprietes p
+JOIN types_proprietes t ON t.id = p.type_propriete_id;
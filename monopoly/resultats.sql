@@ -0,0 +1,48 @@
+-- ============================================
+-- Résultats des simulations (EcrivainResultats)
+-- Compatible MySQL et SQLite, sans effet si les tables existent
+-- ============================================
+CREATE TABLE IF NOT EXISTS parties (
+    id INTEGER PRIMARY KEY,
+    strategie VARCHAR(50) NOT NULL,
+    nb_joueurs INTEGER NOT NULL,
+    nb_tours INTEGER NOT NULL,
+    -- NULL si la limite de tours est atteinte sans vainqueur
+    gagnant VARCHAR(100)
+);
+
+CREATE TABLE IF NOT EXISTS joueurs_parties (
+    partie_id INTEGER NOT NULL,
+    ordre INTEGER NOT NULL,
+    nom VARCHAR(100) NOT NULL,
+    argent INTEGER NOT NULL,
+    nb_proprietes INTEGER NOT NULL,
+    en_faillite INTEGER NOT NULL,
+    PRIMARY KEY (partie_id, ordre),
+    FOREIGN KEY (partie_id) REFERENCES parties(id)
+);
+
+-- Nombre d'arrivées sur chaque case
+CREATE TABLE IF NOT EXISTS passages_cases (
+    partie_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    nb_passages INTEGER NOT NULL,
+    PRIMARY KEY (partie_id, position),
+    FOREIGN KEY (partie_id) REFERENCES parties(id)
+);
+
+-- Loyers encaissés par propriété
+CREATE TABLE IF NOT EXISTS revenus_proprietes (
+    partie_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    montant INTEGER NOT NULL,
+    PRIMARY KEY (partie_id, position),
+    FOREIGN KEY (partie_id) REFERENCES parties(id)
+);
+
+-- Dernier identifiant de partie attribué : chaque lot réserve sa plage dans sa
+-- transaction (plusieurs écrivains peuvent travailler en même temps)
+CREATE TABLE IF NOT EXISTS sequences (
+    nom VARCHAR(50) PRIMARY KEY,
+    valeur INTEGER NOT NULL
+);